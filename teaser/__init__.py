@@ -5,15 +5,9 @@ teaser
 Tool for Energy Analysis and Simulation for Efficient Retrofit
 '''
 import sys
-import os
 
 __version__ = "0.7.7"
 
-
-new_path = os.path.join(os.path.expanduser('~'), ("TEASEROutput"))
-if not os.path.exists(new_path):
-    os.makedirs(new_path)
-
 if sys.platform.startswith('win'):
     def read_file(path, mode='r'):
         fp = open(path, mode)
@@ -4,6 +4,28 @@ import sys
 import teaser.logic.utilities as utils
 import json
 import collections
+import bisect
+import glob
+import pickle
+
+MaterialRecord = collections.namedtuple(
+    "MaterialRecord",
+    [
+        "material_id",
+        "name",
+        "density",
+        "thermal_conduc",
+        "heat_capac",
+        "solar_absorp",
+        "thickness_default",
+        "thickness_list",
+    ],
+)
+"""Immutable property record of one material of the Material binding.
+
+thickness_list is stored as a tuple, Material.apply_material_record() gives
+each material its own list.
+"""
 
 v = sys.version_info
 if v >= (2, 7):
@@ -12,12 +34,161 @@ if v >= (2, 7):
     except NameError:
         FileNotFoundError = IOError
 
+_binding_cache = {}
+
+COMPILED_SUFFIX = ".pickle"
+"""Suffix of the binary binding files written by compile_json_binding()."""
+
+
+def load_json_binding(path):
+    """Load a JSON binding file, using the process-wide binding cache.
+
+    Each file is parsed only once per process. The parsed binding is cached
+    in pickled form together with modification time and size of the file and
+    parsed again once the file changes, e.g. after save_type_element(). Each
+    call returns a new copy unpickled from the cache, thus changes of the
+    binding of one DataClass do not affect other DataClass instances.
+
+    If a compiled binary form of the file (see compile_json_binding()) exists
+    and was compiled from the current JSON file, it is loaded instead of
+    parsing the JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+
+    Returns
+    -------
+    binding : collections.OrderedDict
+        Parsed content of the JSON file
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = _file_stamp(stat)
+    try:
+        cached_stamp, data = _binding_cache[path]
+        if cached_stamp == stamp:
+            return pickle.loads(data)
+    except KeyError:
+        pass
+
+    binding = _load_compiled_binding(path, stamp)
+    if binding is None:
+        with open(path, "r+") as f:
+            binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+    _binding_cache[path] = (
+        stamp,
+        pickle.dumps(binding, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+    return binding
+
+
+def clear_binding_cache():
+    """Remove all parsed bindings from the process-wide binding cache."""
+    _binding_cache.clear()
+
+
+def compile_json_binding(path):
+    """Compile a JSON binding file into a binary file next to it.
+
+    The binding is parsed and stored with pickle as path + COMPILED_SUFFIX
+    (e.g. TypeElements_TABULA_DE.json.pickle) together with modification
+    time and size of the JSON file. load_json_binding() uses this file as
+    long as both match the JSON file exactly, so worker processes do not
+    need to parse the JSON files on start up.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+
+    Returns
+    -------
+    compiled_path : str
+        Full path to the compiled binary file
+    """
+    path = os.path.abspath(path)
+    stamp = _file_stamp(os.stat(path))
+    with open(path, "r") as f:
+        binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+
+    compiled_path = path + COMPILED_SUFFIX
+    temp_path = "{}.{}.tmp".format(compiled_path, os.getpid())
+    with open(temp_path, "wb") as f:
+        pickle.dump((stamp, binding), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, compiled_path)
+    return compiled_path
+
+
+def compile_input_data(directory=None):
+    """Compile all JSON bindings of a directory into binary files.
+
+    Parameters
+    ----------
+    directory : str
+        Directory with JSON bindings. Default is the TEASER input data
+        directory teaser/data/input/inputdata.
+
+    Returns
+    -------
+    compiled_paths : list
+        Full paths to all compiled binary files
+    """
+    if directory is None:
+        directory = utils.get_full_path(os.path.join("data", "input", "inputdata"))
+
+    return [
+        compile_json_binding(path)
+        for path in sorted(glob.glob(os.path.join(directory, "*.json")))
+    ]
+
+
+def _file_stamp(stat):
+    """Modification time and size of a file, compared to detect changes."""
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_compiled_binding(path, stamp):
+    """Load the compiled binary form of a JSON binding, if it is up to date.
+
+    The compiled file is only used if it was compiled from a JSON file with
+    exactly the given modification time and size. Any error reading it
+    (missing, truncated or foreign file) falls back to parsing the JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+    stamp : tuple
+        Modification time (ns) and size of the JSON file
+
+    Returns
+    -------
+    binding : collections.OrderedDict
+        Content of the compiled file, None if there is no usable file
+    """
+    compiled_path = path + COMPILED_SUFFIX
+    try:
+        with open(compiled_path, "rb") as f:
+            compiled_stamp, binding = pickle.load(f)
+    except Exception:
+        return None
+    if compiled_stamp != stamp:
+        return None
+    return binding
+
 
 class DataClass(object):
     """Class for JSON data.
 
     This class loads all JSON files with statistic or template data needed
-    for statistical data enrichment.
+    for statistical data enrichment. Each binding is loaded on first access
+    of element_bind, material_bind or conditions_bind. Parsed JSON files are
+    cached for the whole process (see load_json_binding()), so switching
+    between statistics or creating further DataClass instances does not
+    parse the same file again, as long as it has not been modified. Each
+    DataClass gets its own copy of the bindings.
 
     Parameters
     ----------
@@ -37,74 +208,229 @@ class DataClass(object):
     path_mat : str
         Full path to MaterialTemplates.json. Default is
         teaser/data/input/inputdata/MaterialTemplates.json.
+    material_name_index : dict
+        Maps the name of a material to its id in material_bind. If a name is
+        used more than once, the last material in material_bind is indexed.
+        The index is rebuilt when material_bind is replaced, changes its
+        length or an indexed entry no longer has the looked up name.
+    share_material_records : bool
+        If True, materials loaded from the binding get their properties
+        assigned from one shared, immutable MaterialRecord per material
+        instead of passing each value through the Material setters. This
+        speeds up the generation of many archetypes. Default is True.
     conditions_bind : collections.OrderedDict
         Ordered dictionary of the UseConditions binding.
     path_uc : str
         Full path to UseConditions.json. Default is
         teaser/data/input/inputdata/UseConditions.json
+    element_index : dict
+        Lookup index of element_bind. Keys are tuples of element class name
+        and construction type, values hold the age group boundaries of all
+        matching type elements and the keys of element_bind valid in each
+        interval between these boundaries. The index is built in
+        load_tb_binding() and kept up to date by save_type_element() and
+        delete_type_element(), use find_type_elements() to query it. It is
+        rebuilt when element_bind is assigned or its length changes. Other
+        changes of element_bind in place, e.g. of the building age group of
+        an entry, are not tracked, assign element_bind again or call
+        build_element_index() afterwards.
 
     """
 
     def __init__(self, used_statistic="iwu"):
         """Construct DataClass."""
         self.used_statistic = used_statistic
-        self.element_bind = None
+        self._element_bind = None
+        self._tb_pending = False
+        self.element_index = {}
+        self._element_groups = {}
+        self._indexed_bind = None
+        self._indexed_len = 0
         if self.used_statistic == "iwu":
             self.path_tb = utils.get_full_path(
                 "data/input/inputdata/TypeBuildingElements.json"
             )
-            self.load_tb_binding()
+            self._tb_pending = True
         elif self.used_statistic == "tabula_de":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DE.json"
                 )
             )
-            self.load_tb_binding()
+            self._tb_pending = True
         elif self.used_statistic == "tabula_dk":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DK.json"
                 )
             )
-            self.load_tb_binding()
+            self._tb_pending = True
         elif self.used_statistic is None:
             pass
-        self.material_bind = None
+        self._material_bind = None
+        self.material_name_index = {}
+        self.share_material_records = True
+        self._material_records = {}
+        self._indexed_mat_bind = None
+        self._indexed_mat_len = 0
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.json"
         )
-        self.conditions_bind = None
+        self._mat_pending = True
+        self._conditions_bind = None
         self.path_uc = utils.get_full_path("data/input/inputdata/UseConditions.json")
-
-        self.load_uc_binding()
-        self.load_mat_binding()
+        self._uc_pending = True
 
     def load_tb_binding(self):
         """Load TypeBuildingElement json into binding classes."""
+        self._tb_pending = False
         if self.path_tb.endswith("json"):
             if os.path.isfile(self.path_tb):
                 try:
-                    with open(self.path_tb, "r+") as f:
-                        self.element_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.element_bind = load_json_binding(self.path_tb)
                 except json.decoder.JSONDecodeError:
                     print("Your TypeElements file seems to be broken.")
             else:
                 with open(self.path_tb, "w") as f:
                     self.element_bind = collections.OrderedDict()
                     self.element_bind["version"] = "0.7"
+        self.build_element_index()
+
+    def build_element_index(self):
+        """Build the lookup index for the TypeBuildingElement binding.
+
+        Groups all type elements of element_bind by element class (prefix of
+        the key) and construction type. For each group the age group limits
+        are sorted, so that find_type_elements() can resolve a year of
+        construction with a binary search instead of scanning the whole
+        binding.
+        """
+        self.element_index = {}
+        self._element_groups = {}
+        if self.element_bind is not None:
+            for key, element_in in self.element_bind.items():
+                if key != "version":
+                    group = (key.split("_")[0], element_in["construction_type"])
+                    self._element_groups.setdefault(group, []).append(key)
+            for group in self._element_groups:
+                self._index_group(group)
+        self._indexed_bind = self.element_bind
+        self._indexed_len = (
+            len(self.element_bind) if self.element_bind is not None else 0
+        )
+
+    def index_type_element(self, key):
+        """Add one entry of element_bind to the lookup index.
+
+        Parameters
+        ----------
+        key : str
+            Key of the type element in element_bind, e.g.
+            'OuterWall_[1950, 1960]_heavy'
+        """
+        group = (key.split("_")[0], self.element_bind[key]["construction_type"])
+        keys = self._element_groups.setdefault(group, [])
+        if key not in keys:
+            keys.append(key)
+        self._index_group(group)
+        self._indexed_len = len(self.element_bind)
+
+    def unindex_type_element(self, key):
+        """Remove one entry of element_bind from the lookup index.
+
+        Parameters
+        ----------
+        key : str
+            Key of the type element in element_bind
+        """
+        for group, keys in self._element_groups.items():
+            if key in keys:
+                keys.remove(key)
+                self._index_group(group)
+                break
+        self._indexed_len = len(self.element_bind)
+
+    def find_type_elements(self, element_type, year, construction):
+        """Find all type elements matching class, year and construction.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the building element, e.g. 'OuterWall'
+        year : int
+            Year of construction
+        construction : str
+            Construction type, code list ('heavy', 'light', tabula, ...)
+
+        Returns
+        -------
+        keys : list
+            Keys of element_bind whose building age group includes year, in
+            the order of element_bind
+        """
+        if (
+            self._indexed_bind is None
+            or self._indexed_bind is not self.element_bind
+            or self._indexed_len != len(self.element_bind)
+        ):
+            self.build_element_index()
+
+        try:
+            bounds, at_bound, between = self.element_index[
+                (element_type, construction)
+            ]
+        except KeyError:
+            return []
+
+        pos = bisect.bisect_left(bounds, year)
+        if pos < len(bounds) and bounds[pos] == year:
+            return at_bound[pos]
+        elif 0 < pos < len(bounds):
+            return between[pos - 1]
+        else:
+            return []
+
+    def _index_group(self, group):
+        """Compute the interval table of one group of type elements.
+
+        The age group limits of all elements in the group split the time
+        axis into elementary intervals. For each limit and each open
+        interval between two limits the matching keys are stored, which
+        also keeps overlapping age groups consistent with a linear scan.
+
+        Parameters
+        ----------
+        group : tuple
+            (element class name, construction type)
+        """
+        keys = self._element_groups[group]
+        if not keys:
+            del self._element_groups[group]
+            self.element_index.pop(group, None)
+            return
+        age_groups = [self.element_bind[key]["building_age_group"] for key in keys]
+        bounds = sorted(set(year for age in age_groups for year in age))
+        at_bound = [
+            [key for key, age in zip(keys, age_groups) if age[0] <= year <= age[1]]
+            for year in bounds
+        ]
+        between = [
+            [
+                key
+                for key, age in zip(keys, age_groups)
+                if age[0] <= low and high <= age[1]
+            ]
+            for low, high in zip(bounds[:-1], bounds[1:])
+        ]
+        self.element_index[group] = (bounds, at_bound, between)
 
     def load_uc_binding(self):
         """Load UseConditions json into binding classes."""
+        self._uc_pending = False
         if self.path_uc.endswith("json"):
             if os.path.isfile(self.path_uc):
                 try:
-                    with open(self.path_uc, "r+") as f:
-                        self.conditions_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.conditions_bind = load_json_binding(self.path_uc)
                 except json.decoder.JSONDecodeError:
                     raise IOError("Your UseConditions.json file seems to be broken.")
             else:
@@ -114,16 +440,156 @@ class DataClass(object):
 
     def load_mat_binding(self):
         """Load MaterialTemplates json into binding classes."""
+        self._mat_pending = False
         if self.path_mat.endswith("json"):
             if os.path.isfile(self.path_mat):
                 try:
-                    with open(self.path_mat, "r+") as f:
-                        self.material_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.material_bind = load_json_binding(self.path_mat)
                 except json.decoder.JSONDecodeError:
                     print("Your Materials file seems to be broken.")
             else:
                 with open(self.path_mat, "w") as f:
                     self.material_bind = collections.OrderedDict()
                     self.material_bind["version"] = "0.7"
+        self.build_material_index()
+
+    def build_material_index(self):
+        """Build the name index and reset the records of the Material binding.
+
+        material_bind is already keyed by material id, the name index adds
+        the lookup of materials by name without scanning the binding.
+        """
+        self.material_name_index = {}
+        self._material_records = {}
+        if self.material_bind is not None:
+            for mat_id, mat in self.material_bind.items():
+                if mat_id != "version":
+                    self.material_name_index[mat["name"]] = mat_id
+        self._indexed_mat_bind = self.material_bind
+        self._indexed_mat_len = (
+            0 if self.material_bind is None else len(self.material_bind)
+        )
+
+    def find_material_id(self, mat_name):
+        """Find the id of a material by its name.
+
+        Parameters
+        ----------
+        mat_name : str
+            Name of the material in material_bind
+
+        Returns
+        -------
+        mat_id : str
+            id of the material, None if no material has this name
+        """
+        if self._indexed_mat_bind is not self.material_bind or (
+            self.material_bind is not None
+            and self._indexed_mat_len != len(self.material_bind)
+        ):
+            self.build_material_index()
+        mat_id = self.material_name_index.get(mat_name)
+        mat = self.material_bind.get(mat_id)
+        if mat is None or mat["name"] != mat_name:
+            # unknown name or entry renamed in place, index again
+            self.build_material_index()
+            mat_id = self.material_name_index.get(mat_name)
+        return mat_id
+
+    def index_material(self, mat_id):
+        """Add or refresh one entry of material_bind in the material index.
+
+        Parameters
+        ----------
+        mat_id : str
+            id of the material in material_bind
+        """
+        self.material_name_index[self.material_bind[mat_id]["name"]] = mat_id
+        self._indexed_mat_len = len(self.material_bind)
+        self._material_records.pop(mat_id, None)
+
+    def get_material_record(self, mat_id):
+        """Return the shared property record of one material.
+
+        The record is created on first access, its values are converted the
+        same way the setters of Material convert them. If the entry of
+        material_bind was changed in place since, the record is created
+        again.
+
+        Parameters
+        ----------
+        mat_id : str
+            id of the material in material_bind
+
+        Returns
+        -------
+        record : MaterialRecord
+            Immutable record of the material properties
+        """
+        mat = self.material_bind[mat_id]
+        values = tuple(mat[field] for field in MaterialRecord._fields[1:-1])
+        values += (tuple(mat["thickness_list"]),)
+        try:
+            cached_values, record = self._material_records[mat_id]
+            if cached_values == values:
+                return record
+        except KeyError:
+            pass
+
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        material = Material()
+        material.name = mat["name"]
+        material.density = mat["density"]
+        material.thermal_conduc = mat["thermal_conduc"]
+        material.heat_capac = mat["heat_capac"]
+        material.solar_absorp = mat["solar_absorp"]
+        material.thickness_default = mat["thickness_default"]
+        material.thickness_list = mat["thickness_list"]
+
+        record = MaterialRecord(
+            material_id=mat_id,
+            name=material.name,
+            density=material.density,
+            thermal_conduc=material.thermal_conduc,
+            heat_capac=material.heat_capac,
+            solar_absorp=material.solar_absorp,
+            thickness_default=material.thickness_default,
+            thickness_list=tuple(material.thickness_list),
+        )
+        self._material_records[mat_id] = (values, record)
+        return record
+
+    @property
+    def element_bind(self):
+        if self._tb_pending:
+            self.load_tb_binding()
+        return self._element_bind
+
+    @element_bind.setter
+    def element_bind(self, value):
+        self._tb_pending = False
+        self._element_bind = value
+        self._indexed_bind = None
+
+    @property
+    def material_bind(self):
+        if self._mat_pending:
+            self.load_mat_binding()
+        return self._material_bind
+
+    @material_bind.setter
+    def material_bind(self, value):
+        self._mat_pending = False
+        self._material_bind = value
+
+    @property
+    def conditions_bind(self):
+        if self._uc_pending:
+            self.load_uc_binding()
+        return self._conditions_bind
+
+    @conditions_bind.setter
+    def conditions_bind(self, value):
+        self._uc_pending = False
+        self._conditions_bind = value
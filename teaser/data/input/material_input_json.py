@@ -23,20 +23,10 @@ def load_material(material, mat_name, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
+    mat_id = data_class.find_material_id(mat_name)
 
-    for id, mat in binding.items():
-        if id != "version":
-            if mat["name"] == mat_name:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    if mat_id is not None:
+        _set_material_data(material=material, mat_id=mat_id, data_class=data_class)
 
 
 def load_material_id(material, mat_id, data_class):
@@ -58,17 +48,39 @@ def load_material_id(material, mat_id, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if id == mat_id:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    if mat_id != "version" and mat_id in data_class.material_bind:
+        _set_material_data(material=material, mat_id=mat_id, data_class=data_class)
+
+
+def _set_material_data(material, mat_id, data_class):
+    """Set material data from the binding.
+
+    Helper function to set the properties of one entry of material_bind to
+    the Material class. If data_class.share_material_records is True, the
+    shared MaterialRecord of that entry is used.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+    mat_id : str
+        id of material from JSON
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material
+
+    """
+    if data_class.share_material_records is True:
+        material.apply_material_record(data_class.get_material_record(mat_id))
+        return
+
+    mat = data_class.material_bind[mat_id]
+
+    material.material_id = mat_id
+    material.name = mat["name"]
+    material.density = mat["density"]
+    material.thermal_conduc = mat["thermal_conduc"]
+    material.heat_capac = mat["heat_capac"]
+    material.solar_absorp = mat["solar_absorp"]
+    material.thickness_default = mat["thickness_default"]
+    material.thickness_list = mat["thickness_list"]
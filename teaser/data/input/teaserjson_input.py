@@ -209,46 +209,47 @@ def load_teaser_json(path, project):
                 "lighting_profile"
             ]
 
-            for wall_name, wall_in in zone_in["outer_walls"].items():
-                out_wall = OuterWall(parent=tz)
-                out_wall.name = wall_name
-                set_basic_data_teaser(wall_in, out_wall)
-                set_layer_data_teaser(wall_in, out_wall)
-            for door_name, door_in in zone_in["doors"].items():
-                door = Door(parent=tz)
-                door.name = door_name
-                set_basic_data_teaser(door_in, door)
-                set_layer_data_teaser(door_in, door)
-            for roof_name, roof_in in zone_in["rooftops"].items():
-                roof = Rooftop(parent=tz)
-                roof.name = roof_name
-                set_basic_data_teaser(roof_in, roof)
-                set_layer_data_teaser(roof_in, roof)
-            for gf_name, gf_in in zone_in["ground_floors"].items():
-                gf = GroundFloor(parent=tz)
-                gf.name = gf_name
-                set_basic_data_teaser(gf_in, gf)
-                set_layer_data_teaser(gf_in, gf)
-            for win_name, win_in in zone_in["windows"].items():
-                win = Window(parent=tz)
-                win.name = win_name
-                set_basic_data_teaser(win_in, win)
-                set_layer_data_teaser(win_in, win)
-            for iw_name, iw_in in zone_in["inner_walls"].items():
-                in_wall = InnerWall(parent=tz)
-                in_wall.name = iw_name
-                set_basic_data_teaser(iw_in, in_wall)
-                set_layer_data_teaser(iw_in, in_wall)
-            for fl_name, fl_in in zone_in["floors"].items():
-                floor = Floor(parent=tz)
-                floor.name = fl_name
-                set_basic_data_teaser(fl_in, floor)
-                set_layer_data_teaser(fl_in, floor)
-            for cl_name, cl_in in zone_in["ceilings"].items():
-                ceil = Ceiling(parent=tz)
-                ceil.name = cl_name
-                set_basic_data_teaser(cl_in, ceil)
-                set_layer_data_teaser(cl_in, ceil)
+            with bldg.bulk_update():
+                for wall_name, wall_in in zone_in["outer_walls"].items():
+                    out_wall = OuterWall(parent=tz)
+                    out_wall.name = wall_name
+                    set_basic_data_teaser(wall_in, out_wall)
+                    set_layer_data_teaser(wall_in, out_wall)
+                for door_name, door_in in zone_in["doors"].items():
+                    door = Door(parent=tz)
+                    door.name = door_name
+                    set_basic_data_teaser(door_in, door)
+                    set_layer_data_teaser(door_in, door)
+                for roof_name, roof_in in zone_in["rooftops"].items():
+                    roof = Rooftop(parent=tz)
+                    roof.name = roof_name
+                    set_basic_data_teaser(roof_in, roof)
+                    set_layer_data_teaser(roof_in, roof)
+                for gf_name, gf_in in zone_in["ground_floors"].items():
+                    gf = GroundFloor(parent=tz)
+                    gf.name = gf_name
+                    set_basic_data_teaser(gf_in, gf)
+                    set_layer_data_teaser(gf_in, gf)
+                for win_name, win_in in zone_in["windows"].items():
+                    win = Window(parent=tz)
+                    win.name = win_name
+                    set_basic_data_teaser(win_in, win)
+                    set_layer_data_teaser(win_in, win)
+                for iw_name, iw_in in zone_in["inner_walls"].items():
+                    in_wall = InnerWall(parent=tz)
+                    in_wall.name = iw_name
+                    set_basic_data_teaser(iw_in, in_wall)
+                    set_layer_data_teaser(iw_in, in_wall)
+                for fl_name, fl_in in zone_in["floors"].items():
+                    floor = Floor(parent=tz)
+                    floor.name = fl_name
+                    set_basic_data_teaser(fl_in, floor)
+                    set_layer_data_teaser(fl_in, floor)
+                for cl_name, cl_in in zone_in["ceilings"].items():
+                    ceil = Ceiling(parent=tz)
+                    ceil.name = cl_name
+                    set_basic_data_teaser(cl_in, ceil)
+                    set_layer_data_teaser(cl_in, ceil)
 
 
 def set_basic_data_teaser(wall_in, element):
@@ -3,12 +3,74 @@
 import os
 import warnings
 import shutil
-from mako.template import Template
 from mako.lookup import TemplateLookup
 import teaser.logic.utilities as utilities
 
+_lookup = None
+_module_directory = None
 
-def export_multizone(buildings, prj, path=None):
+
+def get_template(name):
+    """Returns a compiled template of data/output/modelicatemplate
+
+    All templates are compiled by one shared mako.TemplateLookup, thus each
+    template is compiled only once per process and reused by all exports.
+    If a module directory is set (see set_template_cache()), the compiled
+    templates are also stored as Python modules in this directory and
+    reused by later processes.
+
+    Parameters
+    ----------
+    name : str
+        Path of the template relative to the modelicatemplate folder, e.g.
+        "AixLib/AixLib_Multizone"
+
+    Returns
+    -------
+    template : mako.template.Template
+        Compiled template
+    """
+
+    global _lookup
+    if _lookup is None:
+        _lookup = TemplateLookup(
+            directories=[
+                utilities.get_full_path(
+                    os.path.join("data", "output", "modelicatemplate")
+                )
+            ],
+            module_directory=_module_directory,
+        )
+    return _lookup.get_template(name)
+
+
+def set_template_cache(module_directory):
+    """Sets the directory of the compiled templates
+
+    Parameters
+    ----------
+    module_directory : str
+        Directory of the Python modules compiled from the templates, it is
+        created if it does not exist. None keeps the compiled templates in
+        memory only (default).
+    """
+
+    global _lookup, _module_directory
+    if module_directory is not None:
+        module_directory = utilities.create_path(module_directory)
+    _module_directory = module_directory
+    _lookup = None
+
+
+def export_multizone(
+        buildings,
+        prj,
+        path=None,
+        project_package=True,
+        workers=None,
+        raise_errors=True,
+        progress=None,
+        file_format=None):
     """Exports models for AixLib library
 
     Exports a building for
@@ -38,12 +100,38 @@ def export_multizone(buildings, prj, path=None):
     path : string
         if the Files should not be stored in default output path of TEASER,
         an alternative path can be specified as a full path
+    project_package : bool
+        If False, only the packages of the buildings are exported and the
+        package of the project (package.mo, package.order and weather file)
+        is not written, e.g. when exporting buildings one by one (see
+        export_project_package()). Default is True.
+    workers : int
+        Number of worker processes rendering and writing the buildings in
+        parallel, see teaser.logic.parallel. Default is None, exporting all
+        buildings in this process.
+    raise_errors : bool
+        If True, the first error of a building export is raised. If False,
+        errors are collected, the building is left out of the project package
+        and the export continues with the next building. Default is True.
+    progress : callable
+        Called after each building with the number of finished buildings and
+        the number of all buildings, e.g. to report progress. Default is
+        None.
+    file_format : str
+        Format of the boundary condition files of all buildings, 'txt' or
+        'mat', see file_format of the library_attr of the buildings. Default
+        is None, keeping the format set for each building.
+
+    Returns
+    -------
+
+    errors : dict
+        Errors of the buildings that could not be exported (only with
+        raise_errors=False), keys are the names of the buildings
 
     Attributes
     ----------
 
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
     zone_template_1 : Template object
         Template for ThermalZoneRecord using 1 element model
     zone_template_2 : Template object
@@ -56,79 +144,146 @@ def export_multizone(buildings, prj, path=None):
         Template for MultiZone model
     """
 
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    zone_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_OneElement"),
-        lookup=lookup)
-    zone_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_TwoElement"),
-        lookup=lookup)
-    zone_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_ThreeElement"),
-        lookup=lookup)
-    zone_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_FourElement"),
-        lookup=lookup)
-    model_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib/AixLib_Multizone"),
-        lookup=lookup)
-    test_script_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/modelica_test_script"),
-        lookup=lookup)
-
     uses = [
         'Modelica(version="' + prj.modelica_info.version + '")',
         'AixLib(version="' + prj.buildings[-1].library_attr.version + '")']
-    _help_package(
-        path=path,
-        name=prj.name,
-        uses=uses,
-        within=None)
-    _help_package_order(
-        path=path,
-        package_list=buildings,
-        addition=None,
-        extra=None)
-    _copy_weather_data(prj.weather_file_path, path)
-
-    for i, bldg in enumerate(buildings):
 
+    for bldg in buildings:
         ass_error = "You chose IBPSA calculation, " \
                     "but want to export AixLib models, " \
                     "this is not possible"
 
         assert bldg.used_library_calc == 'AixLib', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path,
-                         bldg.name + "_DataBase")))
-        bldg.library_attr.modelica_set_temp(path=bldg_path)
-        bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
-        bldg.library_attr.modelica_AHU_boundary(
-            path=bldg_path)
-        bldg.library_attr.modelica_gains_boundary(
-            path=bldg_path)
-
-        _help_package(path=bldg_path, name=bldg.name, within=bldg.parent.name)
-        _help_package_order(
-            path=bldg_path,
-            package_list=[bldg],
-            addition=None,
-            extra=bldg.name + "_DataBase")
+    if file_format is not None:
+        for bldg in buildings:
+            bldg.library_attr.file_format = file_format
+
+    _set_building_ids(buildings)
+    dir_scripts = os.path.join(path, "Resources", "Scripts")
+    os.makedirs(os.path.join(dir_scripts, "Dymola"), exist_ok=True)
+
+    errors = export_buildings(
+        buildings=buildings,
+        prj=prj,
+        task=_export_building,
+        kwargs={"path": path},
+        workers=workers,
+        raise_errors=raise_errors,
+        progress=progress)
+
+    _copy_script_unit_tests(os.path.join(dir_scripts, "runUnitTests.py"))
+    _copy_reference_results(os.path.join(path, "Resources"), prj)
+    if project_package:
+        export_project_package(
+            prj=prj,
+            path=path,
+            package_list=[bldg for bldg in buildings if bldg.name not in errors],
+            uses=uses)
+
+    print("Exports can be found here:")
+    print(path)
+    return errors
+
+
+def export_buildings(
+        buildings,
+        prj,
+        task,
+        kwargs,
+        workers=None,
+        raise_errors=True,
+        progress=None):
+    """Exports the packages of many buildings, optionally in parallel
+
+    Calls task(bldg, **kwargs) for each building, either in this process or
+    in a pool of worker processes (see teaser.logic.parallel.map_buildings()).
+    The workers get the name, weather file and Modelica settings of the
+    project, the packages of the project itself are not written. The
+    workers only return errors and warnings, changes of task to the
+    buildings are not merged back.
+
+    Parameters
+    ----------
+
+    buildings : list of instances of Building
+        Buildings to export
+    prj : instance of Project
+        Project of the buildings
+    task : function
+        Module level function exporting one building, e.g. the package of
+        one building of export_multizone()
+    kwargs : dict
+        Keyword arguments of task
+    workers : int
+        Number of worker processes, None or 1 exports in this process
+    raise_errors : bool
+        If True, the first error is raised, otherwise errors are collected
+    progress : callable
+        Called after each building with the number of finished buildings and
+        the number of all buildings
+
+    Returns
+    -------
+
+    errors : dict
+        Errors of the buildings that could not be exported, keys are the
+        names of the buildings
+    """
 
+    import teaser.logic.parallel as parallel
+
+    continue_on = () if raise_errors else (Exception,)
+    if workers is not None and workers > 1:
+        kwargs = dict(
+            kwargs,
+            project_attributes={
+                "name": prj.name,
+                "weather_file_path": prj.weather_file_path,
+                "modelica_info": prj.modelica_info,
+            })
+        results = parallel.map_buildings(
+            project=prj,
+            jobs=[(list(buildings), None)],
+            task=task,
+            kwargs=kwargs,
+            workers=workers,
+            continue_on=continue_on,
+            merge=False)
+    else:
+        results = _map_sequential(buildings, task, kwargs, continue_on)
+
+    errors = {}
+    for count, (bldg, error) in enumerate(results, 1):
+        if error is not None:
+            if not isinstance(error, continue_on):
+                raise error
+            warnings.warn(
+                "Following building can't be exported and is left out of "
+                "the project package. Use raise_errors=True to get python "
+                "errors and stop the export:" + bldg.name)
+            errors[bldg.name] = error
+        if progress is not None:
+            progress(count, len(buildings))
+    return errors
+
+
+def _map_sequential(buildings, task, kwargs, continue_on):
+    """Calls task for each building in this process like map_buildings()"""
+
+    for bldg in buildings:
+        try:
+            task(bldg, **kwargs)
+        except continue_on as error:
+            yield bldg, error
+        else:
+            yield bldg, None
+
+
+def _set_building_ids(buildings):
+    """Numbers the buildings without building_id by their position"""
+
+    for i, bldg in enumerate(buildings):
         if bldg.building_id is None:
             bldg.building_id = i
         else:
@@ -140,59 +295,129 @@ def export_multizone(buildings, prj, path=None):
                                                "number of the building in "
                                                "the project list.")
                 bldg.building_id = i
-        with open(utilities.get_full_path(
-                os.path.join(bldg_path, bldg.name + ".mo")), 'w') as out_file:
 
-            out_file.write(model_template.render_unicode(
-                bldg=bldg,
-                weather=bldg.parent.weather_file_path,
-                modelica_info=bldg.parent.modelica_info))
+
+def _export_building(bldg, path, project_attributes=None):
+    """Writes the package of one building of export_multizone()
+
+    Parameters
+    ----------
+
+    bldg : instance of Building
+        Building to export
+    path : string
+        Path of the project package
+    project_attributes : dict
+        Attributes of the project set on the stand-in project of a worker
+        process, see export_buildings()
+    """
+
+    if project_attributes is not None:
+        for key, value in project_attributes.items():
+            setattr(bldg.parent, key, value)
+    prj = bldg.parent
+
+    zone_template_1 = get_template("AixLib/AixLib_ThermalZoneRecord_OneElement")
+    zone_template_2 = get_template("AixLib/AixLib_ThermalZoneRecord_TwoElement")
+    zone_template_3 = get_template("AixLib/AixLib_ThermalZoneRecord_ThreeElement")
+    zone_template_4 = get_template("AixLib/AixLib_ThermalZoneRecord_FourElement")
+    model_template = get_template("AixLib/AixLib_Multizone")
+    test_script_template = get_template("modelica_test_script")
+
+    bldg_path = os.path.join(path, bldg.name)
+    utilities.create_path(utilities.get_full_path(bldg_path))
+    utilities.create_path(utilities.get_full_path(
+        os.path.join(bldg_path,
+                     bldg.name + "_DataBase")))
+    bldg.library_attr.modelica_set_temp(path=bldg_path)
+    bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
+    bldg.library_attr.modelica_AHU_boundary(
+        path=bldg_path)
+    bldg.library_attr.modelica_gains_boundary(
+        path=bldg_path)
+
+    _help_package(path=bldg_path, name=bldg.name, within=prj.name)
+    _help_package_order(
+        path=bldg_path,
+        package_list=[bldg],
+        addition=None,
+        extra=bldg.name + "_DataBase")
+
+    with open(utilities.get_full_path(
+            os.path.join(bldg_path, bldg.name + ".mo")), 'w') as out_file:
+
+        out_file.write(model_template.render_unicode(
+            bldg=bldg,
+            weather=prj.weather_file_path,
+            modelica_info=prj.modelica_info))
+        out_file.close()
+
+    dir_dymola = os.path.join(path, "Resources", "Scripts", "Dymola")
+    _help_test_script(bldg, dir_dymola, test_script_template)
+
+    zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
+
+    for zone in bldg.thermal_zones:
+
+        with open(utilities.get_full_path(os.path.join(
+                zone_path,
+                bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
+            if type(zone.model_attr).__name__ == "OneElement":
+                out_file.write(zone_template_1.render_unicode(zone=zone))
+            elif type(zone.model_attr).__name__ == "TwoElement":
+                out_file.write(zone_template_2.render_unicode(zone=zone))
+            elif type(zone.model_attr).__name__ == "ThreeElement":
+                out_file.write(zone_template_3.render_unicode(zone=zone))
+            elif type(zone.model_attr).__name__ == "FourElement":
+                out_file.write(zone_template_4.render_unicode(zone=zone))
+
             out_file.close()
 
-        dir_resources = os.path.join(path, "Resources")
-        if not os.path.exists(dir_resources):
-            os.mkdir(dir_resources)
-        dir_scripts = os.path.join(dir_resources, "Scripts")
-        if not os.path.exists(dir_scripts):
-            os.mkdir(dir_scripts)
-        dir_dymola = os.path.join(dir_scripts, "Dymola")
-        if not os.path.exists(dir_dymola):
-            os.mkdir(dir_dymola)
-        _help_test_script(bldg, dir_dymola, test_script_template)
-
-        zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
-
-        for zone in bldg.thermal_zones:
-
-            with open(utilities.get_full_path(os.path.join(
-                    zone_path,
-                    bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
-                if type(zone.model_attr).__name__ == "OneElement":
-                    out_file.write(zone_template_1.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "TwoElement":
-                    out_file.write(zone_template_2.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "ThreeElement":
-                    out_file.write(zone_template_3.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "FourElement":
-                    out_file.write(zone_template_4.render_unicode(zone=zone))
-
-                out_file.close()
-
-        _help_package(
-            path=zone_path,
-            name=bldg.name + '_DataBase',
-            within=prj.name + '.' + bldg.name)
-        _help_package_order(
-            path=zone_path,
-            package_list=bldg.thermal_zones,
-            addition=bldg.name + "_",
-            extra=None)
+    _help_package(
+        path=zone_path,
+        name=bldg.name + '_DataBase',
+        within=prj.name + '.' + bldg.name)
+    _help_package_order(
+        path=zone_path,
+        package_list=bldg.thermal_zones,
+        addition=bldg.name + "_",
+        extra=None)
+
 
-    _copy_script_unit_tests(os.path.join(dir_scripts, "runUnitTests.py"))
-    _copy_reference_results(dir_resources, prj)
+def export_project_package(prj, path, package_list, uses):
+    """Exports the package of the project
 
-    print("Exports can be found here:")
-    print(path)
+    Writes package.mo and package.order of the project and copies the
+    weather file. Each entry of package_list is exported as a sub package
+    of the project, see export_multizone().
+
+    Parameters
+    ----------
+
+    prj : instance of Project
+        Instance of TEASER Project object to access Project related
+        information, e.g. name or weather file
+    path : string
+        path of the project package
+    package_list : list
+        buildings (or any objects with a name) contained in the package
+    uses : list
+        Modelica libraries used by the package, e.g.
+        ['Modelica(version="4.0.0")', 'AixLib(version="1.3.2")']
+
+    """
+
+    _help_package(
+        path=path,
+        name=prj.name,
+        uses=uses,
+        within=None)
+    _help_package_order(
+        path=path,
+        package_list=package_list,
+        addition=None,
+        extra=None)
+    _copy_weather_data(prj.weather_file_path, path)
 
 
 def _copy_reference_results(dir_resources, prj):
@@ -276,8 +501,7 @@ def _help_package(path, name, uses=None, within=None):
 
     """
 
-    package_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package"))
+    package_template = get_template("package")
     with open(utilities.get_full_path(os.path.join(
             path, "package.mo")), 'w') as out_file:
 
@@ -309,8 +533,7 @@ def _help_package_order(path, package_list, addition=None, extra=None):
 
     """
 
-    order_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package_order"))
+    order_template = get_template("package_order")
     with open(utilities.get_full_path(
             path + "/" + "package" + ".order"), 'w') as out_file:
 
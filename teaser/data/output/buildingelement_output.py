@@ -56,6 +56,8 @@ def save_type_element(element, data_class):
             element=element, wall_out=data_class.element_bind[check_str]
         )
 
+        data_class.index_type_element(check_str)
+
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
             json.dumps(data_class.element_bind, indent=4, separators=(",", ": "))
@@ -87,6 +89,7 @@ def delete_type_element(element, data_class):
     )
 
     del data_class.element_bind[check_str]
+    data_class.unindex_type_element(check_str)
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
@@ -9,15 +9,18 @@ This module contains function to call Templates for IBPSA model generation
 import teaser.data.output.aixlib_output as ibpsa_output
 import os.path
 import teaser.logic.utilities as utilities
-from mako.template import Template
-from mako.lookup import TemplateLookup
 
 
 def export_ibpsa(
         buildings,
         prj,
         path=None,
-        library='AixLib'):
+        library='AixLib',
+        project_package=True,
+        workers=None,
+        raise_errors=True,
+        progress=None,
+        file_format=None):
     """Exports models for IBPSA library
 
     Export a building to several models for
@@ -51,12 +54,37 @@ def export_ibpsa(
         just a core set of models and should not be used standalone.
         Valid values are 'AixLib' (default), 'Buildings',
         'BuildingSystems' and 'IDEAS'.
+    project_package : bool
+        If False, only the packages of the buildings are exported and the
+        package of the project (package.mo, package.order and weather file)
+        is not written, e.g. when exporting buildings one by one (see
+        aixlib_output.export_project_package()). Default is True.
+    workers : int
+        Number of worker processes rendering and writing the buildings in
+        parallel, see aixlib_output.export_buildings(). Default is None,
+        exporting all buildings in this process.
+    raise_errors : bool
+        If True, the first error of a building export is raised. If False,
+        errors are collected, the building is left out of the project package
+        and the export continues with the next building. Default is True.
+    progress : callable
+        Called after each building with the number of finished buildings and
+        the number of all buildings. Default is None.
+    file_format : str
+        Format of the internal gains files of all buildings, 'txt' or 'mat',
+        see file_format of the library_attr of the buildings. Default is
+        None, keeping the format set for each building.
+
+    Returns
+    -------
+
+    errors : dict
+        Errors of the buildings that could not be exported (only with
+        raise_errors=False), keys are the names of the buildings
 
      Attributes
     ----------
 
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
     model_template_1 : Template object
         Template for ThermalZoneRecord using 1 element model
     model_template_2 : Template object
@@ -73,100 +101,117 @@ def export_ibpsa(
         library + '(version="' + prj.buildings[-1].library_attr.version[
             library] + '")']
 
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    model_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_OneElement"),
-        lookup=lookup)
-    model_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_TwoElements"),
-        lookup=lookup)
-    model_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_ThreeElements"),
-        lookup=lookup)
-    model_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_FourElements"),
-        lookup=lookup)
-
-    ibpsa_output._help_package(
-        path=path,
-        name=prj.name,
-        uses=uses,
-        within=None)
-    ibpsa_output._help_package_order(
-        path=path,
-        package_list=buildings,
-        addition=None,
-        extra=None)
-    ibpsa_output._copy_weather_data(prj.weather_file_path, path)
-
-    for i, bldg in enumerate(buildings):
-
+    for bldg in buildings:
         ass_error = "You chose AixLib calculation, " \
                     "but want to export IBPSA models, " \
                     "this is not possible"
 
         assert bldg.used_library_calc == 'IBPSA', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
-
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path, bldg.name + "_Models")))
-
-        ibpsa_output._help_package(
-            path=bldg_path,
-            name=bldg.name,
-            within=bldg.parent.name)
-
-        ibpsa_output._help_package_order(
-            path=bldg_path,
-            package_list=[],
-            addition=None,
-            extra=bldg.name + "_Models")
-
-        zone_path = os.path.join(
-            bldg_path,
-            bldg.name + "_Models")
-
-        for zone in bldg.thermal_zones:
-
-            zone.parent.library_attr.file_internal_gains = \
-                'InternalGains_' + bldg.name + zone.name + '.txt'
-            bldg.library_attr.modelica_gains_boundary(
-                zone=zone,
-                path=zone_path)
-
-            with open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
-
-                if type(zone.model_attr).__name__ == "OneElement":
-                    out_file.write(model_template_1.render_unicode(zone=zone,
-                                                                   library=library))
-                elif type(zone.model_attr).__name__ == "TwoElement":
-                    out_file.write(model_template_2.render_unicode(zone=zone,
-                                                                   library=library))
-                elif type(zone.model_attr).__name__ == "ThreeElement":
-                    out_file.write(model_template_3.render_unicode(zone=zone,
-                                                                   library=library))
-                elif type(zone.model_attr).__name__ == "FourElement":
-                    out_file.write(model_template_4.render_unicode(zone=zone,
-                                                                   library=library))
-
-
-        ibpsa_output._help_package(
-            path=zone_path,
-            name=bldg.name + "_Models",
-            within=prj.name + '.' + bldg.name)
-
-        ibpsa_output._help_package_order(
-            path=zone_path,
-            package_list=bldg.thermal_zones,
-            addition=bldg.name + "_")
+    if file_format is not None:
+        for bldg in buildings:
+            bldg.library_attr.file_format = file_format
+
+    errors = ibpsa_output.export_buildings(
+        buildings=buildings,
+        prj=prj,
+        task=_export_building,
+        kwargs={"path": path, "library": library},
+        workers=workers,
+        raise_errors=raise_errors,
+        progress=progress)
+
+    if project_package:
+        ibpsa_output.export_project_package(
+            prj=prj,
+            path=path,
+            package_list=[bldg for bldg in buildings if bldg.name not in errors],
+            uses=uses)
 
     print("Exports can be found here:")
     print(path)
+    return errors
+
+
+def _export_building(bldg, path, library, project_attributes=None):
+    """Writes the package of one building of export_ibpsa()
+
+    Parameters
+    ----------
+
+    bldg : instance of Building
+        Building to export
+    path : string
+        Path of the project package
+    library : str
+        Used library within the framework of IBPSA library
+    project_attributes : dict
+        Attributes of the project set on the stand-in project of a worker
+        process, see aixlib_output.export_buildings()
+    """
+
+    if project_attributes is not None:
+        for key, value in project_attributes.items():
+            setattr(bldg.parent, key, value)
+    prj = bldg.parent
+
+    model_template_1 = ibpsa_output.get_template("IBPSA/IBPSA_OneElement")
+    model_template_2 = ibpsa_output.get_template("IBPSA/IBPSA_TwoElements")
+    model_template_3 = ibpsa_output.get_template("IBPSA/IBPSA_ThreeElements")
+    model_template_4 = ibpsa_output.get_template("IBPSA/IBPSA_FourElements")
+
+    bldg_path = os.path.join(path, bldg.name)
+
+    utilities.create_path(utilities.get_full_path(bldg_path))
+    utilities.create_path(utilities.get_full_path(
+        os.path.join(bldg_path, bldg.name + "_Models")))
+
+    ibpsa_output._help_package(
+        path=bldg_path,
+        name=bldg.name,
+        within=prj.name)
+
+    ibpsa_output._help_package_order(
+        path=bldg_path,
+        package_list=[],
+        addition=None,
+        extra=bldg.name + "_Models")
+
+    zone_path = os.path.join(
+        bldg_path,
+        bldg.name + "_Models")
+
+    for zone in bldg.thermal_zones:
+
+        zone.parent.library_attr.file_internal_gains = \
+            'InternalGains_' + bldg.name + zone.name + '.' + \
+            bldg.library_attr.file_format
+        bldg.library_attr.modelica_gains_boundary(
+            zone=zone,
+            path=zone_path)
+
+        with open(utilities.get_full_path(os.path.join(
+            zone_path, bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
+
+            if type(zone.model_attr).__name__ == "OneElement":
+                out_file.write(model_template_1.render_unicode(zone=zone,
+                                                               library=library))
+            elif type(zone.model_attr).__name__ == "TwoElement":
+                out_file.write(model_template_2.render_unicode(zone=zone,
+                                                               library=library))
+            elif type(zone.model_attr).__name__ == "ThreeElement":
+                out_file.write(model_template_3.render_unicode(zone=zone,
+                                                               library=library))
+            elif type(zone.model_attr).__name__ == "FourElement":
+                out_file.write(model_template_4.render_unicode(zone=zone,
+                                                               library=library))
+
+    ibpsa_output._help_package(
+        path=zone_path,
+        name=bldg.name + "_Models",
+        within=prj.name + '.' + bldg.name)
+
+    ibpsa_output._help_package_order(
+        path=zone_path,
+        package_list=bldg.thermal_zones,
+        addition=bldg.name + "_")
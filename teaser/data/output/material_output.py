@@ -64,6 +64,7 @@ def save_material(material, data_class):
             material.material_id]["thickness_list"] = material.thickness_list
         data_class.material_bind[
             material.material_id]["solar_absorp"] = material.solar_absorp
+        data_class.index_material(material.material_id)
 
     with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
         file.write(json.dumps(
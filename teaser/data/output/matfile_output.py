@@ -0,0 +1,37 @@
+"""This module contains a writer of MATLAB v4 files for Modelica tables."""
+
+import struct
+
+
+def write_matrix(path, name, matrix):
+    """Writes one matrix of doubles to a MATLAB v4 file (-v4)
+
+    Modelica.Blocks.Sources.CombiTimeTable reads tables from MATLAB v4 files
+    by the name of the matrix (tableName), like tables in text files. The
+    values are written in binary without formatting them as text, which is
+    much faster to write and to parse. The files are not smaller, with 8
+    bytes per value they are about twice the size of the text files of
+    TEASER's profiles.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .mat file, an existing file is overwritten
+    name : str
+        Name of the matrix, e.g. "Tset"
+    matrix : numpy.ndarray
+        Two dimensional matrix, converted to double precision, e.g. the time
+        in the first column and one profile per further column
+    """
+
+    import numpy as np
+
+    matrix = np.asarray(matrix, dtype="<f8")
+    rows, columns = matrix.shape
+    encoded_name = name.encode("ascii") + b"\0"
+    with open(path, "wb") as out_file:
+        # type 0: little endian, double precision, full numeric matrix
+        out_file.write(struct.pack("<5i", 0, rows, columns, 0, len(encoded_name)))
+        out_file.write(encoded_name)
+        # MATLAB stores matrices in column major order
+        out_file.write(matrix.tobytes(order="F"))
@@ -0,0 +1,110 @@
+# created October 2026
+
+"""Registry of the archetype building classes.
+
+The archetype classes are stored by their (method, usage) pair of
+Project.add_residential() and Project.add_non_residential(). The module of a
+class is imported on the first use of the class, so importing teaser.project
+does not import all archetype modules.
+"""
+
+import importlib
+
+ARCHETYPES = {
+    ("bmvbs", "office"): ("teaser.logic.archetypebuildings.bmvbs.office", "Office"),
+    ("bmvbs", "institute"): (
+        "teaser.logic.archetypebuildings.bmvbs.custom.institute",
+        "Institute",
+    ),
+    ("bmvbs", "institute4"): (
+        "teaser.logic.archetypebuildings.bmvbs.custom.institute4",
+        "Institute4",
+    ),
+    ("bmvbs", "institute8"): (
+        "teaser.logic.archetypebuildings.bmvbs.custom.institute8",
+        "Institute8",
+    ),
+    ("iwu", "single_family_dwelling"): (
+        "teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling",
+        "SingleFamilyDwelling",
+    ),
+    ("tabula_de", "single_family_house"): (
+        "teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse",
+        "SingleFamilyHouse",
+    ),
+    ("tabula_de", "terraced_house"): (
+        "teaser.logic.archetypebuildings.tabula.de.terracedhouse",
+        "TerracedHouse",
+    ),
+    ("tabula_de", "multi_family_house"): (
+        "teaser.logic.archetypebuildings.tabula.de.multifamilyhouse",
+        "MultiFamilyHouse",
+    ),
+    ("tabula_de", "apartment_block"): (
+        "teaser.logic.archetypebuildings.tabula.de.apartmentblock",
+        "ApartmentBlock",
+    ),
+    ("tabula_dk", "single_family_house"): (
+        "teaser.logic.archetypebuildings.tabula.dk.singlefamilyhouse",
+        "SingleFamilyHouse",
+    ),
+    ("tabula_dk", "terraced_house"): (
+        "teaser.logic.archetypebuildings.tabula.dk.terracedhouse",
+        "TerracedHouse",
+    ),
+    ("tabula_dk", "apartment_block"): (
+        "teaser.logic.archetypebuildings.tabula.dk.apartmentblock",
+        "ApartmentBlock",
+    ),
+}
+ARCHETYPES.update(
+    (
+        ("urbanrenet", usage),
+        ("teaser.logic.archetypebuildings.urbanrenet." + usage, "EST" + usage[3:]),
+    )
+    for usage in (
+        "est1a",
+        "est1b",
+        "est2",
+        "est3",
+        "est4a",
+        "est4b",
+        "est5",
+        "est6",
+        "est7",
+        "est8a",
+        "est8b",
+    )
+)
+
+_classes = {}
+
+
+def get_archetype(method, usage):
+    """Archetype class of a method and usage
+
+    Parameters
+    ----------
+    method : str
+        Archetype method, e.g. "tabula_de" or "bmvbs"
+    usage : str
+        Usage of the archetype, e.g. "single_family_house" or "office"
+
+    Returns
+    -------
+    archetype : type
+        Archetype class, a subclass of Building, e.g. Office
+
+    Raises
+    ------
+    KeyError
+        If there is no archetype for method and usage
+    """
+
+    key = (method, usage)
+    archetype = _classes.get(key)
+    if archetype is None:
+        module, name = ARCHETYPES[key]
+        archetype = getattr(importlib.import_module(module), name)
+        _classes[key] = archetype
+    return archetype
@@ -3,6 +3,7 @@
 
 """This module includes the Building class
 """
+import contextlib
 import inspect
 import random
 import re
@@ -159,6 +160,9 @@ class Building(object):
         self._thermal_zones = []
         self._outer_area = {}
         self._window_area = {}
+        self._bulk_update_depth = 0
+        self._deferred_area_dicts = set()
+        self._deferred_elements = {}
 
         self.bldg_height = None
         self.volume = 0
@@ -185,30 +189,18 @@ class Building(object):
             orientation of the obtained walls
         """
 
-        for zone in self.thermal_zones:
-            for wall in zone.outer_walls:
-                if wall.orientation == orientation:
-                    wall.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.outer_walls
-                    )
-
-            for roof in zone.rooftops:
-                if roof.orientation == orientation:
-                    roof.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.rooftops
-                    )
-
-            for ground in zone.ground_floors:
-                if ground.orientation == orientation:
-                    ground.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.ground_floors
-                    )
-
-            for door in zone.doors:
-                if door.orientation == orientation:
-                    door.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.doors
-                    )
+        with self.bulk_update():
+            for zone in self.thermal_zones:
+                zone_area = (new_area / self.net_leased_area) * zone.area
+                for element_list in (
+                    "outer_walls",
+                    "rooftops",
+                    "ground_floors",
+                    "doors",
+                ):
+                    elements = zone.get_elements(element_list, orientation)
+                    for element in elements:
+                        element.area = zone_area / len(elements)
 
     def set_window_area(self, new_area, orientation):
         """Window area setter
@@ -224,12 +216,12 @@ class Building(object):
             orientation of the obtained windows
         """
 
-        for zone in self.thermal_zones:
-            for win in zone.windows:
-                if win.orientation == orientation:
-                    win.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.windows
-                    )
+        with self.bulk_update():
+            for zone in self.thermal_zones:
+                zone_area = (new_area / self.net_leased_area) * zone.area
+                windows = zone.get_elements("windows", orientation)
+                for win in windows:
+                    win.area = zone_area / len(windows)
 
     def get_outer_wall_area(self, orientation):
         """Get aggregated wall area of one orientation
@@ -249,24 +241,10 @@ class Building(object):
 
         sum_area = 0.0
         for zone_count in self.thermal_zones:
-            for wall_count in zone_count.outer_walls:
-                if (
-                    wall_count.orientation == orientation
-                    and wall_count.area is not None
-                ):
-                    sum_area += wall_count.area
-            for roof_count in zone_count.rooftops:
-                if (
-                    roof_count.orientation == orientation
-                    and roof_count.area is not None
-                ):
-                    sum_area += roof_count.area
-            for ground_count in zone_count.ground_floors:
-                if (
-                    ground_count.orientation == orientation
-                    and ground_count.area is not None
-                ):
-                    sum_area += ground_count.area
+            for element_list in ("outer_walls", "rooftops", "ground_floors"):
+                for element in zone_count.get_elements(element_list, orientation):
+                    if element.area is not None:
+                        sum_area += element.area
         return sum_area
 
     def get_window_area(self, orientation):
@@ -286,8 +264,8 @@ class Building(object):
 
         sum_area = 0.0
         for zone_count in self.thermal_zones:
-            for win_count in zone_count.windows:
-                if win_count.orientation == orientation and win_count.area is not None:
+            for win_count in zone_count.get_elements("windows", orientation):
+                if win_count.area is not None:
                     sum_area += win_count.area
         return sum_area
 
@@ -349,6 +327,57 @@ class Building(object):
         for key in self.window_area:
             self.window_area[key] = self.get_window_area(key)
 
+    @contextlib.contextmanager
+    def bulk_update(self):
+        """Defer updates of building elements until the end of a block
+
+        Setting e.g. the area or orientation of an outer wall or window
+        refills the dictionaries outer_area and window_area from all elements
+        of the building, setting area, layers or thicknesses recalculates the
+        U*A value of the element. Within this context these updates are only
+        recorded and done once when the outermost context is left, which
+        makes creating or changing many building elements much faster.
+        Values read within the context may be outdated. Contexts can be
+        nested. If the block raises, the recorded updates are still done
+        for the changes made before the error, an error of these updates is
+        suppressed in favour of the error of the block.
+
+        Examples
+        --------
+        >>> with building.bulk_update():
+        ...     for wall in building.thermal_zones[0].outer_walls:
+        ...         wall.area = 10.0
+        """
+
+        self._bulk_update_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._bulk_update_depth -= 1
+            if self._bulk_update_depth == 0:
+                try:
+                    self._apply_deferred_updates()
+                except Exception:
+                    pass
+            raise
+        self._bulk_update_depth -= 1
+        if self._bulk_update_depth == 0:
+            self._apply_deferred_updates()
+
+    def _apply_deferred_updates(self):
+        """Do the updates recorded within bulk_update()"""
+
+        area_dicts = self._deferred_area_dicts
+        elements = self._deferred_elements
+        self._deferred_area_dicts = set()
+        self._deferred_elements = {}
+        if "outer_area" in area_dicts:
+            self.fill_outer_area_dict()
+        if "window_area" in area_dicts:
+            self.fill_window_area_dict()
+        for element in elements:
+            element.calc_ua_value()
+
     def calc_building_parameter(
         self, number_of_elements=2, merge_windows=False, used_library="AixLib"
     ):
@@ -548,6 +577,25 @@ class Building(object):
 
         if self.__name[0].isdigit():
             self.__name = "B" + self.__name
+        self._reset_project_index()
+
+    @property
+    def internal_id(self):
+        return self._internal_id
+
+    @internal_id.setter
+    def internal_id(self, value):
+        self._internal_id = value
+        self._reset_project_index()
+
+    def _reset_project_index(self):
+        """Resets the index of Project.buildings after a change of the key"""
+
+        parent = getattr(self, "_Building__parent", None)
+        if parent is not None:
+            reset_index = getattr(parent.buildings, "reset_index", None)
+            if reset_index is not None:
+                reset_index()
 
     @property
     def year_of_construction(self):
@@ -188,6 +188,50 @@ class BuildingElement(object):
             self.r_inner_comb + self.r_conduc + self.r_outer_comb))
         self.u_value = self.ua_value / self.area
 
+    def _deferring_building(self):
+        """Building deferring the updates of this element, if any
+
+        Returns the parent building of the element if it is within
+        Building.bulk_update(), None otherwise.
+        """
+
+        if self.parent is not None and self.parent.parent is not None:
+            building = self.parent.parent
+            if building._bulk_update_depth > 0:
+                return building
+        return None
+
+    def _update_area_dict(self, name):
+        """Refill outer_area or window_area of the parent building
+
+        The update is deferred within Building.bulk_update().
+
+        Parameters
+        ----------
+        name : str
+            "outer_area" or "window_area"
+        """
+
+        building = self._deferring_building()
+        if building is not None:
+            building._deferred_area_dicts.add(name)
+        elif name == "outer_area":
+            self.parent.parent.fill_outer_area_dict()
+        else:
+            self.parent.parent.fill_window_area_dict()
+
+    def _update_ua_value(self):
+        """Recalculate the U*A value after a change of the element
+
+        The update is deferred within Building.bulk_update().
+        """
+
+        building = self._deferring_building()
+        if building is not None:
+            building._deferred_elements[self] = None
+        else:
+            self.calc_ua_value()
+
     def gather_element_properties(self):
         """Helper function for matrix calculation.
 
@@ -451,15 +495,18 @@ class BuildingElement(object):
     @orientation.setter
     def orientation(self, value):
 
+        old_orientation = self._orientation
         self._orientation = value
+        if self.parent is not None:
+            self.parent._reindex_element(self, old_orientation)
         if type(self).__name__ == "OuterWall":
             if (self.parent is not None and self.parent.parent is not None and
                     self.area is not None):
-                self.parent.parent.fill_outer_area_dict()
+                self._update_area_dict("outer_area")
         elif type(self).__name__ == "Window":
             if (self.parent is not None and self.parent.parent is not None and
                     self.area is not None):
-                self.parent.parent.fill_window_area_dict()
+                self._update_area_dict("window_area")
 
     @property
     def layer(self):
@@ -474,7 +521,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def inner_convection(self):
@@ -498,7 +545,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def inner_radiation(self):
@@ -522,7 +569,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def outer_convection(self):
@@ -546,7 +593,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def outer_radiation(self):
@@ -570,7 +617,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def area(self):
@@ -596,14 +643,14 @@ class BuildingElement(object):
                 or type(self).__name__ == "GroundFloor":
             if (self.parent is not None and self.parent.parent is not None and
                     self.orientation is not None):
-                self.parent.parent.fill_outer_area_dict()
+                self._update_area_dict("outer_area")
         elif type(self).__name__ == "Window":
             if self.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_window_area_dict()
+                self._update_area_dict("window_area")
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self._update_ua_value()
 
     @property
     def tilt(self):
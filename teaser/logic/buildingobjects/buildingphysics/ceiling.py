@@ -112,4 +112,4 @@ class Ceiling(InnerWall):
         super(Ceiling, self).__init__(parent)
 
         self._tilt = 0.0
-        self._orientation = -1.0
+        self.orientation = -1.0
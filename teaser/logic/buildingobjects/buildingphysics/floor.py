@@ -112,4 +112,4 @@ class Floor(InnerWall):
         super(Floor, self).__init__(parent)
 
         self._tilt = 0.0
-        self._orientation = -2.0
+        self.orientation = -2.0
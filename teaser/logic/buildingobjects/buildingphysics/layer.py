@@ -100,4 +100,4 @@ class Layer(object):
 
         if self.material is not None and self.parent is not None:
             if vars(self.material)['_thermal_conduc'] != 0:
-                self.parent.calc_ua_value()
+                self.parent._update_ua_value()
@@ -44,7 +44,9 @@ class Material(object):
         List of usual values for material thickness, float [m]
     material_id : str(uuid)
         UUID of material, this is used to have similar behaviour like foreign
-        key in SQL data bases for use in TypeBuildingElements and Material json
+        key in SQL data bases for use in TypeBuildingElements and Material json.
+        A new UUID is generated on first access, unless an id was assigned,
+        e.g. by loading the material from the binding.
 
     """
 
@@ -66,7 +68,7 @@ class Material(object):
         self._thickness_default = 0.0
         self._thickness_list = []
 
-        self.material_id = str(uuid.uuid1())
+        self.material_id = None
 
     def load_material_template(self, mat_name, data_class=None):
         """Material loader.
@@ -96,6 +98,40 @@ class Material(object):
                                      mat_name=mat_name,
                                      data_class=data_class)
 
+    def apply_material_record(self, record):
+        """Assign the properties of a shared material record.
+
+        The values of a MaterialRecord are already converted by the setters
+        of this class, so they are assigned directly. As in the setter of
+        thermal_conduc, the UA-Value of the parent building element is
+        recalculated afterwards.
+
+        Parameters
+        ----------
+
+        record : MaterialRecord
+            Immutable material record, see DataClass.get_material_record()
+
+        """
+        self.material_id = record.material_id
+        self._name = record.name
+        self._density = record.density
+        self._thermal_conduc = record.thermal_conduc
+        self._heat_capac = record.heat_capac
+        self._solar_absorp = record.solar_absorp
+        self._thickness_default = record.thickness_default
+        self._thickness_list = list(record.thickness_list)
+
+        if self.parent is not None:
+            if self.parent.parent is not None:
+                if self.parent.thickness is not None and \
+                        self.parent.parent.inner_convection is \
+                        not None and \
+                        self.parent.parent.inner_radiation is \
+                        not None and \
+                        self.parent.parent.area is not None:
+                    self.parent.parent._update_ua_value()
+
     def save_material_template(self, data_class):
         """Material saver.
 
@@ -145,6 +181,8 @@ class Material(object):
 
     @property
     def material_id(self):
+        if self.__material_id is None:
+            self.__material_id = str(uuid.uuid1())
         return self.__material_id
 
     @material_id.setter
@@ -214,7 +252,7 @@ class Material(object):
                             self.parent.parent.inner_radiation is \
                             not None and \
                             self.parent.parent.area is not None:
-                        self.parent.parent.calc_ua_value()
+                        self.parent.parent._update_ua_value()
 
     @property
     def density(self):
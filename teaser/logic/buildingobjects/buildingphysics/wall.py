@@ -3,9 +3,20 @@ from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
+import collections
 import numpy as np
 import warnings
 
+EQUIVALENT_RES_CACHE_SIZE = 4096
+"""Maximum number of layer stacks kept in the equivalent resistance cache,
+0 disables the cache."""
+
+EquivalentResCacheInfo = collections.namedtuple(
+    "EquivalentResCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_equivalent_res_cache = collections.OrderedDict()
+_equivalent_res_cache_stats = {"hits": 0, "misses": 0}
+
 
 class Wall(BuildingElement):
     """Wall class
@@ -125,105 +136,7 @@ class Wall(BuildingElement):
             Time constant according to VDI 6007 (default t_bt = 7)
         """
 
-        nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
-            self.gather_element_properties()
-
-        omega = 2 * np.pi / (86400 * t_bt)
-
-        r_layer = thickness / thermal_conduc
-        c_layer = heat_capac * density * thickness * 1000
-
-        re11 = np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.cos(np.sqrt(0.5 * omega * r_layer * c_layer))
-        im11 = np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.sin(np.sqrt(0.5 * omega * r_layer * c_layer))
-        re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re21 = (-1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im21 = (1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re22 = re11
-        im22 = im11
-
-        # -----setting up the matrix for each layer
-        a_layer = np.zeros((nr_of_layer, 4, 4))
-
-        for i, r in enumerate(re11):
-            a_layer[i][0][0] = r
-            a_layer[i][0][1] = im11[i]
-            a_layer[i][0][2] = re12[i]
-            a_layer[i][0][3] = im12[i]
-            a_layer[i][1][0] = -im11[i]
-            a_layer[i][1][1] = re11[i]
-            a_layer[i][1][2] = -im12[i]
-            a_layer[i][1][3] = re12[i]
-            a_layer[i][2][0] = re21[i]
-            a_layer[i][2][1] = im21[i]
-            a_layer[i][2][2] = re22[i]
-            a_layer[i][2][3] = im22[i]
-            a_layer[i][3][0] = -im21[i]
-            a_layer[i][3][1] = re21[i]
-            a_layer[i][3][2] = -im22[i]
-            a_layer[i][3][3] = re22[i]
-
-        # -----multiplication of the matrix
-        new_mat = np.diag(np.ones(4))
-
-        for count_layer in a_layer:
-            new_mat = np.dot(new_mat, count_layer)
-
-        # calculation of equivalent Resistance and capacities of each element
-        self.r1 = (1 / self.area) * ((new_mat[3][3] - 1) *
-                                     new_mat[0][2] + new_mat[2][3] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[3][3] - 1) ** 2 + new_mat[2][3] ** 2)
-        self.r2 = (1 / self.area) * ((new_mat[0][0] - 1) *
-                                     new_mat[0][2] + new_mat[0][1] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[0][0] - 1) ** 2 + new_mat[0][1] ** 2)
-        self.c1 = self.area * ((new_mat[3][3] - 1) ** 2 +
-                               (new_mat[2][3]) ** 2) / \
-            (omega * (new_mat[0][2] * new_mat[2][3] -
-                      (new_mat[3][3] - 1) * new_mat[0][3]))
-        self.c2 = self.area * ((new_mat[0][0] - 1) ** 2 +
-                               (new_mat[0][1]) ** 2) / (
-            omega * (new_mat[0][2] *
-                     new_mat[0][1] -
-                     (new_mat[0][0] - 1) *
-                     new_mat[0][3]))
-        self.r3 = (1 / self.area) * (np.sum(r_layer)) - self.r1 - self.r2
-
-        r_wall = self.r1 + self.r2 + self.r3
-
-        self.c1_korr = (1 / (omega * self.r1)) * ((r_wall * self.area -
-                                                   new_mat[0][2] * new_mat[3][
-                                                       3] -
-                                                   new_mat[0][3] * new_mat[2][
-                                                       3]) /
-                                                  (new_mat[3][3] * new_mat[0][
-                                                      3] -
-                                                   new_mat[0][2] * new_mat[2][
-                                                       3]))
-
-        if type(self).__name__ == "OuterWall" \
-                or type(self).__name__ == "Rooftop" \
-                or type(self).__name__ == "GroundFloor":
-            self.c1 = self.c1_korr
+        calc_equivalent_res_batch([self], t_bt=t_bt)
 
     def insulate_wall(
             self,
@@ -374,3 +287,267 @@ class Wall(BuildingElement):
                     self.layer[-1].material.thermal_conduc
 
                 self.layer[-1].id = len(self.layer)
+
+
+def calc_chain_matrices(
+        layer_count,
+        density,
+        thermal_conduc,
+        heat_capac,
+        thickness,
+        omega):
+    """Chain matrices of layer stacks according to VDI 6007.
+
+    Calculates the complex 2x2 transfer matrix of every layer and chains the
+    layers of each stack by matrix multiplication. All layers of all stacks
+    are handled at once, the layer properties are passed as flat arrays,
+    stack after stack, each ordered from the inner to the outer side.
+
+    The complex 2x2 matrix is equivalent to the real 4x4 matrix given in
+    VDI 6007, element [i][j] of the complex matrix corresponds to the real
+    elements [2i][2j] (real part) and [2i][2j+1] (imaginary part).
+
+    Parameters
+    ----------
+    layer_count : np.array
+        Number of layers of each stack
+    density : np.array
+        Density of each layer
+    thermal_conduc : np.array
+        Thermal conductivity of each layer
+    heat_capac : np.array
+        Heat capacity of each layer
+    thickness : np.array
+        Thickness of each layer
+    omega : float
+        VDI 6007 frequency
+
+    Returns
+    -------
+    chain_matrix : np.array
+        Complex array of shape (number of stacks, 2, 2) with the chained
+        transfer matrix of each stack
+    r_stack : np.array
+        Sum of the conductive resistances of all layers of each stack
+        (per unit area)
+    """
+
+    layer_count = np.asarray(layer_count, dtype=int)
+
+    r_layer = thickness / thermal_conduc
+    c_layer = heat_capac * density * thickness * 1000
+
+    x = np.sqrt(0.5 * omega * r_layer * c_layer)
+    cosh_x = np.cosh(x)
+    sinh_x = np.sinh(x)
+    cos_x = np.cos(x)
+    sin_x = np.sin(x)
+
+    re11 = cosh_x * cos_x
+    im11 = sinh_x * sin_x
+    re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
+        (cosh_x * sin_x + sinh_x * cos_x)
+    im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
+        (cosh_x * sin_x - sinh_x * cos_x)
+    re21 = (-1 / r_layer) * x * (cosh_x * sin_x - sinh_x * cos_x)
+    im21 = (1 / r_layer) * x * (cosh_x * sin_x + sinh_x * cos_x)
+
+    # -----setting up the matrix for each layer, unused layer positions of
+    # shorter stacks are filled with the identity matrix
+    nr_of_stacks = len(layer_count)
+    max_layer = layer_count.max() if nr_of_stacks > 0 else 0
+    stack_index = np.repeat(np.arange(nr_of_stacks), layer_count)
+    layer_index = np.arange(len(r_layer)) - np.repeat(
+        np.cumsum(layer_count) - layer_count, layer_count)
+
+    a_layer = np.zeros((nr_of_stacks, max_layer, 2, 2), dtype=complex)
+    a_layer[:, :, 0, 0] = 1
+    a_layer[:, :, 1, 1] = 1
+    a_layer[stack_index, layer_index, 0, 0] = re11 + 1j * im11
+    a_layer[stack_index, layer_index, 0, 1] = re12 + 1j * im12
+    a_layer[stack_index, layer_index, 1, 0] = re21 + 1j * im21
+    a_layer[stack_index, layer_index, 1, 1] = re11 + 1j * im11
+
+    # -----multiplication of the matrix
+    chain_matrix = np.zeros((nr_of_stacks, 2, 2), dtype=complex)
+    chain_matrix[:, 0, 0] = 1
+    chain_matrix[:, 1, 1] = 1
+    for position in range(max_layer):
+        chain_matrix = np.matmul(chain_matrix, a_layer[:, position])
+
+    r_stack = np.zeros(nr_of_stacks)
+    np.add.at(r_stack, stack_index, r_layer)
+
+    return chain_matrix, r_stack
+
+
+def calc_equivalent_res_batch(walls, t_bt=7):
+    """Equivalent resistance according to VDI 6007 for many walls at once.
+
+    Calculates the equivalent resistances and capacities of all given walls
+    according to VDI 6007 guideline (Analogous model) in one vectorized
+    computation and sets r1, r2, r3, c1, c2 and c1_korr of each wall.
+
+    Results per unit area are kept in a bounded LRU cache keyed by the
+    layer stack and t_bt, thus the chain matrix of each distinct
+    construction is only calculated once and scaled by the area of each
+    wall afterwards (see equivalent_res_cache_info()).
+
+    Parameters
+    ----------
+    walls : list
+        List of Wall instances (OuterWall, Rooftop, GroundFloor, InnerWall,
+        ...)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    """
+    if len(walls) == 0:
+        return
+
+    properties = [wall.gather_element_properties() for wall in walls]
+
+    # computed element-wise to keep the errors of missing or zero areas
+    area_inv = np.array([1 / wall.area for wall in walls])
+    area = np.array([wall.area for wall in walls])
+
+    keys = [
+        (t_bt,
+         density.tobytes(),
+         thermal_conduc.tobytes(),
+         heat_capac.tobytes(),
+         thickness.tobytes())
+        for (nr_of_layer, density, thermal_conduc, heat_capac, thickness)
+        in properties]
+
+    per_area = [None] * len(walls)
+    missing = collections.OrderedDict()
+    for i, key in enumerate(keys):
+        try:
+            per_area[i] = _equivalent_res_cache[key]
+        except KeyError:
+            if key in missing:
+                missing[key].append(i)
+                _equivalent_res_cache_stats["hits"] += 1
+            else:
+                missing[key] = [i]
+                _equivalent_res_cache_stats["misses"] += 1
+        else:
+            _equivalent_res_cache.move_to_end(key)
+            _equivalent_res_cache_stats["hits"] += 1
+
+    if missing:
+        first = [indices[0] for indices in missing.values()]
+        layer_count, density, thermal_conduc, heat_capac, thickness = zip(
+            *[properties[i] for i in first])
+        results = _calc_equivalent_res_per_area(
+            layer_count=layer_count,
+            density=np.concatenate(density),
+            thermal_conduc=np.concatenate(thermal_conduc),
+            heat_capac=np.concatenate(heat_capac),
+            thickness=np.concatenate(thickness),
+            t_bt=t_bt)
+        for (key, indices), result in zip(missing.items(), results):
+            for i in indices:
+                per_area[i] = result
+            if EQUIVALENT_RES_CACHE_SIZE > 0:
+                _equivalent_res_cache[key] = result
+                if len(_equivalent_res_cache) > EQUIVALENT_RES_CACHE_SIZE:
+                    _equivalent_res_cache.popitem(last=False)
+
+    r1, r2, r3, c1, c2, c1_korr = np.array(per_area).T
+
+    r1 = (area_inv * r1).tolist()
+    r2 = (area_inv * r2).tolist()
+    r3 = (area_inv * r3).tolist()
+    c1 = (area * c1).tolist()
+    c2 = (area * c2).tolist()
+    c1_korr = (area * c1_korr).tolist()
+
+    for i, wall in enumerate(walls):
+        wall.r1 = r1[i]
+        wall.r2 = r2[i]
+        wall.r3 = r3[i]
+        wall.c2 = c2[i]
+        wall.c1_korr = c1_korr[i]
+
+        if type(wall).__name__ == "OuterWall" \
+                or type(wall).__name__ == "Rooftop" \
+                or type(wall).__name__ == "GroundFloor":
+            wall.c1 = c1_korr[i]
+        else:
+            wall.c1 = c1[i]
+
+
+def _calc_equivalent_res_per_area(
+        layer_count,
+        density,
+        thermal_conduc,
+        heat_capac,
+        thickness,
+        t_bt):
+    """Equivalent resistances and capacities per unit area of layer stacks.
+
+    Returns
+    -------
+    results : list
+        One tuple (r1, r2, r3, c1, c2, c1_korr) per stack, resistances
+        multiplied and capacities divided by the area of the element
+    """
+
+    omega = 2 * np.pi / (86400 * t_bt)
+
+    chain_matrix, r_stack = calc_chain_matrices(
+        layer_count=layer_count,
+        density=density,
+        thermal_conduc=thermal_conduc,
+        heat_capac=heat_capac,
+        thickness=thickness,
+        omega=omega)
+
+    # elements of the real 4x4 matrix of VDI 6007
+    m00 = chain_matrix[:, 0, 0].real
+    m01 = chain_matrix[:, 0, 0].imag
+    m02 = chain_matrix[:, 0, 1].real
+    m03 = chain_matrix[:, 0, 1].imag
+    m23 = chain_matrix[:, 1, 1].imag
+    m33 = chain_matrix[:, 1, 1].real
+
+    # calculation of equivalent Resistance and capacities of each element
+    r1 = ((m33 - 1) * m02 + m23 * m03) / \
+        ((m33 - 1) ** 2 + m23 ** 2)
+    r2 = ((m00 - 1) * m02 + m01 * m03) / \
+        ((m00 - 1) ** 2 + m01 ** 2)
+    c1 = ((m33 - 1) ** 2 + m23 ** 2) / \
+        (omega * (m02 * m23 - (m33 - 1) * m03))
+    c2 = ((m00 - 1) ** 2 + m01 ** 2) / \
+        (omega * (m02 * m01 - (m00 - 1) * m03))
+    r3 = r_stack - r1 - r2
+
+    r_wall = r1 + r2 + r3
+
+    c1_korr = (1 / (omega * r1)) * ((r_wall - m02 * m33 - m03 * m23) /
+                                    (m33 * m03 - m02 * m23))
+
+    return list(zip(r1, r2, r3, c1, c2, c1_korr))
+
+
+def equivalent_res_cache_info():
+    """Statistics of the equivalent resistance cache.
+
+    Returns
+    -------
+    cache_info : EquivalentResCacheInfo
+        Named tuple with hits, misses, maxsize and currsize of the cache
+    """
+    return EquivalentResCacheInfo(
+        hits=_equivalent_res_cache_stats["hits"],
+        misses=_equivalent_res_cache_stats["misses"],
+        maxsize=EQUIVALENT_RES_CACHE_SIZE,
+        currsize=len(_equivalent_res_cache))
+
+
+def clear_equivalent_res_cache():
+    """Remove all entries and reset the statistics of the cache."""
+    _equivalent_res_cache.clear()
+    _equivalent_res_cache_stats["hits"] = 0
+    _equivalent_res_cache_stats["misses"] = 0
@@ -3,11 +3,10 @@
 
 """This module includes a class for central AHU
 """
-import pandas as pd
-from itertools import cycle, islice
+from teaser.logic.profile import ProfileSchedules
 
 
-class BuildingAHU(object):
+class BuildingAHU(ProfileSchedules):
     """BuildingAHU Class
 
     This class holds information for a central Air Handling Unit (AHU). This
@@ -79,9 +78,24 @@ class BuildingAHU(object):
           (persons_profile combined with "min_ahu and max_ahu")
           is used for the AHU supply flow calculations.
           Per default: (v_flow_profile combined with "min_ahu and max_ahu")
+    schedules : pandas.DataFrame
+        All profiles of the AHU for one year in hourly time steps, used for
+        export. The DataFrame is built on first access and kept, changes to
+        its values are written back into the profiles. Assigning a DataFrame
+        with 8760 rows sets the profiles of its columns, its index is
+        ignored. Profiles are stored as shared, interned patterns (see
+        teaser.logic.profile and profile()) and read as lists which can't be
+        changed in place, assign a new list to change a profile.
 
     """
 
+    _profile_names = (
+        "temperature_profile",
+        "min_relative_humidity_profile",
+        "max_relative_humidity_profile",
+        "v_flow_profile",
+    )
+
     def __init__(self, parent=None):
         """Constructor of BuildingAHU Class
         """
@@ -101,28 +115,10 @@ class BuildingAHU(object):
         self.pressure_drop_fan_supply = 800
         self.pressure_drop_fan_return = 800
 
-        self._temperature_profile = 7 * [293.15] + 12 * [295.15] + 5 * [293.15]
-        self._min_relative_humidity_profile = 24 * [0.45]
-        self._max_relative_humidity_profile = 24 * [0.65]
-        self._v_flow_profile = 7 * [0.0] + 12 * [1.0] + 5 * [0.0]
-
-        self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            data={
-                "temperature_profile": list(
-                    islice(cycle(self.temperature_profile), 8760)
-                ),
-                "min_relative_humidity_profile": list(
-                    islice(cycle(self.min_relative_humidity_profile), 8760)
-                ),
-                "max_relative_humidity_profile": list(
-                    islice(cycle(self.max_relative_humidity_profile), 8760)
-                ),
-                "v_flow_profile": list(islice(cycle(self.v_flow_profile), 8760)),
-            },
-        )
+        self.temperature_profile = 7 * [293.15] + 12 * [295.15] + 5 * [293.15]
+        self.min_relative_humidity_profile = 24 * [0.45]
+        self.max_relative_humidity_profile = 24 * [0.65]
+        self.v_flow_profile = 7 * [0.0] + 12 * [1.0] + 5 * [0.0]
 
     @property
     def parent(self):
@@ -139,48 +135,32 @@ class BuildingAHU(object):
 
     @property
     def temperature_profile(self):
-        return self._temperature_profile
+        return self.profile("temperature_profile").values
 
     @temperature_profile.setter
     def temperature_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._temperature_profile = value
-        self.schedules["temperature_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("temperature_profile", value)
 
     @property
     def min_relative_humidity_profile(self):
-        return self._min_relative_humidity_profile
+        return self.profile("min_relative_humidity_profile").values
 
     @min_relative_humidity_profile.setter
     def min_relative_humidity_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._min_relative_humidity_profile = value
-        self.schedules["min_relative_humidity_profile"] = list(
-            islice(cycle(value), 8760)
-        )
+        self._set_profile("min_relative_humidity_profile", value)
 
     @property
     def max_relative_humidity_profile(self):
-        return self._max_relative_humidity_profile
+        return self.profile("max_relative_humidity_profile").values
 
     @max_relative_humidity_profile.setter
     def max_relative_humidity_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._max_relative_humidity_profile = value
-        self.schedules["max_relative_humidity_profile"] = list(
-            islice(cycle(value), 8760)
-        )
+        self._set_profile("max_relative_humidity_profile", value)
 
     @property
     def v_flow_profile(self):
-        return self._v_flow_profile
+        return self.profile("v_flow_profile").values
 
     @v_flow_profile.setter
     def v_flow_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._v_flow_profile = value
-        self.schedules["v_flow_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("v_flow_profile", value)
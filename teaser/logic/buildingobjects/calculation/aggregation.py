@@ -0,0 +1,195 @@
+# created October 2026
+
+"""Shared routines for the aggregation of building elements to RC elements"""
+
+import numpy as np
+
+
+def calc_parallel_connection(r1, c1, omega):
+    """Parallel connection of RC elements according to VDI 6007
+
+    Calculates the parallel connection of any number of RC elements
+    according to VDI 6007 (equation 23, 24) in one step. Each element is a
+    series connection of resistance r1 and capacity c1, the complex
+    admittances of all elements are summed up and the resulting impedance
+    is converted back to one resistance and capacity. This is equal to
+    folding the elements pairwise as described in VDI 6007.
+
+    Parameters
+    ----------
+    r1 : array_like
+        VDI 6007 resistances of all elements [K/W]
+    c1 : array_like
+        VDI 6007 capacities of all elements [J/K]
+    omega : float
+        VDI 6007 frequency
+
+    Returns
+    -------
+    r1 : float [K/W]
+        VDI 6007 resistance of the parallel connection
+    c1 : float [J/K]
+        VDI 6007 capacity of the parallel connection
+    """
+
+    r1 = np.asarray(r1, dtype=float)
+    c1 = np.asarray(c1, dtype=float)
+
+    admittance = np.sum(1j * omega * c1 / (1 + 1j * omega * r1 * c1))
+    impedance = 1 / admittance
+
+    return impedance.real, -1 / (omega * impedance.imag)
+
+
+def sum_elements(elements, ambient=False, windows=False):
+    """Sums of the attributes of building elements needed for aggregation
+
+    Walks the elements once and accumulates all sums the RC models need
+    for one element list. The sums are accumulated in the order of the
+    list, thus each value equals the plain sum() over the list.
+
+    Parameters
+    ----------
+    elements : list
+        Building elements of one element list of a thermal zone
+    ambient : bool
+        If True, the values facing the ambient are summed up as well
+    windows : bool
+        If True, the window specific values are summed up as well
+
+    Returns
+    -------
+    sums : dict
+        Sums of area, ua_value, the reciprocal inner resistances
+        (inv_r_inner_conv, inv_r_inner_rad, inv_r_inner_comb) and the area
+        weighted emissivity of the inner layer (ir_emissivity_inner). With
+        ambient the reciprocal outer resistances (inv_r_outer_*) and the
+        area weighted emissivity and absorptance of the outer layer
+        (ir_emissivity_outer, solar_absorp), with windows the area weighted
+        g_value and a_conv.
+    """
+
+    area = ua_value = conv = rad = comb = emissivity = 0
+    outer_conv = outer_rad = outer_comb = outer_emissivity = absorp = 0
+    g_value = a_conv = 0
+    for element in elements:
+        element_area = element.area
+        area += element_area
+        ua_value += element.ua_value
+        conv += 1 / element.r_inner_conv
+        rad += 1 / element.r_inner_rad
+        comb += 1 / element.r_inner_comb
+        emissivity += element.layer[0].material.ir_emissivity * element_area
+        if ambient:
+            outer_conv += 1 / element.r_outer_conv
+            outer_rad += 1 / element.r_outer_rad
+            outer_comb += 1 / element.r_outer_comb
+            material = element.layer[-1].material
+            outer_emissivity += material.ir_emissivity * element_area
+            absorp += material.solar_absorp * element_area
+        if windows:
+            g_value += element.g_value * element_area
+            a_conv += element.a_conv * element_area
+
+    sums = {
+        "area": area,
+        "ua_value": ua_value,
+        "inv_r_inner_conv": conv,
+        "inv_r_inner_rad": rad,
+        "inv_r_inner_comb": comb,
+        "ir_emissivity_inner": emissivity,
+    }
+    if ambient:
+        sums.update(
+            inv_r_outer_conv=outer_conv,
+            inv_r_outer_rad=outer_rad,
+            inv_r_outer_comb=outer_comb,
+            ir_emissivity_outer=outer_emissivity,
+            solar_absorp=absorp,
+        )
+    if windows:
+        sums.update(g_value=g_value, a_conv=a_conv)
+    return sums
+
+
+def add_sums(*sums):
+    """Adds the sums of several element lists, see sum_elements()
+
+    The lists are added in the given order, only values present in all
+    sums are kept.
+
+    Parameters
+    ----------
+    sums : dict
+        Sums of the element lists as returned by sum_elements()
+
+    Returns
+    -------
+    sums : dict
+        Sums over all element lists
+    """
+
+    return {
+        key: sum(single[key] for single in sums)
+        for key in sums[0]
+        if all(key in single for single in sums)
+    }
+
+
+class Facade(object):
+    """Outer building elements of a thermal zone facing the same direction
+
+    Groups the elements of a thermal zone with the same orientation and
+    tilt, see ThermalZone.group_facades(). The elements of each list keep
+    the order of the element list of the thermal zone.
+
+    Parameters
+    ----------
+    orientation : float [degree]
+        Azimuth of the facade
+    tilt : float [degree]
+        Tilt against the horizontal of the facade
+    element_lists : tuple
+        Names of the grouped element lists of the thermal zone, e.g.
+        "outer_walls", "windows"
+
+    Attributes
+    ----------
+    orientation : float [degree]
+        Azimuth of the facade
+    tilt : float [degree]
+        Tilt against the horizontal of the facade
+    elements : dict
+        Elements of the facade for each element list
+    """
+
+    def __init__(self, orientation, tilt, element_lists):
+
+        self.orientation = orientation
+        self.tilt = tilt
+        self.elements = {name: [] for name in element_lists}
+
+    def get(self, *element_lists):
+        """Elements of the given element lists as one list"""
+
+        return [
+            element for name in element_lists for element in self.elements[name]
+        ]
+
+    def window_shading(self):
+        """Area weighted mean of the shading parameters of the windows
+
+        Returns
+        -------
+        shading_g_total : float
+            Area weighted mean of shading_g_total of the windows
+        shading_max_irr : float
+            Area weighted mean of shading_max_irr of the windows
+        """
+
+        wins = self.elements["windows"]
+        area = sum([win.area for win in wins])
+        return (
+            sum([win.shading_g_total * win.area / area for win in wins]),
+            sum([win.shading_max_irr * win.area / area for win in wins]),
+        )
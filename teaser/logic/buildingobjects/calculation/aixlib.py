@@ -1,9 +1,9 @@
 """This module includes AixLib calculation class."""
 
 import teaser.logic.utilities as utilities
+import teaser.data.output.matfile_output as matfile_output
 from itertools import cycle, islice
 import os
-import pandas as pd
 
 
 class AixLib(object):
@@ -29,6 +29,10 @@ class AixLib(object):
         Filename for AHU boundary conditions file
     file_internal_gains : str
         Filename for internal gains file
+    file_format : str
+        Format of the boundary condition files, 'txt' for text files
+        (default) or 'mat' for binary matfiles (-v4). Setting the format
+        changes the extension of the file names.
     version : str
         Used AixLib version, default should always be current master version
         of GitHub
@@ -61,6 +65,7 @@ class AixLib(object):
         self.file_set_t_cool = "TsetCool_" + self.parent.name + ".txt"
         self.file_ahu = "AHU_" + self.parent.name + ".txt"
         self.file_internal_gains = "InternalGains_" + self.parent.name + ".txt"
+        self._file_format = "txt"
         self.version = "1.0.0"
         self.total_surface_area = None
         self.consider_heat_capacity = True
@@ -68,6 +73,26 @@ class AixLib(object):
         self.use_set_point_temperature_profile_heating = False
         self.use_set_back_cool = False
 
+    @property
+    def file_format(self):
+        return self._file_format
+
+    @file_format.setter
+    def file_format(self, value):
+        ass_error_1 = "file_format has to be 'txt' or 'mat'"
+
+        assert value in ["txt", "mat"], ass_error_1
+
+        self._file_format = value
+        for attribute in [
+            "file_set_t_heat",
+            "file_set_t_cool",
+            "file_ahu",
+            "file_internal_gains",
+        ]:
+            file_name = os.path.splitext(getattr(self, attribute))[0]
+            setattr(self, attribute, file_name + "." + value)
+
     def calc_auxiliary_attr(self):
         """Call function to calculate all auxiliary attributes for AixLib."""
         self._calc_surface_area()
@@ -103,7 +128,7 @@ class AixLib(object):
         self.total_surface_area = surf_area_temp
 
     def modelica_set_temp(self, path=None):
-        """Create .txt file for set temperatures for heating.
+        """Create .txt or .mat file for set temperatures for heating.
 
         This function creates a txt for set temperatures of each
         zone, that are all saved into one matrix.
@@ -114,6 +139,8 @@ class AixLib(object):
             optional path, when matfile is exported separately
 
         """
+        import pandas as pd
+
         if path is None:
             path = utilities.get_default_path()
         else:
@@ -123,28 +150,19 @@ class AixLib(object):
         path = os.path.join(path, self.file_set_t_heat)
 
         export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
+            index=utilities.get_year_index(),
             columns=[zone.name for zone in self.parent.thermal_zones],
         )
 
         for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
+            export[zone_count.name] = zone_count.use_conditions.profile(
                 "heating_profile"
-            ]
+            ).year_values
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        self._write_table(path=path, name="Tset", export=export)
 
     def modelica_set_temp_cool(self, path=None):
-        """Create .txt file for set temperatures cooling.
+        """Create .txt or .mat file for set temperatures cooling.
 
         This function creates a txt for set temperatures for cooling
         of each zone, that are all saved into one matrix.
@@ -156,6 +174,8 @@ class AixLib(object):
             optional path, when matfile is exported separately
 
         """
+        import pandas as pd
+
         if path is None:
             path = utilities.get_default_path()
         else:
@@ -165,28 +185,19 @@ class AixLib(object):
         path = os.path.join(path, self.file_set_t_cool)
 
         export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
+            index=utilities.get_year_index(),
             columns=[zone.name for zone in self.parent.thermal_zones],
         )
 
         for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
+            export[zone_count.name] = zone_count.use_conditions.profile(
                 "cooling_profile"
-            ]
+            ).year_values
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        self._write_table(path=path, name="Tset", export=export)
 
     def modelica_AHU_boundary(self, path=None):
-        """Create .txt file for AHU boundary conditions (building).
+        """Create .txt or .mat file for AHU boundary conditions (building).
 
         This function creates a txt for building AHU boundary
         conditions
@@ -214,6 +225,8 @@ class AixLib(object):
             timeline of desired relative v_flow of the AHU simulation (0..1)
 
         """
+        import pandas as pd
+
         if path is None:
             path = utilities.get_default_path()
         else:
@@ -223,33 +236,36 @@ class AixLib(object):
         path = os.path.join(path, self.file_ahu)
 
         if self.parent.with_ahu is True:
-            export = self.parent.central_ahu.schedules
-        else:  # Dummy values for Input Table
+            ahu = self.parent.central_ahu
             export = pd.DataFrame(
-                index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-                .to_series()
-                .dt.strftime("%m-%d %H:%M:%S")
+                index=utilities.get_year_index(),
+                data={
+                    name: ahu.profile(name).year_values
+                    for name in (
+                        "temperature_profile",
+                        "min_relative_humidity_profile",
+                        "max_relative_humidity_profile",
+                        "v_flow_profile",
+                    )
+                },
             )
+        else:  # Dummy values for Input Table
+            export = pd.DataFrame(index=utilities.get_year_index())
 
             export["temperature_profile"] = list(islice(cycle([293.15, 293.15]), 8760))
             export["min_relative_humidity_profile"] = list(islice(cycle([0, 0]), 8760))
             export["max_relative_humidity_profile"] = list(islice(cycle([1, 1]), 8760))
             export["v_flow_profile"] = list(islice(cycle([0, 1]), 8760))
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write("double AHU({}, {})\n".format(8760, 5))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        self._write_table(path=path, name="AHU", export=export)
 
     def modelica_gains_boundary(self, path=None):
-        """Create .txt file for internal gains boundary conditions.
+        """Create .txt or .mat file for internal gains boundary conditions.
 
-        This function creates a matfile (-v4) for building internal gains
-        boundary conditions. It collects all internal gain profiles of the
-        zones and stores them into one file. The file is extended for each
-        zone. Only applicable if zones are defined
+        This function creates a txt or matfile (-v4, see file_format) for
+        building internal gains boundary conditions. It collects all internal
+        gain profiles of the zones and stores them into one file. The file is
+        extended for each zone. Only applicable if zones are defined
 
         1. Column : time step
         2,5,8,...  Column : profile_persons
@@ -267,6 +283,8 @@ class AixLib(object):
             optional path, when matfile is exported separately
 
         """
+        import pandas as pd
+
         if path is None:
             path = utilities.get_default_path()
         else:
@@ -275,33 +293,57 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
+        data = {}
         for zone_count in self.parent.thermal_zones:
-            export[
-                "person_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["persons_profile"]
-            export[
-                "machines_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["machines_profile"]
-            export[
-                "lighting_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["lighting_profile"]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
+            use_conditions = zone_count.use_conditions
+            data["person_{}".format(zone_count.name)] = (
+                use_conditions.profile("persons_profile").year_values
+            )
+            data["machines_{}".format(zone_count.name)] = (
+                use_conditions.profile("machines_profile").year_values
+            )
+            data["lighting_{}".format(zone_count.name)] = (
+                use_conditions.profile("lighting_profile").year_values
+            )
+        export = pd.DataFrame(index=utilities.get_year_index(), data=data)
+
+        self._write_table(path=path, name="Internals", export=export)
+
+    def _write_table(self, path, name, export):
+        """Write a boundary condition table for a Modelica CombiTimeTable.
+
+        The first column of the table is the time at the end of each hour,
+        followed by the columns of export. Depending on file_format the
+        table is written as text or as matfile (-v4).
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+        name : str
+            Name of the table (tableName in Modelica), e.g. "Tset"
+        export : pandas.DataFrame
+            Hourly values of one year, one column per profile
+
+        """
+        time = [(i + 1) * 3600 for i in range(len(export))]
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
+        if self.file_format == "mat":
+            import numpy as np
+
+            matfile_output.write_matrix(
+                path, name, np.column_stack((time, export.to_numpy(dtype=float)))
             )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        else:
+            export.index = time
+            with open(path, "a") as f:
+                f.write("#1\n")
+                f.write(
+                    "double {}({}, {})\n".format(
+                        name, len(export), len(export.columns) + 1
+                    )
+                )
+                export.to_csv(f, sep="\t", header=False, index_label=False)
 
     def _delete_file(self, path):
         """Delete a file before new information is written to it.
@@ -1,8 +1,8 @@
 """This module includes IBPSA calculation class."""
 
 import os
-import pandas as pd
 import teaser.logic.utilities as utilities
+import teaser.data.output.matfile_output as matfile_output
 
 
 class IBPSA(object):
@@ -27,6 +27,10 @@ class IBPSA(object):
     consider_heat_capacity : bool
         decides whether air capacity is considered or not for all thermal
         zones in the building
+    file_format : str
+        Format of the internal gains files, 'txt' for text files (default)
+        or 'mat' for binary matfiles (-v4). The export names the files with
+        this extension.
 
 
     """
@@ -42,15 +46,28 @@ class IBPSA(object):
             "IDEAS": "2.1.0",
         }
         self.consider_heat_capacity = True
+        self.file_format = "txt"
+
+    @property
+    def file_format(self):
+        return self._file_format
+
+    @file_format.setter
+    def file_format(self, value):
+        ass_error_1 = "file_format has to be 'txt' or 'mat'"
+
+        assert value in ["txt", "mat"], ass_error_1
+
+        self._file_format = value
 
     def modelica_gains_boundary(self, zone, path=None):
         """creates .mat file for internal gains boundary conditions
 
-        This function creates a matfile (-v4) for building internal gains
-        boundary conditions. It collects internal gain profiles of a specific
-        zones and stores them into one file. It also calculates the internal
-        gains from relative presence and values for heat output into W for
-        direct usage in Annex models.
+        This function creates a txt or matfile (-v4, see file_format) for
+        building internal gains boundary conditions. It collects internal
+        gain profiles of a specific zones and stores them into one file. It
+        also calculates the internal gains from relative presence and values
+        for heat output into W for direct usage in Annex models.
 
         Only person (convective and radiative) and machines (convective) are
         used in the simple Annex 60 examples.
@@ -75,6 +92,8 @@ class IBPSA(object):
             optional path, when matfile is exported separately
 
         """
+        import pandas as pd
+
         if path is None:
             path = utilities.get_default_path()
         else:
@@ -83,28 +102,26 @@ class IBPSA(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
+        export = pd.DataFrame(index=utilities.get_year_index())
+        persons_profile = zone.use_conditions.profile("persons_profile").year_values
+        machines_profile = zone.use_conditions.profile("machines_profile").year_values
 
         export["person_rad_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
+            persons_profile
             * (1 - zone.use_conditions.ratio_conv_rad_persons)
             * zone.use_conditions.fixed_heat_flow_rate_persons
             * zone.use_conditions.persons
             * zone.area
         )
         export["person_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
+            persons_profile
             * zone.use_conditions.ratio_conv_rad_persons
             * zone.use_conditions.fixed_heat_flow_rate_persons
             * zone.use_conditions.persons
             * zone.area
         )
         export["machines_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["machines_profile"]
+            machines_profile
             * zone.use_conditions.ratio_conv_rad_machines
             * zone.use_conditions.machines
             * zone.area
@@ -112,6 +129,14 @@ class IBPSA(object):
 
         export.index = [(i + 1) * 3600 for i in range(8760)]
         self._delete_file(path=path)
+        if self.file_format == "mat":
+            import numpy as np
+
+            table = np.column_stack((export.index, export.to_numpy(dtype=float)))
+            # first row with t=0
+            table = np.vstack((np.r_[0.0, table[0, 1:]], table))
+            matfile_output.write_matrix(path, "Internals", table)
+            return
         with open(path, "a") as f:
             f.write("#1\n")
             # The size of the dataset is always 4 columns as each thermal zone has its own data file.
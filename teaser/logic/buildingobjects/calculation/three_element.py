@@ -4,6 +4,14 @@ from __future__ import division
 import math
 import random
 import warnings
+from teaser.logic.buildingobjects.buildingphysics.wall import (
+    calc_equivalent_res_batch,
+)
+from teaser.logic.buildingobjects.calculation.aggregation import (
+    add_sums,
+    calc_parallel_connection,
+    sum_elements,
+)
 
 
 class ThreeElement(object):
@@ -459,13 +467,20 @@ class ThreeElement(object):
     def calc_attributes(self):
         """Calls all necessary function to calculate model attributes"""
 
+        calc_equivalent_res_batch(
+            self.thermal_zone.outer_walls
+            + self.thermal_zone.rooftops
+            + self.thermal_zone.ground_floors
+            + self.thermal_zone.inner_walls
+            + self.thermal_zone.floors
+            + self.thermal_zone.ceilings
+        )
+
         outer_walls = self.thermal_zone.outer_walls + self.thermal_zone.rooftops
 
         for out_wall in outer_walls:
-            out_wall.calc_equivalent_res()
             out_wall.calc_ua_value()
         for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res()
             gf.calc_ua_value()
         for win in self.thermal_zone.windows:
             win.calc_equivalent_res()
@@ -475,7 +490,6 @@ class ThreeElement(object):
             + self.thermal_zone.floors
             + self.thermal_zone.ceilings
         ):
-            inner_wall.calc_equivalent_res()
             inner_wall.calc_ua_value()
 
         self.set_calc_default()
@@ -563,88 +577,11 @@ class ThreeElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
-
-            if wall_count == 0:
-
-                r1 = (
-                    element_list[wall_count].r1 * element_list[wall_count].c1 ** 2
-                    + element_list[wall_count + 1].r1
-                    * element_list[wall_count + 1].c1 ** 2
-                    + omega ** 2
-                    * element_list[wall_count].r1
-                    * element_list[wall_count + 1].r1
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    (element_list[wall_count].c1 + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    ** 2
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                )
-
-                c1 = (
-                    (element_list[wall_count].c1 + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    ** 2
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    element_list[wall_count].c1
-                    + element_list[wall_count + 1].c1
-                    + omega ** 2
-                    * (
-                        element_list[wall_count].r1 ** 2 * element_list[wall_count].c1
-                        + element_list[wall_count + 1].r1 ** 2
-                        * element_list[wall_count + 1].c1
-                    )
-                    * element_list[wall_count].c1
-                    * element_list[wall_count + 1].c1
-                )
-            else:
-                r1x = r1
-                c1x = c1
-                r1 = (
-                    r1x * c1x ** 2
-                    + element_list[wall_count + 1].r1
-                    * element_list[wall_count + 1].c1 ** 2
-                    + omega ** 2
-                    * r1x
-                    * element_list[wall_count + 1].r1
-                    * (r1x + element_list[wall_count + 1].r1)
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    (c1x + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (r1x + element_list[wall_count + 1].r1) ** 2
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                )
-
-                c1 = (
-                    (c1x + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (r1x + element_list[wall_count + 1].r1) ** 2
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    c1x
-                    + element_list[wall_count + 1].c1
-                    + omega ** 2
-                    * (
-                        r1x ** 2 * c1x
-                        + element_list[wall_count + 1].r1 ** 2
-                        * element_list[wall_count + 1].c1
-                    )
-                    * c1x
-                    * element_list[wall_count + 1].c1
-                )
-        return r1, c1
+        return calc_parallel_connection(
+            [element.r1 for element in element_list],
+            [element.c1 for element in element_list],
+            omega,
+        )
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -658,43 +595,22 @@ class ThreeElement(object):
 
         """
 
-        self.area_ow = sum(
-            out_wall.area for out_wall in self.thermal_zone.outer_walls
-        ) + sum(roof.area for roof in self.thermal_zone.rooftops)
+        sums = add_sums(
+            sum_elements(self.thermal_zone.outer_walls, ambient=True),
+            sum_elements(self.thermal_zone.rooftops, ambient=True),
+        )
 
-        self.ua_value_ow = sum(
-            out_wall.ua_value for out_wall in self.thermal_zone.outer_walls
-        ) + sum(roof.ua_value for roof in self.thermal_zone.rooftops)
+        self.area_ow = sums["area"]
+        self.ua_value_ow = sums["ua_value"]
 
         self.r_total_ow = 1 / self.ua_value_ow
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_conv for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_inner_conv for roof in self.thermal_zone.rooftops)
-        )
-
-        self.r_rad_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_rad for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_inner_rad for roof in self.thermal_zone.rooftops)
-        )
-
-        self.r_comb_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_comb for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_inner_comb for roof in self.thermal_zone.rooftops)
-        )
-
-        self.ir_emissivity_inner_ow = (
-            sum(
-                out_wall.layer[0].material.ir_emissivity * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-            + sum(
-                roof.layer[0].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-        ) / self.area_ow
+        self.r_conv_inner_ow = 1 / sums["inv_r_inner_conv"]
+        self.r_rad_inner_ow = 1 / sums["inv_r_inner_rad"]
+        self.r_comb_inner_ow = 1 / sums["inv_r_inner_comb"]
+        self.ir_emissivity_inner_ow = sums["ir_emissivity_inner"] / self.area_ow
 
         self.alpha_conv_inner_ow = 1 / (self.r_conv_inner_ow * self.area_ow)
         self.alpha_rad_inner_ow = 1 / (self.r_rad_inner_ow * self.area_ow)
@@ -703,40 +619,11 @@ class ThreeElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        self.r_conv_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_conv for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_conv for roof in self.thermal_zone.rooftops)
-        )
-        self.r_rad_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_rad for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_rad for roof in self.thermal_zone.rooftops)
-        )
-        self.r_comb_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_comb for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_comb for roof in self.thermal_zone.rooftops)
-        )
-
-        self.ir_emissivity_outer_ow = (
-            sum(
-                out_wall.layer[-1].material.ir_emissivity * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-            + sum(
-                roof.layer[-1].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-        ) / self.area_ow
-
-        self.solar_absorp_ow = (
-            sum(
-                out_wall.layer[-1].material.solar_absorp * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-            + sum(
-                roof.layer[-1].material.solar_absorp * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-        ) / self.area_ow
+        self.r_conv_outer_ow = 1 / sums["inv_r_outer_conv"]
+        self.r_rad_outer_ow = 1 / sums["inv_r_outer_rad"]
+        self.r_comb_outer_ow = 1 / sums["inv_r_outer_comb"]
+        self.ir_emissivity_outer_ow = sums["ir_emissivity_outer"] / self.area_ow
+        self.solar_absorp_ow = sums["solar_absorp"] / self.area_ow
 
         self.alpha_conv_outer_ow = 1 / (self.r_conv_outer_ow * self.area_ow)
         self.alpha_rad_outer_ow = 1 / (self.r_rad_outer_ow * self.area_ow)
@@ -752,35 +639,19 @@ class ThreeElement(object):
 
         """
 
-        self.area_gf = sum(ground.area for ground in self.thermal_zone.ground_floors)
+        sums = sum_elements(self.thermal_zone.ground_floors)
 
-        self.ua_value_gf = sum(
-            ground.ua_value for ground in self.thermal_zone.ground_floors
-        )
+        self.area_gf = sums["area"]
+        self.ua_value_gf = sums["ua_value"]
 
         self.r_total_gf = 1 / self.ua_value_gf
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_gf = 1 / sum(
-            1 / ground.r_inner_conv for ground in self.thermal_zone.ground_floors
-        )
-
-        self.r_rad_inner_gf = 1 / sum(
-            1 / ground.r_inner_rad for ground in self.thermal_zone.ground_floors
-        )
-
-        self.r_comb_inner_gf = 1 / sum(
-            1 / ground.r_inner_comb for ground in self.thermal_zone.ground_floors
-        )
-
-        self.ir_emissivity_inner_gf = (
-            sum(
-                ground.layer[0].material.ir_emissivity * ground.area
-                for ground in self.thermal_zone.ground_floors
-            )
-            / self.area_gf
-        )
+        self.r_conv_inner_gf = 1 / sums["inv_r_inner_conv"]
+        self.r_rad_inner_gf = 1 / sums["inv_r_inner_rad"]
+        self.r_comb_inner_gf = 1 / sums["inv_r_inner_comb"]
+        self.ir_emissivity_inner_gf = sums["ir_emissivity_inner"] / self.area_gf
 
         self.alpha_conv_inner_gf = 1 / (self.r_conv_inner_gf * self.area_gf)
         self.alpha_rad_inner_gf = 1 / (self.r_rad_inner_gf * self.area_gf)
@@ -801,52 +672,22 @@ class ThreeElement(object):
         currently not supported.
 
         """
-        self.area_iw = (
-            sum(in_wall.area for in_wall in self.thermal_zone.inner_walls)
-            + sum(floor.area for floor in self.thermal_zone.floors)
-            + sum(ceiling.area for ceiling in self.thermal_zone.ceilings)
-        )
 
-        self.ua_value_iw = (
-            sum(in_wall.ua_value for in_wall in self.thermal_zone.inner_walls)
-            + sum(floor.ua_value for floor in self.thermal_zone.floors)
-            + sum(ceiling.ua_value for ceiling in self.thermal_zone.ceilings)
+        sums = add_sums(
+            sum_elements(self.thermal_zone.inner_walls),
+            sum_elements(self.thermal_zone.floors),
+            sum_elements(self.thermal_zone.ceilings),
         )
 
-        # values facing the inside of the thermal zone
+        self.area_iw = sums["area"]
+        self.ua_value_iw = sums["ua_value"]
 
-        self.r_conv_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_conv for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_conv for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_conv for ceiling in self.thermal_zone.ceilings)
-        )
-
-        self.r_rad_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_rad for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_rad for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_rad for ceiling in self.thermal_zone.ceilings)
-        )
-
-        self.r_comb_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_comb for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_comb for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_comb for ceiling in self.thermal_zone.ceilings)
-        )
+        # values facing the inside of the thermal zone
 
-        self.ir_emissivity_inner_iw = (
-            sum(
-                in_wall.layer[0].material.ir_emissivity * in_wall.area
-                for in_wall in self.thermal_zone.inner_walls
-            )
-            + sum(
-                floor.layer[0].material.ir_emissivity * floor.area
-                for floor in self.thermal_zone.floors
-            )
-            + sum(
-                ceiling.layer[0].material.ir_emissivity * ceiling.area
-                for ceiling in self.thermal_zone.ceilings
-            )
-        ) / self.area_iw
+        self.r_conv_inner_iw = 1 / sums["inv_r_inner_conv"]
+        self.r_rad_inner_iw = 1 / sums["inv_r_inner_rad"]
+        self.r_comb_inner_iw = 1 / sums["inv_r_inner_comb"]
+        self.ir_emissivity_inner_iw = sums["ir_emissivity_inner"] / self.area_iw
 
         self.alpha_conv_inner_iw = 1 / (self.r_conv_inner_iw * self.area_iw)
         self.alpha_rad_inner_iw = 1 / (self.r_rad_inner_iw * self.area_iw)
@@ -854,6 +695,8 @@ class ThreeElement(object):
 
         # adjacent thermal zones are not supported!
 
+        # adjacent thermal zones are not supported!
+
     def _sum_window_elements(self):
         """Sum attributes for window elements
 
@@ -864,74 +707,32 @@ class ThreeElement(object):
         Function is identical for TwoElement, ThreeElement and FourElement.
         """
 
-        self.area_win = sum(win.area for win in self.thermal_zone.windows)
-        self.ua_value_win = sum(win.ua_value for win in self.thermal_zone.windows)
+        sums = sum_elements(self.thermal_zone.windows, ambient=True, windows=True)
+
+        self.area_win = sums["area"]
+        self.ua_value_win = sums["ua_value"]
         self.u_value_win = self.ua_value_win / self.area_win
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_win = 1 / (
-            sum(1 / win.r_inner_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_inner_win = 1 / (
-            sum(1 / win.r_inner_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_inner_win = 1 / (
-            sum(1 / win.r_inner_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_inner_win = (
-            sum(
-                win.layer[0].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
+        self.r_conv_inner_win = 1 / sums["inv_r_inner_conv"]
+        self.r_rad_inner_win = 1 / sums["inv_r_inner_rad"]
+        self.r_comb_inner_win = 1 / sums["inv_r_inner_comb"]
+        self.ir_emissivity_inner_win = sums["ir_emissivity_inner"] / self.area_win
 
         self.alpha_conv_inner_win = 1 / (self.r_conv_inner_win * self.area_win)
         self.alpha_rad_inner_win = 1 / (self.r_rad_inner_win * self.area_win)
         self.alpha_comb_inner_win = 1 / (self.r_comb_inner_win * self.area_win)
-        self.ratio_conv_rad_inner_win = (
-            sum(win.a_conv * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ratio_conv_rad_inner_win = sums["a_conv"] / self.area_win
 
         # values facing the ambient
 
-        self.r_conv_outer_win = 1 / (
-            sum(1 / win.r_outer_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_outer_win = 1 / (
-            sum(1 / win.r_outer_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_outer_win = 1 / (
-            sum(1 / win.r_outer_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_win = (
-            sum(
-                win.layer[-1].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.solar_absorp_win = (
-            sum(
-                win.layer[-1].material.solar_absorp * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.weighted_g_value = (
-            sum(win.g_value * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.r_conv_outer_win = 1 / sums["inv_r_outer_conv"]
+        self.r_rad_outer_win = 1 / sums["inv_r_outer_rad"]
+        self.r_comb_outer_win = 1 / sums["inv_r_outer_comb"]
+        self.ir_emissivity_win = sums["ir_emissivity_outer"] / self.area_win
+        self.solar_absorp_win = sums["solar_absorp"] / self.area_win
+        self.weighted_g_value = sums["g_value"] / self.area_win
 
         self.alpha_conv_outer_win = 1 / (self.r_conv_outer_win * self.area_win)
         self.alpha_rad_outer_win = 1 / (self.r_rad_outer_win * self.area_win)
@@ -1091,8 +892,8 @@ class ThreeElement(object):
             + self.thermal_zone.ceilings
         )
 
+        calc_equivalent_res_batch(inner_walls)
         for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
             in_wall.calc_ua_value()
 
         if 0 < len(inner_walls) <= 1:
@@ -1185,22 +986,13 @@ class ThreeElement(object):
         elements and then creates lists for zone weightfactors, orientation,
         tilt, ares and sunblinds."""
 
-        outer_elements = (
-            self.thermal_zone.outer_walls
-            + self.thermal_zone.rooftops
-            + self.thermal_zone.windows
+        facades = self.thermal_zone.group_facades(
+            "outer_walls", "rooftops", "windows"
         )
 
-        tilt_orient = []
-        for element in outer_elements:
-            tilt_orient.append((element.orientation, element.tilt))
-        tilt_orient = list(set(tilt_orient))
-
-        for i in tilt_orient:
-            wall_rt = self.thermal_zone.find_walls(
-                i[0], i[1]
-            ) + self.thermal_zone.find_rts(i[0], i[1])
-            wins = self.thermal_zone.find_wins(i[0], i[1])
+        for facade in facades:
+            wall_rt = facade.get("outer_walls", "rooftops")
+            wins = facade.get("windows")
 
             if self.merge_windows is True:
                 self.facade_areas.append(
@@ -1209,8 +1001,8 @@ class ThreeElement(object):
             else:
                 self.facade_areas.append(sum([element.area for element in (wall_rt)]))
 
-            self.orientation_facade.append(i[0])
-            self.tilt_facade.append(i[1])
+            self.orientation_facade.append(facade.orientation)
+            self.tilt_facade.append(facade.tilt)
 
             if not wall_rt:
                 self.weightfactor_ow.append(0.0)
@@ -1234,22 +1026,9 @@ class ThreeElement(object):
                 else:
                     self.window_areas.append(0)
                     self.transparent_areas.append(sum([win.area for win in wins]))
-                self.shading_g_total.append(
-                    sum(
-                        [
-                            win.shading_g_total * win.area / sum([w.area for w in wins])
-                            for win in wins
-                        ]
-                    )
-                )
-                self.shading_max_irr.append(
-                    sum(
-                        [
-                            win.shading_max_irr * win.area / sum([w.area for w in wins])
-                            for win in wins
-                        ]
-                    )
-                )
+                shading_g_total, shading_max_irr = facade.window_shading()
+                self.shading_g_total.append(shading_g_total)
+                self.shading_max_irr.append(shading_max_irr)
 
     def _calc_heat_load(self):
         """Static heat load calculation
@@ -11,6 +11,75 @@ from teaser.logic.buildingobjects.calculation.one_element import OneElement
 from teaser.logic.buildingobjects.calculation.two_element import TwoElement
 from teaser.logic.buildingobjects.calculation.three_element import ThreeElement
 from teaser.logic.buildingobjects.calculation.four_element import FourElement
+from teaser.logic.buildingobjects.calculation.aggregation import Facade
+
+ELEMENT_LISTS = {
+    "OuterWall": "outer_walls",
+    "Door": "doors",
+    "Rooftop": "rooftops",
+    "GroundFloor": "ground_floors",
+    "Window": "windows",
+    "InnerWall": "inner_walls",
+    "Floor": "floors",
+    "Ceiling": "ceilings",
+}
+
+
+def _resets_index(method):
+    """Wraps a list method to reset the orientation index of the zone"""
+
+    def wrapper(self, *args, **kwargs):
+        if self.zone is not None:
+            self.zone._orientation_index = None
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class ElementList(list):
+    """List of the building elements of one kind in a thermal zone
+
+    Keeps the orientation index of the thermal zone up to date, see
+    ThermalZone.get_elements(). Appending and removing elements updates the
+    index, all other changes of the list reset it.
+
+    Parameters
+    ----------
+    zone : ThermalZone()
+        Thermal zone the list belongs to
+    name : str
+        Name of the list in the thermal zone, e.g. "outer_walls"
+    """
+
+    zone = None
+    name = None
+
+    def __init__(self, zone, name):
+        super(ElementList, self).__init__()
+        self.zone = zone
+        self.name = name
+
+    def append(self, element):
+        super(ElementList, self).append(element)
+        if self.zone is not None:
+            self.zone._index_element(self.name, element)
+
+    def remove(self, element):
+        super(ElementList, self).remove(element)
+        if self.zone is not None:
+            self.zone._unindex_element(self.name, element, element.orientation)
+
+    extend = _resets_index(list.extend)
+    insert = _resets_index(list.insert)
+    pop = _resets_index(list.pop)
+    clear = _resets_index(list.clear)
+    sort = _resets_index(list.sort)
+    reverse = _resets_index(list.reverse)
+    __setitem__ = _resets_index(list.__setitem__)
+    __delitem__ = _resets_index(list.__delitem__)
+    __iadd__ = _resets_index(list.__iadd__)
+    __imul__ = _resets_index(list.__imul__)
 
 
 class ThermalZone(object):
@@ -90,14 +159,15 @@ class ThermalZone(object):
         self._area = None
         self._volume = None
         self._infiltration_rate = 0.4
-        self._outer_walls = []
-        self._doors = []
-        self._rooftops = []
-        self._ground_floors = []
-        self._windows = []
-        self._inner_walls = []
-        self._floors = []
-        self._ceilings = []
+        self._orientation_index = None
+        self._outer_walls = ElementList(self, "outer_walls")
+        self._doors = ElementList(self, "doors")
+        self._rooftops = ElementList(self, "rooftops")
+        self._ground_floors = ElementList(self, "ground_floors")
+        self._windows = ElementList(self, "windows")
+        self._inner_walls = ElementList(self, "inner_walls")
+        self._floors = ElementList(self, "floors")
+        self._ceilings = ElementList(self, "ceilings")
         self._use_conditions = None
         self._t_inside = 293.15
         self._t_outside = 261.15
@@ -297,6 +367,99 @@ class ThermalZone(object):
                 pass
         return elements
 
+    def group_facades(self, *element_lists):
+        """Groups outer elements with the same orientation and tilt
+
+        Sorts the elements of the given element lists in one pass into
+        facades of the same orientation and tilt. This replaces calling
+        find_walls(), find_wins() etc. for each combination of orientation
+        and tilt.
+
+        Parameters
+        ----------
+        element_lists : str
+            Names of the element lists, e.g. "outer_walls", "windows"
+
+        Returns
+        -------
+        facades : list
+            List of Facade instances, one for each combination of orientation
+            and tilt of the elements. The order is the one of the set of all
+            combinations, as used by the calculation classes.
+        """
+        facades = {}
+        for name in element_lists:
+            for element in getattr(self, name):
+                key = (element.orientation, element.tilt)
+                facade = facades.get(key)
+                if facade is None:
+                    facade = Facade(key[0], key[1], element_lists)
+                    facades[key] = facade
+                facade.elements[name].append(element)
+        # iterate in the order of a set filled element by element, a set
+        # created directly from the dict may differ in size and order
+        return [facades[key] for key in set(list(facades))]
+
+    def get_elements(self, element_list, orientation):
+        """Returns all elements of one list with given orientation
+
+        The elements are looked up in an index of the elements grouped by
+        orientation, which is built on first use and kept up to date when
+        elements are added or removed or change their orientation.
+
+        Parameters
+        ----------
+        element_list : str
+            Name of the element list, e.g. "outer_walls" or "windows"
+        orientation : float [degree]
+            Azimuth of the desired elements.
+
+        Returns
+        -------
+        elements : list
+            List of the elements with desired orientation, in the order of
+            the element list.
+        """
+        if self._orientation_index is None:
+            self._orientation_index = {}
+            for name in ELEMENT_LISTS.values():
+                groups = {}
+                for element in getattr(self, name):
+                    groups.setdefault(element.orientation, []).append(element)
+                self._orientation_index[name] = groups
+        return list(self._orientation_index[element_list].get(orientation, ()))
+
+    def _index_element(self, element_list, element):
+        """Adds an element appended to an element list to the index"""
+        if self._orientation_index is not None:
+            self._orientation_index[element_list].setdefault(
+                getattr(element, "_orientation", None), []
+            ).append(element)
+
+    def _unindex_element(self, element_list, element, orientation):
+        """Removes an element from the index, resets the index if not found"""
+        if self._orientation_index is None:
+            return
+        group = self._orientation_index[element_list].get(orientation, ())
+        for i, grouped in enumerate(group):
+            if grouped is element:
+                del group[i]
+                return
+        self._orientation_index = None
+
+    def _reindex_element(self, element, old_orientation):
+        """Moves an element to its new orientation in the index"""
+        if self._orientation_index is None:
+            return
+        if element.orientation == old_orientation:
+            return
+        element_list = ELEMENT_LISTS.get(type(element).__name__)
+        if element_list is None:
+            self._orientation_index = None
+            return
+        self._unindex_element(element_list, element, old_orientation)
+        self._index_element(element_list, element)
+
     def set_inner_wall_area(self):
         """Sets the inner wall area according to zone area
 
@@ -496,7 +659,8 @@ class ThermalZone(object):
     @outer_walls.setter
     def outer_walls(self, value):
         if value is None:
-            self._outer_walls = []
+            self._outer_walls = ElementList(self, "outer_walls")
+            self._orientation_index = None
 
     @property
     def doors(self):
@@ -505,7 +669,8 @@ class ThermalZone(object):
     @doors.setter
     def doors(self, value):
         if value is None:
-            self._doors = []
+            self._doors = ElementList(self, "doors")
+            self._orientation_index = None
 
     @property
     def rooftops(self):
@@ -514,7 +679,8 @@ class ThermalZone(object):
     @rooftops.setter
     def rooftops(self, value):
         if value is None:
-            self._rooftops = []
+            self._rooftops = ElementList(self, "rooftops")
+            self._orientation_index = None
 
     @property
     def ground_floors(self):
@@ -523,7 +689,8 @@ class ThermalZone(object):
     @ground_floors.setter
     def ground_floors(self, value):
         if value is None:
-            self._ground_floors = []
+            self._ground_floors = ElementList(self, "ground_floors")
+            self._orientation_index = None
 
     @property
     def ceilings(self):
@@ -532,7 +699,8 @@ class ThermalZone(object):
     @ceilings.setter
     def ceilings(self, value):
         if value is None:
-            self._ceilings = []
+            self._ceilings = ElementList(self, "ceilings")
+            self._orientation_index = None
 
     @property
     def floors(self):
@@ -541,7 +709,8 @@ class ThermalZone(object):
     @floors.setter
     def floors(self, value):
         if value is None:
-            self._floors = []
+            self._floors = ElementList(self, "floors")
+            self._orientation_index = None
 
     @property
     def inner_walls(self):
@@ -551,7 +720,8 @@ class ThermalZone(object):
     def inner_walls(self, value):
 
         if value is None:
-            self._inner_walls = []
+            self._inner_walls = ElementList(self, "inner_walls")
+            self._orientation_index = None
 
     @property
     def windows(self):
@@ -561,7 +731,8 @@ class ThermalZone(object):
     def windows(self, value):
 
         if value is None:
-            self._windows = []
+            self._windows = ElementList(self, "windows")
+            self._orientation_index = None
 
     @property
     def use_conditions(self):
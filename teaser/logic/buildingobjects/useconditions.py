@@ -2,13 +2,12 @@
 import random
 import teaser.data.input.usecond_input as usecond_input
 import teaser.data.output.usecond_output as usecond_output
-import pandas as pd
-from itertools import cycle, islice
 from collections import OrderedDict
 from teaser.logic.utilities import division_from_json
+from teaser.logic.profile import ProfileSchedules
 
 
-class UseConditions(object):
+class UseConditions(ProfileSchedules):
     """UseConditions class contains all zone specific boundary conditions.
 
     Class that contains the boundary conditions of use for buildings defined in
@@ -184,10 +183,23 @@ class UseConditions(object):
     schedules: pandas.DataFrame
         All time dependent boundary attributes in one pandas DataFrame, used
         for export (one year in hourly timestep.)
-        Note: python attribute, not customizable by user (derived from Json)
+        The DataFrame is built on first access and kept, changes to its
+        values are written back into the profiles. Assigning a DataFrame
+        with 8760 rows sets the profiles of its columns, its index is
+        ignored. Profiles are stored as shared, interned patterns (see
+        teaser.logic.profile and profile()) and read as lists which can't be
+        changed in place, assign a new list to change a profile.
 
     """
 
+    _profile_names = (
+        "heating_profile",
+        "cooling_profile",
+        "persons_profile",
+        "lighting_profile",
+        "machines_profile",
+    )
+
     def __init__(self, parent=None):
         """Construct UseConditions."""
         self.internal_id = random.random()
@@ -228,7 +240,7 @@ class UseConditions(object):
 
         self._with_ideal_thresholds = False
 
-        self._heating_profile = [
+        self.heating_profile = [
             294.15,
             294.15,
             294.15,
@@ -254,7 +266,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._cooling_profile = [
+        self.cooling_profile = [
             294.15,
             294.15,
             294.15,
@@ -280,7 +292,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._persons_profile = [
+        self.persons_profile = [
             0.0,
             0.0,
             0.0,
@@ -306,7 +318,7 @@ class UseConditions(object):
             0.0,
             0.0,
         ]
-        self._machines_profile = [
+        self.machines_profile = [
             0.1,
             0.1,
             0.1,
@@ -332,7 +344,7 @@ class UseConditions(object):
             0.1,
             0.1,
         ]
-        self._lighting_profile = [
+        self.lighting_profile = [
             0.0,
             0.0,
             0.0,
@@ -359,19 +371,6 @@ class UseConditions(object):
             0.0,
         ]
 
-        self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            data={
-                "heating_profile": list(islice(cycle(self._heating_profile), 8760)),
-                "cooling_profile": list(islice(cycle(self._cooling_profile), 8760)),
-                "persons_profile": list(islice(cycle(self._persons_profile), 8760)),
-                "lighting_profile": list(islice(cycle(self._lighting_profile), 8760)),
-                "machines_profile": list(islice(cycle(self._machines_profile), 8760)),
-            },
-        )
-
     def load_use_conditions(self, zone_usage, data_class=None):
         """Load typical use conditions from JSON data base.
 
@@ -435,58 +434,43 @@ class UseConditions(object):
 
     @property
     def heating_profile(self):
-        return self._heating_profile
+        return self.profile("heating_profile").values
 
     @heating_profile.setter
     def heating_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._heating_profile = value
-        self.schedules["heating_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("heating_profile", value)
 
     @property
     def cooling_profile(self):
-        return self._cooling_profile
+        return self.profile("cooling_profile").values
 
     @cooling_profile.setter
     def cooling_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._cooling_profile = value
-        self.schedules["cooling_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("cooling_profile", value)
 
     @property
     def persons_profile(self):
-        return self._persons_profile
+        return self.profile("persons_profile").values
 
     @persons_profile.setter
     def persons_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._persons_profile = value
-        self.schedules["persons_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("persons_profile", value)
 
     @property
     def machines_profile(self):
-        return self._machines_profile
+        return self.profile("machines_profile").values
 
     @machines_profile.setter
     def machines_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._machines_profile = value
-        self.schedules["machines_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("machines_profile", value)
 
     @property
     def lighting_profile(self):
-        return self._lighting_profile
+        return self.profile("lighting_profile").values
 
     @lighting_profile.setter
     def lighting_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._lighting_profile = value
-        self.schedules["lighting_profile"] = list(islice(cycle(value), 8760))
+        self._set_profile("lighting_profile", value)
 
     @property
     def parent(self):
@@ -0,0 +1,332 @@
+# created October 2026
+
+"""Process pool support for building calculations of a project.
+
+Buildings of a project are independent of each other, so calculations like
+calc_building_parameter() or retrofit_building() and the Modelica export of
+the buildings can run in worker processes. The buildings are sent to the
+workers in chunks, the project they belong to is replaced by a stand-in
+project of the worker. The worker returns the processed buildings and their
+state is merged back into the original Building, BuildingAHU, ThermalZone,
+UseConditions, BuildingElement, Layer and Material objects, thus references
+to these objects stay valid. Objects created by the processing, e.g. the
+calculation attributes or the layers added by a retrofit, are new objects.
+
+Sending the buildings to the workers and merging the results is done in the
+calling process and costs about as much as calc_building_parameter() of
+simple archetype buildings. Using workers therefore only pays off for many
+buildings with expensive calculations on machines with several cores.
+
+On platforms starting worker processes with "spawn" (Windows, macOS) the
+calling script needs the usual ``if __name__ == "__main__":`` guard.
+"""
+
+import concurrent.futures
+import io
+import math
+import pickle
+import warnings
+
+_PROJECT_ID = "project"
+
+_worker_projects = {}
+
+
+class _BuildingPickler(pickle.Pickler):
+    """Pickler replacing the project of the buildings by a reference."""
+
+    def __init__(self, file, project):
+        super(_BuildingPickler, self).__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.project = project
+
+    def persistent_id(self, obj):
+        if obj is self.project:
+            return _PROJECT_ID
+        return None
+
+
+class _BuildingUnpickler(pickle.Unpickler):
+    """Unpickler resolving the reference to the project."""
+
+    def __init__(self, file, project):
+        super(_BuildingUnpickler, self).__init__(file)
+        self.project = project
+
+    def persistent_load(self, pid):
+        if pid == _PROJECT_ID:
+            return self.project
+        raise pickle.UnpicklingError("unsupported persistent id " + str(pid))
+
+
+def _dumps(obj, project):
+    buffer = io.BytesIO()
+    _BuildingPickler(buffer, project).dump(obj)
+    return buffer.getvalue()
+
+
+def _loads(data, project):
+    return _BuildingUnpickler(io.BytesIO(data), project).load()
+
+
+def data_class_args(data):
+    """Arguments to rebuild a DataClass in a worker process.
+
+    Parameters
+    ----------
+    data : DataClass
+        DataClass of the project or None
+
+    Returns
+    -------
+    args : tuple
+        used_statistic, path_tb, path_mat, path_uc and share_material_records
+        of the DataClass, None if data is None
+    """
+    if data is None:
+        return None
+    return (
+        data.used_statistic,
+        getattr(data, "path_tb", None),
+        data.path_mat,
+        data.path_uc,
+        data.share_material_records,
+    )
+
+
+def _worker_project(data_args):
+    """Stand-in project of a worker process, one per DataClass."""
+    try:
+        return _worker_projects[data_args]
+    except KeyError:
+        pass
+
+    from teaser.data.dataclass import DataClass
+    from teaser.project import Project
+
+    project = Project(load_data=False)
+    if data_args is not None:
+        used_statistic, path_tb, path_mat, path_uc, share_records = data_args
+        project.data = DataClass(used_statistic=used_statistic)
+        if path_tb is not None:
+            project.data.path_tb = path_tb
+        project.data.path_mat = path_mat
+        project.data.path_uc = path_uc
+        project.data.share_material_records = share_records
+    _worker_projects[data_args] = project
+    return project
+
+
+def _run_chunk(payload, task, kwargs, data_args, continue_on, merge=True):
+    """Call task on (or with) each building of a chunk in a worker process.
+
+    Returns the pickled list of (error, warnings) per building and the
+    processed buildings, None instead of the buildings if merge is False.
+    Processing of the chunk stops at the first error which is not an
+    instance of continue_on, remaining buildings get the error None and are
+    not merged.
+    """
+    project = _worker_project(data_args)
+    buildings = _loads(payload, project)
+    statuses = []
+    for building in buildings:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                if callable(task):
+                    task(building, **kwargs)
+                else:
+                    getattr(building, task)(**kwargs)
+                error = None
+            except Exception as e:
+                error = e
+        statuses.append(
+            (
+                error,
+                [(str(w.message), w.category, w.filename, w.lineno) for w in caught],
+            )
+        )
+        if error is not None and not isinstance(error, continue_on):
+            break
+    if not merge:
+        return _dumps((statuses, None), project)
+    return _dumps((statuses, buildings[: len(statuses)]), project)
+
+
+def _rebind(obj, old, new):
+    """Replace all references of obj to old by references to new."""
+    state = getattr(obj, "__dict__", None)
+    if state is None:
+        return
+    for key, value in state.items():
+        if value is old:
+            state[key] = new
+
+
+def _transplant(original, processed):
+    """Move the state of processed into original."""
+    original.__dict__.clear()
+    original.__dict__.update(processed.__dict__)
+
+
+def _merge(original, processed):
+    """Merge processed into original if both are objects of the same type.
+
+    Returns the object to keep, original if processed was merged into it,
+    otherwise processed.
+    """
+    if original is None or processed is None or original is processed:
+        return processed
+    if type(original) is not type(processed):
+        return processed
+    _transplant(original, processed)
+    return original
+
+
+def merge_building(building, processed):
+    """Merge the state of a processed copy into the original building.
+
+    Thermal zones, building elements and their layers and materials of the
+    copy are merged into the original objects at the same position, as are
+    the use conditions of the zones and the central AHU. Objects added by
+    the processing (e.g. new windows or layers of a retrofit) are taken
+    over.
+
+    Parameters
+    ----------
+    building : Building
+        Original building of the project
+    processed : Building
+        Copy of the building returned by a worker process
+    """
+    zones = processed.thermal_zones
+    for i, processed_zone in enumerate(zones):
+        if i < len(building.thermal_zones):
+            zone = building.thermal_zones[i]
+            _merge_zone(zone, processed_zone)
+            zones[i] = zone
+    central_ahu = building._central_ahu
+    _transplant(building, processed)
+    building._central_ahu = _merge(central_ahu, building._central_ahu)
+    for value in list(building.__dict__.values()):
+        _rebind(value, processed, building)
+    for zone in building.thermal_zones:
+        _rebind(zone, processed, building)
+
+
+def _merge_zone(zone, processed):
+    """Merge the state of a processed copy into the original zone.
+
+    The element lists and the orientation index taken over from the copy
+    refer to the copy, so the lists are bound to the zone again and the
+    index is rebuilt on its next use.
+    """
+    from teaser.logic.buildingobjects.thermalzone import ELEMENT_LISTS
+
+    for name in ELEMENT_LISTS.values():
+        originals = getattr(zone, name)
+        elements = getattr(processed, name)
+        for i, element in enumerate(elements):
+            if i < len(originals) and type(originals[i]) is type(element):
+                layers = list(originals[i].layer)
+                _transplant(originals[i], element)
+                for j, processed_layer in enumerate(list(originals[i].layer)):
+                    layer = processed_layer
+                    if j < len(layers):
+                        material = layers[j].material
+                        layer = _merge(layers[j], processed_layer)
+                        originals[i].layer[j] = layer
+                        layer._material = _merge(material, layer._material)
+                        _rebind(layer._material, processed_layer, layer)
+                    _rebind(layer, element, originals[i])
+                elements[i] = originals[i]
+            _rebind(elements[i], processed, zone)
+    use_conditions = zone._use_conditions
+    _transplant(zone, processed)
+    zone._use_conditions = _merge(use_conditions, zone._use_conditions)
+    for value in list(zone.__dict__.values()):
+        _rebind(value, processed, zone)
+    for name in ELEMENT_LISTS.values():
+        elements = getattr(zone, name)
+        elements.zone = zone
+        elements.name = name
+    zone._orientation_index = None
+
+
+def map_buildings(project, jobs, task, kwargs, workers, continue_on=(), merge=True):
+    """Call a Building method or function for many buildings in a process pool.
+
+    The buildings are processed in the given order in chunks by a pool of
+    worker processes. Results are merged back into the original buildings
+    (see merge_building()) and reported in the given order, warnings of the
+    workers are issued again in the calling process.
+
+    Parameters
+    ----------
+    project : Project
+        Project the buildings belong to
+    jobs : list
+        List of tuples (buildings, data_args), data_args is the result of
+        data_class_args() for the DataClass the buildings need in the
+        workers (None if no DataClass is needed)
+    task : str or function
+        Name of the Building method, e.g. "calc_building_parameter", or a
+        module level function called as task(building, **kwargs), e.g. the
+        export of one building
+    kwargs : dict
+        Keyword arguments of the method
+    workers : int
+        Number of worker processes
+    continue_on : tuple
+        Exception types which do not stop the processing of the remaining
+        buildings
+    merge : bool
+        If False, the workers only return errors and warnings, the
+        processed buildings are neither sent back nor merged. Use this for
+        tasks which do not change the buildings, e.g. the export
+        (default: True)
+
+    Yields
+    ------
+    building : Building
+        Original building, already merged if processed successfully and
+        merge is True
+    error : Exception
+        Exception raised by the method for this building or None. After an
+        error that is not an instance of continue_on no further buildings
+        are reported.
+    """
+    chunks = []
+    for buildings, data_args in jobs:
+        size = max(1, int(math.ceil(len(buildings) / float(workers * 4))))
+        for start in range(0, len(buildings), size):
+            chunks.append((buildings[start : start + size], data_args))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _run_chunk,
+                _dumps(chunk, project),
+                task,
+                kwargs,
+                data_args,
+                continue_on,
+                merge,
+            )
+            for chunk, data_args in chunks
+        ]
+        try:
+            for (chunk, data_args), future in zip(chunks, futures):
+                statuses, processed = _loads(future.result(), project)
+                if processed is None:
+                    processed = [None] * len(statuses)
+                for building, (error, caught), copy in zip(chunk, statuses, processed):
+                    for message, category, filename, lineno in caught:
+                        warnings.warn_explicit(message, category, filename, lineno)
+                    if error is None and copy is not None:
+                        merge_building(building, copy)
+                    yield building, error
+                    if error is not None and not isinstance(error, continue_on):
+                        return
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,259 @@
+# created October 2026
+
+"""Cyclic profiles of use conditions and air handling units.
+
+Profiles like the heating_profile of UseConditions are mostly daily or weekly
+patterns repeated over the whole year and many zones share identical
+profiles. Profiles are therefore stored as their shortest repeating pattern
+and interned: get_profile() returns one shared Profile instance for all
+identical profiles, its values for one year are expanded once on first use.
+ProfileSchedules holds the profiles of UseConditions and BuildingAHU.
+"""
+
+import weakref
+
+from teaser.logic.utilities import expand_profile
+from teaser.logic.utilities import get_year_index
+
+_profiles = weakref.WeakValueDictionary()
+
+
+def _read_only(name):
+    def method(self, *args, **kwargs):
+        raise TypeError(
+            "Profiles are shared and can't be changed in place, assign a new "
+            "list instead"
+        )
+
+    method.__name__ = name
+    return method
+
+
+class ProfileValues(list):
+    """New list with the values of a profile which can't be changed in place
+
+    Profiles are shared by many use conditions, thus changing the values
+    returned by e.g. UseConditions.heating_profile in place would have no
+    effect. All methods changing the list in place raise a TypeError
+    instead, the list otherwise behaves like a list, e.g. it compares equal
+    to a list with the same values. Augmented assignments like
+    ``use_conditions.heating_profile += [293.15]`` return a new list, which
+    is assigned to the profile. Copies are plain lists.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only("__setitem__")
+    __delitem__ = _read_only("__delitem__")
+    append = _read_only("append")
+    extend = _read_only("extend")
+    insert = _read_only("insert")
+    pop = _read_only("pop")
+    remove = _read_only("remove")
+    clear = _read_only("clear")
+    sort = _read_only("sort")
+    reverse = _read_only("reverse")
+
+    def __iadd__(self, other):
+        return list(self) + list(other)
+
+    def __imul__(self, other):
+        return list(self) * other
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+    def copy(self):
+        return list(self)
+
+
+class Profile(object):
+    """Cyclic profile stored as its shortest repeating pattern
+
+    Profiles are immutable and shared, use get_profile() to create them.
+
+    Parameters
+    ----------
+    pattern : tuple
+        Shortest pattern which repeated gives all values of the profile
+    length : int
+        Number of values of the profile
+
+    Attributes
+    ----------
+    pattern : tuple
+        Shortest pattern which repeated gives all values of the profile,
+        e.g. 24 hourly values of one day
+    length : int
+        Number of values of the profile, a multiple of the length of pattern
+    """
+
+    __slots__ = ("pattern", "length", "_year_values", "__weakref__")
+
+    def __init__(self, pattern, length):
+
+        self.pattern = pattern
+        self.length = length
+        self._year_values = None
+
+    @property
+    def values(self):
+        """Values of the profile as a new ProfileValues list"""
+
+        return ProfileValues(self.pattern * (self.length // len(self.pattern)))
+
+    @property
+    def year_values(self):
+        """Profile repeated for one year in hourly time steps
+
+        The read-only numpy array is expanded on first use and shared by all
+        users of the profile, see utilities.expand_profile().
+        """
+
+        if self._year_values is None:
+            year_values = expand_profile(self.pattern)
+            year_values.flags.writeable = False
+            self._year_values = year_values
+        return self._year_values
+
+    def __reduce__(self):
+
+        return get_profile, (list(self.values),)
+
+
+def get_profile(values):
+    """Shared Profile of the given values
+
+    Finds the shortest pattern which repeated gives all values (comparing the
+    values and their types, thus an int 0 and a float 0.0 differ) and returns
+    the Profile of these values. Identical profiles share one instance as
+    long as it is in use.
+
+    Parameters
+    ----------
+    values : list
+        Values of the profile, e.g. 24 hourly values of one day or 8760
+        values of one year
+
+    Returns
+    -------
+    profile : Profile
+        Shared instance of the profile
+    """
+
+    values = list(values)
+    length = len(values)
+    if length == 0:
+        raise ValueError("A profile needs at least one value")
+    types = list(map(type, values))
+
+    period = length
+    for candidate in range(1, length // 2 + 1):
+        if length % candidate == 0:
+            repeats = length // candidate
+            if (
+                values[:candidate] * repeats == values
+                and types[:candidate] * repeats == types
+            ):
+                period = candidate
+                break
+
+    pattern = tuple(values[:period])
+    key = (pattern, tuple(types[:period]), length)
+    profile = _profiles.get(key)
+    if profile is None:
+        profile = Profile(pattern, length)
+        _profiles[key] = profile
+    return profile
+
+
+class ProfileSchedules(object):
+    """Profiles and their schedules of UseConditions and BuildingAHU
+
+    The profiles named in _profile_names are stored as shared Profile
+    instances in attributes with a leading underscore, e.g. _heating_profile.
+    schedules is a pandas DataFrame with the values of all profiles for one
+    year in hourly time steps. It is built on first access and kept, changes
+    to it (e.g. ``schedules.loc[index, "heating_profile"] = 293.15``) are
+    written back into the profiles before they are read the next time.
+    Setting a profile updates its column of the DataFrame.
+    """
+
+    _profile_names = ()
+    _schedules = None
+
+    def profile(self, name):
+        """Shared profile of one of the profile attributes
+
+        Parameters
+        ----------
+        name : str
+            Name of the profile attribute, e.g. "heating_profile"
+
+        Returns
+        -------
+        profile : Profile
+            Interned profile, e.g. its year_values are the hourly values of
+            one year as read-only numpy array
+        """
+
+        if name not in self._profile_names:
+            raise ValueError(
+                "{} is not a profile of {}".format(name, type(self).__name__)
+            )
+        schedules = self._schedules
+        if schedules is not None and name in schedules.columns:
+            import numpy as np
+
+            values = schedules[name].to_numpy()
+            profile = getattr(self, "_" + name)
+            if not np.array_equal(values, profile.year_values):
+                setattr(self, "_" + name, get_profile(values.tolist()))
+        return getattr(self, "_" + name)
+
+    def _set_profile(self, name, value):
+        """Set a profile from a list or a single value"""
+
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        profile = get_profile(value)
+        setattr(self, "_" + name, profile)
+        if self._schedules is not None:
+            self._schedules[name] = profile.year_values.copy()
+
+    @property
+    def schedules(self):
+        if self._schedules is None:
+            import pandas as pd
+
+            self._schedules = pd.DataFrame(
+                index=get_year_index(),
+                data={
+                    name: self.profile(name).year_values.copy()
+                    for name in self._profile_names
+                },
+            )
+        return self._schedules
+
+    @schedules.setter
+    def schedules(self, value):
+        for name in value.columns:
+            if name not in self._profile_names:
+                raise ValueError(
+                    "{} is not a profile of {}".format(name, type(self).__name__)
+                )
+        if len(value) != len(get_year_index()):
+            raise ValueError(
+                "schedules need {} hourly values, got {}".format(
+                    len(get_year_index()), len(value)
+                )
+            )
+        for name in value.columns:
+            self._set_profile(name, value[name].tolist())
+
+    def __getstate__(self):
+        for name in self._profile_names:
+            self.profile(name)
+        state = self.__dict__.copy()
+        state.pop("_schedules", None)
+        return state
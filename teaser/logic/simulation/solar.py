@@ -0,0 +1,245 @@
+# created October 2026
+
+"""Solar irradiance on tilted surfaces for simulations in Python.
+
+Computes the hourly total irradiance on surfaces given by orientation and
+tilt of TEASER (orientation in degree clockwise from north, -1 and -2 for
+horizontal roofs and floors, tilt in degree from horizontal) from the direct
+normal and diffuse horizontal radiation of a weather file. The diffuse sky
+radiation follows the isotropic model or the model of Perez et al. (1990).
+
+Many zones share only a few pairs of orientation and tilt, thus the
+irradiance of all distinct pairs is computed in one batch and cached in the
+WeatherData of the weather file.
+"""
+
+import numpy as np
+
+# Perez et al. (1990), coefficients f11, f12, f13, f21, f22, f23 for the
+# bins of the sky clearness with the lower bounds PEREZ_CLEARNESS
+PEREZ_CLEARNESS = np.array([1.0, 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2])
+PEREZ_COEFFICIENTS = np.array(
+    [
+        [-0.008, 0.588, -0.062, -0.060, 0.072, -0.022],
+        [0.130, 0.683, -0.151, -0.019, 0.066, -0.029],
+        [0.330, 0.487, -0.221, 0.055, -0.064, -0.026],
+        [0.568, 0.187, -0.295, 0.109, -0.152, -0.014],
+        [0.873, -0.392, -0.362, 0.226, -0.462, 0.001],
+        [1.132, -1.237, -0.412, 0.288, -0.823, 0.056],
+        [1.060, -1.600, -0.359, 0.264, -1.127, 0.131],
+        [0.678, -0.327, -0.250, 0.156, -1.377, 0.251],
+    ]
+)
+
+SOLAR_CONSTANT = 1367.0
+
+IRRADIANCE_CACHE_SIZE = 256
+"""Maximum number of surfaces whose irradiance is kept in the
+irradiance_cache of one WeatherData, 0 disables the cache."""
+
+
+def solar_position(weather):
+    """Position of the sun at the middle of each time step
+
+    The time of the weather file is the local standard time at the end of
+    each time step, the radiation values are means over the time step.
+
+    Parameters
+    ----------
+    weather : WeatherData
+        Weather data with latitude, longitude and time zone
+
+    Returns
+    -------
+    sun : numpy.ndarray
+        Unit vector to the sun (east, north, up), shape (3, steps)
+    day_angle : numpy.ndarray [rad]
+        Angle of the day in the year for each time step
+    """
+
+    time = weather.column("time") - weather.time_step / 2
+    day_angle = 2 * np.pi * np.floor(time / 86400.0) / 365.0
+    declination = (
+        0.006918
+        - 0.399912 * np.cos(day_angle)
+        + 0.070257 * np.sin(day_angle)
+        - 0.006758 * np.cos(2 * day_angle)
+        + 0.000907 * np.sin(2 * day_angle)
+        - 0.002697 * np.cos(3 * day_angle)
+        + 0.00148 * np.sin(3 * day_angle)
+    )
+    equation_of_time = 229.18 * (
+        0.000075
+        + 0.001868 * np.cos(day_angle)
+        - 0.032077 * np.sin(day_angle)
+        - 0.014615 * np.cos(2 * day_angle)
+        - 0.040849 * np.sin(2 * day_angle)
+    )
+    solar_time = (
+        time / 3600.0
+        + (4 * (weather.longitude - 15 * weather.time_zone) + equation_of_time) / 60
+    )
+    hour_angle = np.radians(15 * (solar_time % 24 - 12))
+    latitude = np.radians(weather.latitude)
+
+    sun = np.empty((3, len(time)))
+    sun[0] = -np.cos(declination) * np.sin(hour_angle)
+    sun[1] = np.sin(declination) * np.cos(latitude) - np.cos(declination) * np.sin(
+        latitude
+    ) * np.cos(hour_angle)
+    sun[2] = np.sin(declination) * np.sin(latitude) + np.cos(declination) * np.cos(
+        latitude
+    ) * np.cos(hour_angle)
+    return sun, day_angle
+
+
+def surface_normal(orientation, tilt):
+    """Unit normal vectors (east, north, up) of surfaces, shape (3, surfaces)
+
+    Parameters
+    ----------
+    orientation : numpy.ndarray [degree]
+        Orientation of the surfaces, clockwise from north, -1 and -2 for
+        horizontal surfaces
+    tilt : numpy.ndarray [degree]
+        Tilt of the surfaces from horizontal
+    """
+
+    orientation = np.radians(np.where(np.asarray(orientation) < 0, 0.0, orientation))
+    tilt = np.radians(tilt)
+    return np.array(
+        [
+            np.sin(tilt) * np.sin(orientation),
+            np.sin(tilt) * np.cos(orientation),
+            np.cos(tilt),
+        ]
+    ).reshape(3, -1)
+
+
+def _perez_factors(cos_zenith, day_angle, diffuse, direct):
+    """Circumsolar and horizon brightening factors F1 and F2 of Perez"""
+
+    zenith = np.arccos(np.clip(cos_zenith, -1.0, 1.0))
+    day_light = (cos_zenith > 0) & (diffuse > 0)
+    cube = 1.041 * zenith**3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clearness = np.where(
+            day_light, ((diffuse + direct) / diffuse + cube) / (1 + cube), 1.0
+        )
+        air_mass = np.where(
+            day_light,
+            1
+            / (
+                cos_zenith
+                + 0.50572 * np.maximum(96.07995 - np.degrees(zenith), 1e-6) ** -1.6364
+            ),
+            0.0,
+        )
+    extraterrestrial = SOLAR_CONSTANT * (1 + 0.033 * np.cos(day_angle))
+    brightness = diffuse * air_mass / extraterrestrial
+
+    coefficients = PEREZ_COEFFICIENTS[
+        np.searchsorted(PEREZ_CLEARNESS, clearness, side="right") - 1
+    ].T
+    f1 = np.maximum(
+        0.0, coefficients[0] + coefficients[1] * brightness + coefficients[2] * zenith
+    )
+    f2 = coefficients[3] + coefficients[4] * brightness + coefficients[5] * zenith
+    return np.where(day_light, f1, 0.0), np.where(day_light, f2, 0.0)
+
+
+def calc_irradiance(weather, surfaces, sky="perez", albedo=0.2):
+    """Total irradiance on tilted surfaces, computed in one batch
+
+    Parameters
+    ----------
+    weather : WeatherData
+        Weather data with location, direct normal and diffuse horizontal
+        radiation
+    surfaces : list
+        Pairs (orientation, tilt) [degree] of the surfaces
+    sky : str
+        Model of the diffuse sky radiation, "perez" or "isotropic"
+        (default: "perez")
+    albedo : float
+        Reflectance of the ground (default: 0.2)
+
+    Returns
+    -------
+    irradiance : numpy.ndarray [W/m2]
+        Mean irradiance of each time step, one row per surface
+    """
+
+    if sky not in ("perez", "isotropic"):
+        raise ValueError("Unknown sky model " + str(sky))
+    if not surfaces:
+        return np.zeros((0, len(weather.table)))
+
+    orientation, tilt = np.array(surfaces, dtype=float).T
+    normal = surface_normal(orientation, tilt)
+    sun, day_angle = solar_position(weather)
+    cos_zenith = sun[2]
+    direct = np.where(cos_zenith > 0, weather.column("rad_dir_normal"), 0.0)
+    diffuse = weather.column("rad_diffuse_hor")
+    global_hor = direct * np.maximum(cos_zenith, 0.0) + diffuse
+
+    cos_incidence = np.maximum(normal.T @ sun, 0.0)
+    cos_tilt = normal[2][:, np.newaxis]
+    sky_view = (1 + cos_tilt) / 2
+
+    if sky == "isotropic":
+        sky_diffuse = diffuse * sky_view
+    else:
+        f1, f2 = _perez_factors(cos_zenith, day_angle, diffuse, direct)
+        sin_tilt = np.sqrt(np.maximum(1 - cos_tilt**2, 0.0))
+        sky_diffuse = diffuse * (
+            (1 - f1) * sky_view
+            + f1 * cos_incidence / np.maximum(np.cos(np.radians(85.0)), cos_zenith)
+            + f2 * sin_tilt
+        )
+    return (
+        direct * cos_incidence
+        + np.maximum(sky_diffuse, 0.0)
+        + global_hor * albedo * (1 - cos_tilt) / 2
+    )
+
+
+def get_irradiance(weather, surfaces, sky="perez", albedo=0.2):
+    """Cached total irradiance on tilted surfaces
+
+    Like calc_irradiance(), but the irradiance of each surface is cached in
+    weather.irradiance_cache. Only surfaces not yet in the cache are
+    computed, in one batch. read_mos() returns one shared WeatherData for
+    each weather file, thus the cache is shared by all users of the file.
+    The cache keeps the IRRADIANCE_CACHE_SIZE most recently used surfaces,
+    weather.irradiance_cache.clear() releases all of them.
+
+    Returns
+    -------
+    irradiance : numpy.ndarray [W/m2]
+        Mean irradiance of each time step, one row per surface
+    """
+
+    cache = weather.irradiance_cache
+    keys = [
+        (sky, albedo, float(orientation), float(tilt))
+        for orientation, tilt in surfaces
+    ]
+    rows = {}
+    for key in keys:
+        if key in cache and key not in rows:
+            rows[key] = cache[key]
+            cache.move_to_end(key)
+    missing = list(dict.fromkeys(key for key in keys if key not in rows))
+    if missing:
+        values = calc_irradiance(weather, [key[2:] for key in missing], sky, albedo)
+        values.flags.writeable = False
+        for key, row in zip(missing, values):
+            rows[key] = row
+            if IRRADIANCE_CACHE_SIZE > 0:
+                cache[key] = row
+    while len(cache) > IRRADIANCE_CACHE_SIZE:
+        cache.popitem(last=False)
+    if not keys:
+        return np.zeros((0, len(weather.table)))
+    return np.array([rows[key] for key in keys])
@@ -0,0 +1,845 @@
+# created October 2026
+
+"""Simulation of the VDI 6007 reduced order models in Python.
+
+The thermal zones are simulated with the resistances and capacities of
+OneElement, TwoElement, ThreeElement and FourElement (Zone.model_attr),
+following the network of the ReducedOrder models of AixLib and IBPSA. All
+zones share one network with the nodes of the FourElement model, nodes of
+elements a zone does not have are decoupled. The massless surface nodes are
+eliminated, which leaves a linear state-space model with the air and the
+capacities of the elements as states. The heating and cooling is ideal: its
+power is exactly what keeps the air at the set temperature of
+heating_profile and cooling_profile.
+
+ZoneModels discretises the models of many zones once (implicit Euler). As
+the networks are symmetric, each discretised model is diagonal in its modal
+coordinates, so all zones advance in lockstep with a few element-wise array
+operations per time step.
+
+Compared to the Modelica models the simulation makes these
+simplifications: heat transfer coefficients are constant, radiative gains
+are distributed to the surfaces by area, the air exchange is the constant
+infiltration_rate of UseConditions (air handling units are not simulated)
+and heating and cooling have no power limits. The irradiance of tilted
+surfaces is computed by the solar module, see solar.get_irradiance().
+"""
+
+import numpy as np
+
+from teaser.logic.simulation import solar
+from teaser.logic.simulation.weather import WeatherData
+from teaser.logic.simulation.weather import read_mos
+
+# Nodes of the network, the first N_STATES nodes have a capacity
+AIR, OW, IW, GF, RT = 0, 1, 2, 3, 4
+OW_S, WIN_S, IW_S, GF_S, RT_S = 5, 6, 7, 8, 9
+N_STATES = 5
+N_NODES = 10
+
+# Inputs of the state-space model: boundary temperatures and heat flows
+T_EQ_WALL, T_EQ_WIN, T_OUTSIDE, T_GROUND, T_EQ_ROOF = 0, 1, 2, 3, 4
+Q_CONV, Q_RAD = 5, 6
+N_BOUNDARIES = 5
+N_INPUTS = 7
+
+STEFAN_BOLTZMANN = 5.670374419e-8
+
+# Parameters of model_attr used for the networks, 0 if a model has none
+_NETWORK_PARAMETERS = (
+    "area_ow",
+    "r1_ow",
+    "c1_ow",
+    "r_rest_ow",
+    "alpha_conv_inner_ow",
+    "alpha_conv_outer_ow",
+    "alpha_rad_outer_ow",
+    "area_win",
+    "r1_win",
+    "alpha_conv_inner_win",
+    "alpha_conv_outer_win",
+    "alpha_rad_outer_win",
+    "area_iw",
+    "r1_iw",
+    "c1_iw",
+    "alpha_conv_inner_iw",
+    "area_gf",
+    "r1_gf",
+    "c1_gf",
+    "r_rest_gf",
+    "alpha_conv_inner_gf",
+    "area_rt",
+    "r1_rt",
+    "c1_rt",
+    "r_rest_rt",
+    "alpha_conv_inner_rt",
+    "alpha_conv_outer_rt",
+    "alpha_rad_outer_rt",
+    "alpha_rad_inner_mean",
+)
+
+
+class SimulationResult(object):
+    """Results of the simulation of thermal zones
+
+    Parameters
+    ----------
+    thermal_zones : list
+        Simulated ThermalZone instances
+    time : numpy.ndarray [s]
+        Time of the time steps
+    heating_demand : numpy.ndarray [kWh]
+        Heating demand of each zone over the simulated period
+    cooling_demand : numpy.ndarray [kWh]
+        Cooling demand of each zone over the simulated period
+    max_heating : numpy.ndarray [W]
+        Maximal power of the ideal heater of each zone
+    max_cooling : numpy.ndarray [W]
+        Maximal power of the ideal cooler of each zone
+    t_air : numpy.ndarray [K]
+        Air temperature, one row per zone and one column per time step, None
+        if no hourly results were recorded (default: None)
+    heating : numpy.ndarray [W]
+        Power of the ideal heater, one row per zone and one column per time
+        step, None if no hourly results were recorded (default: None)
+    cooling : numpy.ndarray [W]
+        Power of the ideal cooler (positive when cooling), one row per zone
+        and one column per time step, None if no hourly results were
+        recorded (default: None)
+    group_max_heating : numpy.ndarray [W]
+        Maximal power of the ideal heaters of each group of zones, None if
+        the zones were not grouped (default: None)
+    group_max_cooling : numpy.ndarray [W]
+        Maximal power of the ideal coolers of each group of zones, None if
+        the zones were not grouped (default: None)
+
+    Attributes
+    ----------
+    thermal_zones : list
+        Simulated ThermalZone instances
+    time : numpy.ndarray [s]
+        Time of the time steps
+    heating_demand : numpy.ndarray [kWh]
+        Heating demand of each zone over the simulated period
+    cooling_demand : numpy.ndarray [kWh]
+        Cooling demand of each zone over the simulated period
+    max_heating : numpy.ndarray [W]
+        Maximal power of the ideal heater of each zone
+    max_cooling : numpy.ndarray [W]
+        Maximal power of the ideal cooler of each zone
+    t_air : numpy.ndarray [K]
+        Air temperature, one row per zone and one column per time step
+    heating : numpy.ndarray [W]
+        Power of the ideal heater, one row per zone and one column per time
+        step
+    cooling : numpy.ndarray [W]
+        Power of the ideal cooler (positive when cooling), one row per zone
+        and one column per time step
+    group_max_heating : numpy.ndarray [W]
+        Maximal power of the ideal heaters of each group of zones, e.g. the
+        peak heating load of a building
+    group_max_cooling : numpy.ndarray [W]
+        Maximal power of the ideal coolers of each group of zones
+    """
+
+    def __init__(
+        self,
+        thermal_zones,
+        time,
+        heating_demand,
+        cooling_demand,
+        max_heating,
+        max_cooling,
+        t_air=None,
+        heating=None,
+        cooling=None,
+        group_max_heating=None,
+        group_max_cooling=None,
+    ):
+
+        self.thermal_zones = thermal_zones
+        self.time = time
+        self.heating_demand = heating_demand
+        self.cooling_demand = cooling_demand
+        self.max_heating = max_heating
+        self.max_cooling = max_cooling
+        self.t_air = t_air
+        self.heating = heating
+        self.cooling = cooling
+        self.group_max_heating = group_max_heating
+        self.group_max_cooling = group_max_cooling
+
+
+def _network_parameters(thermal_zones):
+    """Parameters of the networks of the zones as arrays over the zones"""
+
+    values = np.zeros((len(_NETWORK_PARAMETERS), len(thermal_zones)))
+    zone_values = np.zeros((4, len(thermal_zones)))
+    for index, zone in enumerate(thermal_zones):
+        attr = zone.model_attr
+        if attr is None:
+            raise ValueError(
+                "Thermal zone "
+                + str(zone.name)
+                + " has no model parameters, call calc_building_parameter() first"
+            )
+        values[:, index] = [
+            getattr(attr, name, None) or 0.0 for name in _NETWORK_PARAMETERS
+        ]
+        if attr.merge_windows:
+            # windows are part of the outer walls
+            values[_NETWORK_PARAMETERS.index("area_win"), index] = 0.0
+        zone_values[:, index] = (
+            zone.volume,
+            zone.density_air,
+            zone.heat_capac_air,
+            zone.use_conditions.infiltration_rate,
+        )
+    parameters = dict(zip(_NETWORK_PARAMETERS, values))
+    parameters["air_capacity"] = zone_values[0] * zone_values[1] * zone_values[2]
+    parameters["infiltration_rate"] = zone_values[3]
+    return parameters
+
+
+def _inverse(values):
+    """Element-wise 1 / values, 0 where values are 0"""
+
+    return np.where(values != 0, 1 / np.where(values != 0, values, 1.0), 0.0)
+
+
+def zone_networks(thermal_zones):
+    """Networks of resistances and capacities of thermal zones
+
+    Parameters
+    ----------
+    thermal_zones : list
+        ThermalZone instances with calculated model_attr, see
+        calc_zone_parameters()
+
+    Returns
+    -------
+    capacity : numpy.ndarray [J/K]
+        Capacity of each node, shape (zones, N_NODES)
+    conductance : numpy.ndarray [W/K]
+        Symmetric matrices of the conductances between the nodes, shape
+        (zones, N_NODES, N_NODES)
+    boundary : numpy.ndarray [W/K]
+        Conductances between the nodes and the boundary temperatures, shape
+        (zones, N_NODES, N_BOUNDARIES)
+    distribution : numpy.ndarray
+        Share of the convective and radiative heat flows for each node,
+        shape (zones, N_NODES, 2)
+    """
+
+    p = _network_parameters(thermal_zones)
+    n_zones = len(thermal_zones)
+    capacity = np.zeros((n_zones, N_NODES))
+    conductance = np.zeros((n_zones, N_NODES, N_NODES))
+    boundary = np.zeros((n_zones, N_NODES, N_BOUNDARIES))
+    surface_area = np.zeros((n_zones, N_NODES))
+
+    def connect(node_1, node_2, value):
+        conductance[:, node_1, node_2] += value
+        conductance[:, node_2, node_1] += value
+
+    capacity[:, AIR] = p["air_capacity"]
+    boundary[:, AIR, T_OUTSIDE] = p["air_capacity"] * p["infiltration_rate"] / 3600.0
+
+    for element, state, surface, boundary_temperature in (
+        ("ow", OW, OW_S, T_EQ_WALL),
+        ("iw", IW, IW_S, None),
+        ("gf", GF, GF_S, T_GROUND),
+        ("rt", RT, RT_S, T_EQ_ROOF),
+    ):
+        area = p["area_" + element]
+        present = (area > 0) & (p["r1_" + element] > 0) & (p["c1_" + element] > 0)
+        area = np.where(present, area, 0.0)
+        connect(AIR, surface, p["alpha_conv_inner_" + element] * area)
+        connect(surface, state, np.where(present, _inverse(p["r1_" + element]), 0.0))
+        capacity[:, state] = np.where(present, p["c1_" + element], 0.0)
+        surface_area[:, surface] = area
+        if element == "gf":
+            boundary[:, state, boundary_temperature] = np.where(
+                present, _inverse(p["r_rest_gf"]), 0.0
+            )
+        elif boundary_temperature is not None:
+            outer = _inverse(
+                (p["alpha_conv_outer_" + element] + p["alpha_rad_outer_" + element])
+                * area
+            )
+            boundary[:, state, boundary_temperature] = np.where(
+                present, _inverse(p["r_rest_" + element] + outer), 0.0
+            )
+
+    area = np.where(p["r1_win"] > 0, p["area_win"], 0.0)
+    connect(AIR, WIN_S, p["alpha_conv_inner_win"] * area)
+    outer = _inverse((p["alpha_conv_outer_win"] + p["alpha_rad_outer_win"]) * area)
+    boundary[:, WIN_S, T_EQ_WIN] = np.where(area > 0, _inverse(p["r1_win"] + outer), 0.0)
+    surface_area[:, WIN_S] = area
+
+    for node_1 in range(N_STATES, N_NODES):
+        for node_2 in range(node_1 + 1, N_NODES):
+            connect(
+                node_1,
+                node_2,
+                p["alpha_rad_inner_mean"]
+                * np.minimum(surface_area[:, node_1], surface_area[:, node_2]),
+            )
+
+    distribution = np.zeros((n_zones, N_NODES, 2))
+    distribution[:, AIR, 0] = 1.0
+    total_area = surface_area.sum(axis=1)
+    distribution[:, :, 1] = surface_area * _inverse(total_area)[:, np.newaxis]
+    distribution[total_area == 0, AIR, 1] = 1.0
+
+    return capacity, conductance, boundary, distribution
+
+
+def zone_network(thermal_zone):
+    """Network of resistances and capacities of one thermal zone
+
+    See zone_networks(), the returned arrays have no axis for the zones.
+    """
+
+    return tuple(part[0] for part in zone_networks([thermal_zone]))
+
+
+def _reduce(capacity, conductance, boundary, distribution):
+    """Eliminates the massless surface nodes of stacked zone networks
+
+    Returns the symmetric conductance matrices of the states, the input
+    matrices and the capacities of the states (unused states get a capacity
+    of 1 J/K).
+    """
+
+    capacity = np.array(capacity, dtype=float)
+    coupling = -conductance
+    diagonal = conductance.sum(axis=-1) + boundary.sum(axis=-1)
+    # nodes of missing elements: decoupled with a unit conductance to 0 K
+    unused = diagonal == 0
+    diagonal[unused] = 1.0
+    capacity[..., :N_STATES][unused[..., :N_STATES]] = 1.0
+    index = np.arange(N_NODES)
+    coupling[..., index, index] = diagonal
+
+    states = slice(0, N_STATES)
+    surfaces = slice(N_STATES, N_NODES)
+    inputs = np.concatenate((boundary, distribution), axis=-1)
+    eliminated = np.linalg.solve(
+        coupling[..., surfaces, surfaces],
+        np.concatenate(
+            (coupling[..., surfaces, states], inputs[..., surfaces, :]), axis=-1
+        ),
+    )
+    coupling_sd = coupling[..., states, surfaces]
+    reduced = coupling[..., states, states] - coupling_sd @ eliminated[..., :N_STATES]
+    reduced = (reduced + np.swapaxes(reduced, -1, -2)) / 2
+    b = inputs[..., states, :] - coupling_sd @ eliminated[..., N_STATES:]
+    return reduced, b, capacity[..., states]
+
+
+def state_space(capacity, conductance, boundary, distribution):
+    """State-space model of stacked zone networks
+
+    Eliminates the massless surface nodes of the networks, see
+    zone_networks(). All arguments have one more leading axis for the zones.
+
+    Returns
+    -------
+    a : numpy.ndarray
+        State matrices of the zones with shape (zones, N_STATES, N_STATES)
+    b : numpy.ndarray
+        Input matrices of the zones with shape (zones, N_STATES, N_INPUTS),
+        the inputs are the boundary temperatures followed by the convective
+        and radiative heat flows
+    """
+
+    reduced, b, capacity = _reduce(capacity, conductance, boundary, distribution)
+    c = capacity[..., np.newaxis]
+    return -reduced / c, b / c
+
+
+def _sky(tilt):
+    """View factor of a surface with the given tilt [degree] to the sky"""
+
+    return (1 + np.cos(np.radians(tilt))) / 2
+
+
+class _ZoneInputs(object):
+    """Inputs of all zones as shared time series and coefficients per zone
+
+    Equivalent temperatures follow VDI 6007: the outdoor temperature
+    corrected by the absorbed solar radiation and the long-wave exchange with
+    the sky, weighted by the weightfactors of the facades. All inputs of a
+    zone are linear combinations of time series shared by many zones: a
+    constant, outdoor and sky temperature, each distinct profile, the
+    irradiance of each distinct pair of orientation and tilt and the
+    irradiance through each distinct shading of a surface.
+
+    Attributes
+    ----------
+    coefficients : numpy.ndarray
+        Coefficients of the series for the inputs of each zone, shape
+        (series, N_INPUTS, zones)
+    """
+
+    def __init__(self, thermal_zones):
+
+        n_zones = len(thermal_zones)
+        self.t_inside = np.zeros(n_zones)
+        self.with_heating = np.zeros(n_zones, dtype=bool)
+        self.with_cooling = np.zeros(n_zones, dtype=bool)
+        self.surfaces = {}
+        self.shadings = {}
+        profiles = {}
+        setpoints = np.zeros((2, n_zones), dtype=int)
+        # (series key, input, zone, coefficient), series keys are indices of
+        # ("one", "t_outside", "t_sky"), ("profile", i), ("surface", i) or
+        # ("shading", i)
+        entries = []
+
+        def surface_index(orientation, tilt):
+            return self.surfaces.setdefault((orientation, tilt), len(self.surfaces))
+
+        def profile_index(profile):
+            return profiles.setdefault(id(profile), (len(profiles), profile))[0]
+
+        for zone_index, zone in enumerate(thermal_zones):
+            attr = zone.model_attr
+            use = zone.use_conditions
+            self.t_inside[zone_index] = zone.t_inside
+            self.with_heating[zone_index] = use.with_heating
+            self.with_cooling[zone_index] = use.with_cooling
+
+            def add(key, input_index, value):
+                entries.append((key, input_index, zone_index, value))
+
+            add(("t_outside",), T_OUTSIDE, 1.0)
+            add(("one",), T_GROUND, zone.t_ground)
+
+            sky = 0.0
+            wf_ground = 0.0
+            h_out = attr.alpha_conv_outer_ow + attr.alpha_rad_outer_ow
+            wf_sum = sum(attr.weightfactor_ow) + attr.weightfactor_ground
+            if wf_sum > 0:
+                wf_ground = attr.weightfactor_ground / wf_sum
+                for wf, orientation, tilt in zip(
+                    attr.weightfactor_ow, attr.orientation_facade, attr.tilt_facade
+                ):
+                    sky += wf / wf_sum * attr.alpha_rad_outer_ow / h_out * _sky(tilt)
+                    add(
+                        ("surface", surface_index(orientation, tilt)),
+                        T_EQ_WALL,
+                        wf / wf_sum * attr.solar_absorp_ow / h_out,
+                    )
+            add(("t_outside",), T_EQ_WALL, 1.0 - wf_ground - sky)
+            add(("t_sky",), T_EQ_WALL, sky)
+            add(("one",), T_EQ_WALL, wf_ground * zone.t_ground)
+
+            sky = 0.0
+            wf_sum = sum(attr.weightfactor_win)
+            h_win = attr.alpha_conv_outer_win + attr.alpha_rad_outer_win
+            if wf_sum > 0 and h_win > 0:
+                for wf, tilt in zip(attr.weightfactor_win, attr.tilt_facade):
+                    sky += wf / wf_sum * attr.alpha_rad_outer_win / h_win * _sky(tilt)
+            add(("t_outside",), T_EQ_WIN, 1.0 - sky)
+            add(("t_sky",), T_EQ_WIN, sky)
+
+            sky = 0.0
+            wf_sum = sum(getattr(attr, "weightfactor_rt", []))
+            if wf_sum > 0:
+                h_out = attr.alpha_conv_outer_rt + attr.alpha_rad_outer_rt
+                for wf, orientation, tilt in zip(
+                    attr.weightfactor_rt, attr.orientation_rt, attr.tilt_rt
+                ):
+                    sky += wf / wf_sum * attr.alpha_rad_outer_rt / h_out * _sky(tilt)
+                    add(
+                        ("surface", surface_index(orientation, tilt)),
+                        T_EQ_ROOF,
+                        wf / wf_sum * attr.solar_absorp_rt / h_out,
+                    )
+            add(("t_outside",), T_EQ_ROOF, 1.0 - sky)
+            add(("t_sky",), T_EQ_ROOF, sky)
+
+            # shading_max_irr only has entries for facades with windows
+            max_irr = iter(attr.shading_max_irr)
+            conv = attr.ratio_conv_rad_inner_win
+            for area, shading, orientation, tilt in zip(
+                attr.transparent_areas,
+                attr.shading_g_total,
+                attr.orientation_facade,
+                attr.tilt_facade,
+            ):
+                if area > 0:
+                    key = (
+                        surface_index(orientation, tilt),
+                        next(max_irr, np.inf),
+                        shading,
+                    )
+                    key = ("shading", self.shadings.setdefault(key, len(self.shadings)))
+                    add(key, Q_CONV, conv * area * attr.weighted_g_value)
+                    add(key, Q_RAD, (1 - conv) * area * attr.weighted_g_value)
+
+            for profile, value, ratio_conv in (
+                (
+                    use.profile("persons_profile"),
+                    use.persons * zone.area * use.fixed_heat_flow_rate_persons,
+                    use.ratio_conv_rad_persons,
+                ),
+                (
+                    use.profile("machines_profile"),
+                    use.machines * zone.area,
+                    use.ratio_conv_rad_machines,
+                ),
+                (
+                    use.profile("lighting_profile"),
+                    use.lighting_power * zone.area,
+                    use.ratio_conv_rad_lighting,
+                ),
+            ):
+                key = ("profile", profile_index(profile))
+                add(key, Q_CONV, value * ratio_conv)
+                add(key, Q_RAD, value * (1 - ratio_conv))
+
+            setpoints[:, zone_index] = (
+                profile_index(use.profile("heating_profile")),
+                profile_index(use.profile("cooling_profile")),
+            )
+
+        self.profiles = np.array(
+            [
+                profile.year_values
+                for _, profile in sorted(profiles.values(), key=lambda item: item[0])
+            ]
+        ).reshape(len(profiles), -1)
+        self.heating_profile, self.cooling_profile = setpoints
+
+        offsets = {
+            "one": 0,
+            "t_outside": 1,
+            "t_sky": 2,
+            "profile": 3,
+            "surface": 3 + len(profiles),
+            "shading": 3 + len(profiles) + len(self.surfaces),
+        }
+        n_series = offsets["shading"] + len(self.shadings)
+        self.coefficients = np.zeros((n_series, N_INPUTS, n_zones))
+        if entries:
+            keys, input_index, zone_index, values = zip(*entries)
+            series = [offsets[key[0]] + (key[1] if len(key) > 1 else 0) for key in keys]
+            np.add.at(self.coefficients, (series, input_index, zone_index), values)
+
+    def irradiance(self, irradiance, weather):
+        """Irradiance of all distinct surfaces, one row per surface"""
+
+        n_steps = len(weather.table)
+        if isinstance(irradiance, str):
+            return solar.get_irradiance(weather, list(self.surfaces), sky=irradiance)
+        values = np.zeros((len(self.surfaces), n_steps))
+        if irradiance is not None:
+            for (orientation, tilt), surface in self.surfaces.items():
+                values[surface] = np.asarray(irradiance(orientation, tilt))[:n_steps]
+        return values
+
+    def series(self, hours, t_outside, t_sky, irradiance):
+        """Shared time series for some time steps
+
+        Parameters
+        ----------
+        hours : numpy.ndarray
+            Hour of the year of each time step, the index of the hourly
+            profile values
+        t_outside : numpy.ndarray [K]
+            Outdoor temperature at the time steps
+        t_sky : numpy.ndarray [K]
+            Sky temperature at the time steps
+        irradiance : numpy.ndarray [W/m2]
+            Irradiance of the distinct surfaces at the time steps, one row
+            per surface
+
+        Returns
+        -------
+        series : numpy.ndarray
+            Values of the series, shape (steps, series)
+        """
+
+        profile_values = self.profiles[:, hours % self.profiles.shape[1]]
+        shadings = np.zeros((len(self.shadings), len(hours)))
+        for (surface, max_irr, shading), index in self.shadings.items():
+            values = irradiance[surface]
+            shadings[index] = np.where(values > max_irr, shading * values, values)
+        return np.concatenate(
+            (
+                np.ones((1, len(hours))),
+                t_outside[np.newaxis],
+                t_sky[np.newaxis],
+                profile_values,
+                irradiance,
+                shadings,
+            )
+        ).T
+
+    def set_temperatures(self, hours):
+        """Set temperatures of heating and cooling, shape (hours, zones)"""
+
+        profile_values = self.profiles[:, hours % self.profiles.shape[1]].T
+        return (
+            profile_values[:, self.heating_profile],
+            profile_values[:, self.cooling_profile],
+        )
+
+
+class ZoneModels(object):
+    """Discretised models of many thermal zones
+
+    The state-space models of all zones are discretised once with the
+    implicit Euler method, (I - dt A) x_k = x_(k-1) + dt B u_k, and
+    transformed to modal coordinates z = V^-1 x. A = -C^-1 K with the
+    symmetric conductance matrix K and the diagonal capacity matrix C has real
+    eigenvalues, thus each step is z_k = d * z_(k-1) + f_k with the vector d
+    of each zone. The forcing f_k of all zones is one matrix product of the
+    shared time series (see _ZoneInputs) and the precomputed coefficients.
+    The zones are on the last axis of all arrays, so all zones advance
+    together with a few element-wise array operations per time step.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        ThermalZone instances with calculated model_attr, see
+        Building.calc_building_parameter()
+    time_step : float [s]
+        Time step of the simulation (default: 3600)
+
+    Attributes
+    ----------
+    thermal_zones : list
+        ThermalZone instances of the models
+    time_step : float [s]
+        Time step of the simulation
+    decay : numpy.ndarray
+        Factors d of the modal states for one step, shape (N_STATES, zones)
+    forcing : numpy.ndarray
+        Forcing of the modal states by the shared time series, shape
+        (series, N_STATES * zones)
+    air : numpy.ndarray
+        Row of V giving the air temperature of the modal states, shape
+        (N_STATES, zones)
+    heat_response : numpy.ndarray
+        Modal states due to 1 W of ideal heating in one step, shape
+        (N_STATES, zones)
+    air_response : numpy.ndarray [K/W]
+        Air temperature due to 1 W of ideal heating in one step
+    """
+
+    def __init__(self, thermal_zones, time_step=3600.0):
+
+        self.thermal_zones = list(thermal_zones)
+        self.time_step = time_step
+
+        reduced, b, capacity = _reduce(*zone_networks(self.thermal_zones))
+        scale = 1 / np.sqrt(capacity)
+        eigenvalues, eigenvectors = np.linalg.eigh(
+            scale[:, :, np.newaxis] * reduced * scale[:, np.newaxis, :]
+        )
+        # x = V z with V = C^-1/2 Q and V^-1 = Q^T C^1/2
+        modes = scale[:, :, np.newaxis] * eigenvectors
+        to_modal = np.swapaxes(eigenvectors, 1, 2) / scale[:, np.newaxis, :]
+        decay = 1 / (1 + time_step * eigenvalues)
+        input_matrix = (
+            decay[:, :, np.newaxis] * (to_modal @ (b / capacity[:, :, np.newaxis]))
+        ) * time_step
+
+        self._inputs = _ZoneInputs(self.thermal_zones)
+        self.decay = np.ascontiguousarray(decay.T)
+        self.forcing = np.einsum(
+            "zmj,fjz->fmz", input_matrix, self._inputs.coefficients
+        ).reshape(len(self._inputs.coefficients), -1)
+        self.air = np.ascontiguousarray(modes[:, AIR, :].T)
+        self.heat_response = np.ascontiguousarray(input_matrix[:, :, Q_CONV].T)
+        self.air_response = (self.air * self.heat_response).sum(axis=0)
+        # all temperatures start at t_inside, z = V^-1 x
+        self.initial_state = np.ascontiguousarray(
+            (to_modal.sum(axis=2) * self._inputs.t_inside[:, np.newaxis]).T
+        )
+
+    def simulate(
+        self, weather, irradiance="perez", hourly=True, groups=None, chunk_size=24
+    ):
+        """Simulates the zones with ideal heating and cooling
+
+        Parameters
+        ----------
+        weather : WeatherData or str
+            Weather data or path of a .mos weather file with the time step
+            of the models, e.g. Project.weather_file_path
+        irradiance : str or callable
+            Sky model of the solar irradiance on the surfaces, "perez" or
+            "isotropic", see solar.get_irradiance(). Alternatively a function
+            irradiance(orientation, tilt) returning the total solar
+            irradiance [W/m2] on a surface with the given orientation and
+            tilt [degree] for all time steps of the weather data. If None,
+            solar radiation is neglected (default: "perez")
+        hourly : bool
+            If True, the air temperature and the power of heating and
+            cooling of each time step are recorded. Without them only the
+            demand and the maximal power are computed, which keeps the
+            memory independent of the simulated period (default: True)
+        groups : list
+            Index of the group of each zone, e.g. of its building. The
+            maximal power of heating and cooling of the sum of each group's
+            zones is computed if given (default: None)
+        chunk_size : int
+            Number of time steps the forcing is computed for at once
+            (default: 24)
+
+        Returns
+        -------
+        result : SimulationResult
+            Results of the simulation
+        """
+
+        if not isinstance(weather, WeatherData):
+            weather = read_mos(weather)
+        if weather.time_step != self.time_step:
+            raise ValueError(
+                "Time step of the weather data differs from the time step "
+                + str(self.time_step)
+                + " of the models"
+            )
+
+        zone_inputs = self._inputs
+        n_zones = len(self.thermal_zones)
+        time = weather.column("time")
+        n_steps = len(time)
+        t_outside = weather.column("temp_dry_bulb") + 273.15
+        t_sky = (weather.column("rad_infrared_hor") / STEFAN_BOLTZMANN) ** 0.25
+        surface_irradiance = zone_inputs.irradiance(irradiance, weather)
+
+        decay = self.decay
+        air = self.air
+        heat_response = self.heat_response
+        air_response = self.air_response
+        heat_gain = np.where(zone_inputs.with_heating, 1 / air_response, 0.0)
+        cool_gain = np.where(zone_inputs.with_cooling, 1 / air_response, 0.0)
+        state = self.initial_state.copy()
+
+        heating_demand = np.zeros(n_zones)
+        cooling_demand = np.zeros(n_zones)
+        max_heating = np.zeros(n_zones)
+        max_cooling = np.zeros(n_zones)
+        if groups is not None:
+            groups = np.asarray(groups, dtype=int)
+            group_order = np.argsort(groups, kind="stable")
+            group_starts = np.flatnonzero(
+                np.r_[True, np.diff(groups[group_order]) != 0]
+            )
+            group_ids = groups[group_order][group_starts]
+            group_max_heating = np.zeros(groups.max() + 1)
+            group_max_cooling = np.zeros(groups.max() + 1)
+        else:
+            group_max_heating = group_max_cooling = None
+        if hourly:
+            t_air = np.empty((n_zones, n_steps))
+            heating = np.empty((n_zones, n_steps))
+            cooling = np.empty((n_zones, n_steps))
+        else:
+            t_air = heating = cooling = None
+
+        for start in range(0, n_steps, chunk_size):
+            steps = np.arange(start, min(start + chunk_size, n_steps))
+            # the profiles are hourly, also for shorter time steps
+            hours = (steps * self.time_step // 3600).astype(int)
+            series = zone_inputs.series(
+                hours, t_outside[steps], t_sky[steps], surface_irradiance[:, steps]
+            )
+            forced = (series @ self.forcing).reshape(len(steps), N_STATES, n_zones)
+            t_heat, t_cool = zone_inputs.set_temperatures(hours)
+            chunk_air = np.empty((len(steps), n_zones))
+            chunk_heat = np.empty((len(steps), n_zones))
+            chunk_cool = np.empty((len(steps), n_zones))
+            for index in range(len(steps)):
+                state *= decay
+                state += forced[index]
+                t_free = np.einsum("mz,mz->z", air, state)
+                heat = np.maximum(t_heat[index] - t_free, 0.0)
+                heat *= heat_gain
+                cool = np.maximum(t_free - t_cool[index], 0.0)
+                cool *= cool_gain
+                state += heat_response * (heat - cool)
+                chunk_air[index] = t_free
+                chunk_heat[index] = heat
+                chunk_cool[index] = cool
+
+            heating_demand += chunk_heat.sum(axis=0)
+            cooling_demand += chunk_cool.sum(axis=0)
+            np.maximum(max_heating, chunk_heat.max(axis=0), out=max_heating)
+            np.maximum(max_cooling, chunk_cool.max(axis=0), out=max_cooling)
+            if groups is not None:
+                for chunk_power, group_max in (
+                    (chunk_heat, group_max_heating),
+                    (chunk_cool, group_max_cooling),
+                ):
+                    group_power = np.add.reduceat(
+                        chunk_power[:, group_order], group_starts, axis=1
+                    )
+                    group_max[group_ids] = np.maximum(
+                        group_max[group_ids], group_power.max(axis=0)
+                    )
+            if hourly:
+                t_air[:, steps] = (
+                    chunk_air + air_response * (chunk_heat - chunk_cool)
+                ).T
+                heating[:, steps] = chunk_heat.T
+                cooling[:, steps] = chunk_cool.T
+
+        return SimulationResult(
+            self.thermal_zones,
+            time,
+            heating_demand * self.time_step / 3.6e6,
+            cooling_demand * self.time_step / 3.6e6,
+            max_heating,
+            max_cooling,
+            t_air=t_air,
+            heating=heating,
+            cooling=cooling,
+            group_max_heating=group_max_heating,
+            group_max_cooling=group_max_cooling,
+        )
+
+
+def simulate(thermal_zones, weather, irradiance="perez", hourly=True):
+    """Simulates thermal zones with ideal heating and cooling
+
+    Discretises the models of the zones, see ZoneModels, and simulates them
+    for the period of the weather data. Reuse a ZoneModels instance to
+    simulate the same zones with different weather data.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        ThermalZone instances with calculated model_attr, see
+        Building.calc_building_parameter()
+    weather : WeatherData or str
+        Weather data or path of a .mos weather file, e.g.
+        Project.weather_file_path
+    irradiance : str or callable
+        Sky model of the solar irradiance on the surfaces, "perez" or
+        "isotropic", see solar.get_irradiance(). Alternatively a function
+        irradiance(orientation, tilt) returning the total solar irradiance
+        [W/m2] on a surface with the given orientation and tilt [degree] for
+        all time steps of the weather data. If None, solar radiation is
+        neglected (default: "perez")
+    hourly : bool
+        If True, the results of each time step are recorded, otherwise only
+        demand and maximal power of each zone (default: True)
+
+    Returns
+    -------
+    result : SimulationResult
+        Results of the simulation
+    """
+
+    if not isinstance(weather, WeatherData):
+        weather = read_mos(weather)
+    models = ZoneModels(thermal_zones, time_step=weather.time_step)
+    return models.simulate(weather, irradiance=irradiance, hourly=hourly)
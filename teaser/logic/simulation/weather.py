@@ -0,0 +1,363 @@
+# created October 2026
+
+"""Weather data of Modelica weather files (.mos) for simulations in Python.
+
+The weather files referenced by Project.weather_file_path hold one table of
+hourly values (TMY3 columns as used by AixLib and IBPSA) and a header with
+the location. read_mos() parses such a file into a WeatherData instance.
+
+Parsing the text table is slow compared to the calculations on it, thus the
+parsed table is cached as a column-major .npy file named by the hash of the
+weather file. Later reads map this file into memory: they copy nothing and
+all processes reading the same weather file share the pages of the table.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import teaser.logic.utilities as utilities
+
+# Version of the cache files, increase when the parsed format changes
+CACHE_VERSION = 1
+
+WEATHER_CACHE_SIZE = 8
+"""Maximum number of weather files whose WeatherData is kept in memory by
+read_mos(), 0 disables sharing of WeatherData between reads."""
+
+FILE_HASH_CACHE_SIZE = 256
+"""Maximum number of files whose hash is remembered by file_hash()."""
+
+WeatherCacheInfo = collections.namedtuple(
+    "WeatherCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+_file_hashes = collections.OrderedDict()
+_weather_data = collections.OrderedDict()
+_weather_cache_stats = {"hits": 0, "misses": 0}
+
+MOS_COLUMNS = (
+    "time",
+    "temp_dry_bulb",
+    "temp_dew_point",
+    "relative_humidity",
+    "pressure",
+    "rad_extra_hor",
+    "rad_extra_dir_normal",
+    "rad_infrared_hor",
+    "rad_global_hor",
+    "rad_dir_normal",
+    "rad_diffuse_hor",
+    "illum_global_hor",
+    "illum_dir_normal",
+    "illum_diffuse_hor",
+    "luminance_zenith",
+    "wind_dir",
+    "wind_speed",
+    "sky_cover_total",
+    "sky_cover_opaque",
+    "visibility",
+    "ceiling_height",
+    "weather_observation",
+    "weather_codes",
+    "precipitable_water",
+    "aerosol_optical_depth",
+    "snow_depth",
+    "days_since_snowfall",
+    "albedo",
+    "precipitation_depth",
+    "precipitation_quantity",
+)
+
+
+class WeatherData(object):
+    """Hourly weather data of a Modelica weather file
+
+    Parameters
+    ----------
+    table : numpy.ndarray
+        Values of the weather file, one row per time step and one column
+        per entry of MOS_COLUMNS (units as in the weather file, e.g. time in
+        s, temperatures in degree Celsius and radiation in Wh/m2)
+    latitude : float [degree]
+        Latitude of the location (default: None)
+    longitude : float [degree]
+        Longitude of the location (default: None)
+    time_zone : float [h]
+        Time zone of the location relative to UTC (default: None)
+    elevation : float [m]
+        Elevation of the location (default: None)
+
+    Attributes
+    ----------
+    table : numpy.ndarray
+        Values of the weather file, see MOS_COLUMNS for the columns
+    latitude : float [degree]
+        Latitude of the location
+    longitude : float [degree]
+        Longitude of the location
+    time_zone : float [h]
+        Time zone of the location relative to UTC
+    elevation : float [m]
+        Elevation of the location
+    irradiance_cache : collections.OrderedDict
+        Irradiance on tilted surfaces computed from this weather data, in
+        the order of their last use, see solar.get_irradiance()
+    """
+
+    def __init__(
+        self, table, latitude=None, longitude=None, time_zone=None, elevation=None
+    ):
+
+        self.table = table
+        self.latitude = latitude
+        self.longitude = longitude
+        self.time_zone = time_zone
+        self.elevation = elevation
+        self.irradiance_cache = collections.OrderedDict()
+
+    def column(self, name):
+        """Values of one column, e.g. "temp_dry_bulb"
+
+        Parameters
+        ----------
+        name : str
+            Name of the column, see MOS_COLUMNS
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Values of the column for all time steps
+        """
+
+        return self.table[:, MOS_COLUMNS.index(name)]
+
+    @property
+    def time_step(self):
+        """Time step of the weather data [s]"""
+
+        time = self.column("time")
+        return float(time[1] - time[0])
+
+
+def weather_cache_path():
+    """Default directory of the weather cache in the TEASER output folder"""
+
+    return os.path.join(utilities.get_default_path(), "weather_cache")
+
+
+def file_hash(path):
+    """SHA-256 hash of a file
+
+    The hash is remembered as long as size and modification time of the file
+    do not change, so repeated reads of one weather file hash it only once.
+    The hashes of the FILE_HASH_CACHE_SIZE most recently hashed files are
+    kept.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file
+
+    Returns
+    -------
+    hash : str
+        Hexadecimal SHA-256 hash of the contents of the file
+    """
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    version = (stat.st_size, stat.st_mtime_ns)
+    try:
+        hashed_version, digest = _file_hashes[path]
+    except KeyError:
+        hashed_version = None
+    if hashed_version == version:
+        _file_hashes.move_to_end(path)
+        return digest
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            sha.update(block)
+    digest = sha.hexdigest()
+    if FILE_HASH_CACHE_SIZE > 0:
+        _file_hashes[path] = (version, digest)
+        _file_hashes.move_to_end(path)
+        if len(_file_hashes) > FILE_HASH_CACHE_SIZE:
+            _file_hashes.popitem(last=False)
+    return digest
+
+
+def read_mos(path, cache=True, cache_dir=None):
+    """Reads a Modelica weather file
+
+    With cache, the table is read from the cache of the weather file if it
+    exists, otherwise the file is parsed and the cache is written. The
+    table of cached weather data is a read-only memory map and all reads of
+    one weather file share one WeatherData, as long as the file is one of
+    the WEATHER_CACHE_SIZE most recently read files (see
+    weather_cache_info() and clear_weather_cache()).
+
+    Parameters
+    ----------
+    path : str
+        Path of the .mos weather file, e.g. Project.weather_file_path
+    cache : bool
+        Use the cache of parsed weather files (default: True)
+    cache_dir : str
+        Directory of the cache (default: weather_cache_path())
+
+    Returns
+    -------
+    weather : WeatherData
+        Values and location of the weather file
+    """
+
+    if not cache:
+        return parse_mos(path)
+
+    if cache_dir is None:
+        cache_dir = weather_cache_path()
+    name = os.path.join(cache_dir, file_hash(path) + "_v" + str(CACHE_VERSION))
+    weather = _weather_data.get(name)
+    if weather is not None:
+        _weather_data.move_to_end(name)
+        _weather_cache_stats["hits"] += 1
+        return weather
+    _weather_cache_stats["misses"] += 1
+    try:
+        table = np.load(name + ".npy", mmap_mode="r")
+        with open(name + ".json", "r") as location_file:
+            location = json.load(location_file)
+    except (OSError, ValueError):
+        weather = parse_mos(path)
+        try:
+            _write_cache(name, weather)
+        except OSError:
+            return weather
+        table = np.load(name + ".npy", mmap_mode="r")
+        location = _location(weather)
+    weather = WeatherData(table, **location)
+    if WEATHER_CACHE_SIZE > 0:
+        _weather_data[name] = weather
+        if len(_weather_data) > WEATHER_CACHE_SIZE:
+            _weather_data.popitem(last=False)
+    return weather
+
+
+def weather_cache_info():
+    """Statistics of the WeatherData kept in memory by read_mos()
+
+    Returns
+    -------
+    cache_info : WeatherCacheInfo
+        Named tuple with hits, misses, maxsize and currsize of the cache
+    """
+
+    return WeatherCacheInfo(
+        hits=_weather_cache_stats["hits"],
+        misses=_weather_cache_stats["misses"],
+        maxsize=WEATHER_CACHE_SIZE,
+        currsize=len(_weather_data),
+    )
+
+
+def clear_weather_cache():
+    """Releases all WeatherData and file hashes kept in memory
+
+    The memory maps of the cached tables are closed once no other reference
+    to their WeatherData is left. The cache files on disk are kept.
+    """
+
+    _weather_data.clear()
+    _file_hashes.clear()
+    _weather_cache_stats["hits"] = 0
+    _weather_cache_stats["misses"] = 0
+
+
+def _location(weather):
+    return {
+        "latitude": weather.latitude,
+        "longitude": weather.longitude,
+        "time_zone": weather.time_zone,
+        "elevation": weather.elevation,
+    }
+
+
+def _write_cache(name, weather):
+    """Writes the cache files of parsed weather data
+
+    The files are written to temporary files first and then renamed, so
+    other processes never read incomplete files. The location is written
+    last, as read_mos() only uses a cache with both files.
+    """
+
+    directory = utilities.create_path(os.path.dirname(name))
+    for suffix, write in (
+        (".npy", lambda file: np.save(file, np.asfortranarray(weather.table))),
+        (".json", lambda file: file.write(json.dumps(_location(weather)).encode())),
+    ):
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=suffix)
+        try:
+            with os.fdopen(handle, "wb") as file:
+                write(file)
+            os.replace(temp_path, name + suffix)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def parse_mos(path):
+    """Parses a Modelica weather file without using the cache
+
+    Parameters
+    ----------
+    path : str
+        Path of the .mos weather file, e.g. Project.weather_file_path
+
+    Returns
+    -------
+    weather : WeatherData
+        Values and location of the weather file
+    """
+
+    location = {}
+    shape = None
+    header_lines = 0
+    with open(path, "r", encoding="latin-1") as weather_file:
+        for line in weather_file:
+            if line.startswith("#"):
+                if line.startswith("#LOCATION"):
+                    fields = line.strip().split(",")
+                    location = {
+                        "latitude": float(fields[6]),
+                        "longitude": float(fields[7]),
+                        "time_zone": float(fields[8]),
+                        "elevation": float(fields[9]),
+                    }
+            elif line.startswith("double"):
+                rows, columns = line[line.index("(") + 1 : line.index(")")].split(",")
+                shape = (int(rows), int(columns))
+            else:
+                break
+            header_lines += 1
+
+    if shape is None:
+        raise ValueError("No table found in weather file " + str(path))
+
+    table = pd.read_csv(
+        path,
+        sep=r"\s+",
+        header=None,
+        skiprows=header_lines,
+        usecols=range(shape[1]),
+        encoding="latin-1",
+        dtype=np.float64,
+    ).to_numpy()
+    return WeatherData(table, **location)
@@ -11,6 +11,8 @@ import operator
 
 ops = {"/": operator.truediv}
 
+_year_index = None
+
 
 def celsius_to_kelvin(value):
     try:
@@ -42,13 +44,16 @@ def create_path(path):
 
 def get_default_path():
     """Function to construct default path to OutputData folder
-    This function constructs the default path to the OutputData folder
+    This function constructs the default path to the OutputData folder and
+    creates the folder if it does not exist yet
 
     """
 
     home_path = os.path.expanduser('~')
 
     teaser_default_path = os.path.join(home_path, 'TEASEROutput')
+    if not os.path.isdir(teaser_default_path):
+        os.makedirs(teaser_default_path, exist_ok=True)
 
     # directory = os.path.dirname(__file__)
     # src = "teaser"
@@ -131,3 +136,50 @@ def division_from_json(ordereddict):
                 raise ValueError('%s not supported, only divions (/)', op)
     else:
         raise ValueError('%s has len > 1', ordereddict)
+
+
+def get_year_index():
+    """Index of one year in hourly time steps
+
+    The index ("01-01 00:00:00" to "12-31 23:00:00") is built once and shared
+    by all schedules and exported boundary tables. pandas.Index objects are
+    immutable, thus the shared index can not be changed by accident.
+
+    Returns
+    -------
+    year_index : pandas.Index
+        8760 hourly time steps of a year formatted as "%m-%d %H:%M:%S"
+
+    """
+    global _year_index
+    if _year_index is None:
+        import pandas as pd
+
+        _year_index = pd.Index(
+            pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
+            .to_series()
+            .dt.strftime("%m-%d %H:%M:%S")
+        )
+    return _year_index
+
+
+def expand_profile(profile, periods=8760):
+    """Repeat a profile cyclically for a number of time steps
+
+    Parameters
+    ----------
+    profile : list
+        Values of the profile, e.g. 24 hourly values of one day
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Profile repeated (and truncated) to the given number of time steps,
+        the dtype is inferred from the values of the profile
+
+    """
+    import numpy as np
+
+    return np.resize(np.asarray(profile), periods)
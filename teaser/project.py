@@ -1,49 +1,152 @@
 """This module includes the Project class, which is the API for TEASER."""
 
+import collections
 import warnings
 import os
 import re
 import teaser.logic.utilities as utilities
-import teaser.data.input.teaserjson_input as tjson_in
-import teaser.data.output.teaserjson_output as tjson_out
-import teaser.data.output.aixlib_output as aixlib_output
-import teaser.data.output.ibpsa_output as ibpsa_output
+import teaser.logic.parallel as parallel
 from teaser.data.dataclass import DataClass
-from teaser.logic.archetypebuildings.bmvbs.office import Office
-from teaser.logic.archetypebuildings.bmvbs.custom.institute import Institute
-from teaser.logic.archetypebuildings.bmvbs.custom.institute4 import Institute4
-from teaser.logic.archetypebuildings.bmvbs.custom.institute8 import Institute8
-from teaser.logic.archetypebuildings.urbanrenet.est1a import EST1a
-from teaser.logic.archetypebuildings.urbanrenet.est1b import EST1b
-from teaser.logic.archetypebuildings.urbanrenet.est2 import EST2
-from teaser.logic.archetypebuildings.urbanrenet.est3 import EST3
-from teaser.logic.archetypebuildings.urbanrenet.est4a import EST4a
-from teaser.logic.archetypebuildings.urbanrenet.est4b import EST4b
-from teaser.logic.archetypebuildings.urbanrenet.est5 import EST5
-from teaser.logic.archetypebuildings.urbanrenet.est6 import EST6
-from teaser.logic.archetypebuildings.urbanrenet.est7 import EST7
-from teaser.logic.archetypebuildings.urbanrenet.est8a import EST8a
-from teaser.logic.archetypebuildings.urbanrenet.est8b import EST8b
-from teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse import (
-    SingleFamilyHouse,
-)
-from teaser.logic.archetypebuildings.tabula.dk.singlefamilyhouse import (
-    SingleFamilyHouse as SingleFamilyHouse_DK,
-)
-from teaser.logic.archetypebuildings.tabula.de.terracedhouse import TerracedHouse
-from teaser.logic.archetypebuildings.tabula.dk.terracedhouse import (
-    TerracedHouse as TerracedHouse_DK,
-)
-from teaser.logic.archetypebuildings.tabula.de.multifamilyhouse import MultiFamilyHouse
-from teaser.logic.archetypebuildings.tabula.de.apartmentblock import ApartmentBlock
-from teaser.logic.archetypebuildings.tabula.dk.apartmentblock import (
-    ApartmentBlock as ApartmentBlock_DK,
-)
-from teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling import (
-    SingleFamilyDwelling,
-)
+from teaser.logic.archetypebuildings.registry import get_archetype
 from teaser.logic.simulation.modelicainfo import ModelicaInfo
 
+_ExportedBuilding = collections.namedtuple("_ExportedBuilding", ["name"])
+
+
+def _changes_members(method):
+    """Wraps a list method to recount the members of the building list"""
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._count_members()
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class BuildingList(list):
+    """List of the buildings of a project
+
+    A list which counts its buildings by identity, thus membership tests
+    ("bldg in prj.buildings") take constant time, and which finds buildings
+    by internal_id or name through an index. The index is built on the first
+    lookup and reset by all changes of the list and of the internal_id or
+    name of its buildings.
+
+    Parameters
+    ----------
+    buildings : list
+        Buildings of the list (default: empty)
+    """
+
+    def __init__(self, buildings=()):
+        super(BuildingList, self).__init__(buildings)
+        self._count_members()
+
+    def __reduce__(self):
+        return type(self), (), None, iter(self)
+
+    def _count_members(self):
+        self._members = collections.Counter(map(id, self))
+        self._index = None
+
+    def __contains__(self, bldg):
+        return id(bldg) in self._members
+
+    def append(self, bldg):
+        super(BuildingList, self).append(bldg)
+        self._members[id(bldg)] += 1
+        self._index = None
+
+    def pop(self, index=-1):
+        bldg = super(BuildingList, self).pop(index)
+        self._discard(bldg)
+        return bldg
+
+    def remove(self, bldg):
+        for index, item in enumerate(self):
+            if item is bldg or item == bldg:
+                del self[index]
+                return
+        raise ValueError("Building is not in the list of buildings")
+
+    def _discard(self, bldg):
+        key = id(bldg)
+        self._members[key] -= 1
+        if self._members[key] <= 0:
+            del self._members[key]
+        self._index = None
+
+    def remove_buildings(self, buildings):
+        """Removes many buildings in one pass
+
+        Parameters
+        ----------
+        buildings : list
+            Buildings to remove, buildings not in the list are ignored
+        """
+
+        removed = set(map(id, buildings))
+        self[:] = [bldg for bldg in self if id(bldg) not in removed]
+
+    def reset_index(self):
+        """Resets the index of internal_id and name, e.g. after a rename"""
+
+        self._index = None
+
+    def find_by_internal_id(self, internal_id):
+        """Buildings with the given internal_id
+
+        Parameters
+        ----------
+        internal_id : float
+            internal_id of the buildings
+
+        Returns
+        -------
+        buildings : list
+            Buildings with this internal_id in the order of the list
+        """
+
+        return list(self._lookup()[0].get(internal_id, ()))
+
+    def find_by_name(self, name):
+        """Buildings with the given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the buildings
+
+        Returns
+        -------
+        buildings : list
+            Buildings with this name in the order of the list
+        """
+
+        return list(self._lookup()[1].get(name, ()))
+
+    def _lookup(self):
+        if self._index is None:
+            by_internal_id = {}
+            by_name = {}
+            for bldg in self:
+                by_internal_id.setdefault(bldg.internal_id, []).append(bldg)
+                by_name.setdefault(bldg.name, []).append(bldg)
+            self._index = (by_internal_id, by_name)
+        return self._index
+
+    extend = _changes_members(list.extend)
+    insert = _changes_members(list.insert)
+    clear = _changes_members(list.clear)
+    sort = _changes_members(list.sort)
+    reverse = _changes_members(list.reverse)
+    __setitem__ = _changes_members(list.__setitem__)
+    __delitem__ = _changes_members(list.__delitem__)
+    __iadd__ = _changes_members(list.__iadd__)
+    __imul__ = _changes_members(list.__imul__)
+
 
 class Project(object):
     """Top class for TEASER projects it serves as an API
@@ -70,8 +173,9 @@ class Project(object):
     modelica_info : instance of ModelicaInfo
         TEASER instance of ModelicaInfo to store Modelica related
         information, like used compiler, start and stop time, etc.
-    buildings : list
-        List of all buildings in one project, instances of Building()
+    buildings : BuildingList
+        List of all buildings in one project, instances of Building(). Any
+        list assigned to buildings is converted to a BuildingList.
     data : instance of DataClass
         TEASER instance of DataClass containing JSON binding classes
     weather_file_path : str
@@ -135,7 +239,7 @@ class Project(object):
         """
         return DataClass()
 
-    def calc_all_buildings(self, raise_errors=False):
+    def calc_all_buildings(self, raise_errors=False, workers=None):
         """Calculates values for all project buildings
 
         You need to set the following parameters in the Project class.
@@ -153,8 +257,48 @@ class Project(object):
         used_library_calc : str
             used library (AixLib and IBPSA are supported)
 
+        Parameters
+        ----------
+        raise_errors : bool
+            If True, errors of the calculation are raised. If False, buildings
+            that can't be calculated are removed from the buildings list.
+            Default is False.
+        workers : int
+            Number of worker processes calculating the buildings in parallel,
+            see teaser.logic.parallel. Default is None, calculating all
+            buildings in this process.
+
         """
-        if raise_errors is True:
+        if workers is not None and workers > 1:
+            calculation = parallel.map_buildings(
+                project=self,
+                jobs=[(list(reversed(self.buildings)), None)],
+                task="calc_building_parameter",
+                kwargs={
+                    "number_of_elements": self._number_of_elements_calc,
+                    "merge_windows": self._merge_windows_calc,
+                    "used_library": self._used_library_calc,
+                },
+                workers=workers,
+                continue_on=() if raise_errors else (ZeroDivisionError, TypeError),
+            )
+            failed = []
+            for bldg, error in calculation:
+                if error is None:
+                    continue
+                if raise_errors or not isinstance(
+                    error, (ZeroDivisionError, TypeError)
+                ):
+                    raise error
+                warnings.warn(
+                    "Following building can't be calculated and is "
+                    "removed from buildings list. Use raise_errors=True "
+                    "to get python errors and stop TEASER from deleting "
+                    "this building:" + bldg.name
+                )
+                failed.append(bldg)
+            self.buildings.remove_buildings(failed)
+        elif raise_errors is True:
             for bldg in reversed(self.buildings):
                 bldg.calc_building_parameter(
                     number_of_elements=self._number_of_elements_calc,
@@ -162,6 +306,7 @@ class Project(object):
                     used_library=self._used_library_calc,
                 )
         else:
+            failed = []
             for bldg in reversed(self.buildings):
                 try:
                     bldg.calc_building_parameter(
@@ -176,7 +321,80 @@ class Project(object):
                         "to get python errors and stop TEASER from deleting "
                         "this building:" + bldg.name
                     )
-                    self.buildings.remove(bldg)
+                    failed.append(bldg)
+            self.buildings.remove_buildings(failed)
+
+    def calc_annual_demand(self, weather_file_path=None, irradiance="perez"):
+        """Annual heating and cooling demand of all project buildings
+
+        Simulates all thermal zones of the project together with the VDI 6007
+        models of teaser.logic.simulation.vdi6007, using the calculated
+        parameters of the zones (call calc_all_buildings() first), the
+        schedules of their use conditions and the weather file. This gives
+        demand and peak loads without a Modelica export; air handling units
+        are not simulated.
+
+        Parameters
+        ----------
+        weather_file_path : str
+            Path of a .mos weather file of one year, default is the
+            weather_file_path of the project
+        irradiance : str
+            Sky model of the solar irradiance, "perez" or "isotropic", or
+            None to neglect solar radiation. Default is "perez".
+
+        Returns
+        -------
+        demand : pandas.DataFrame
+            One row per building with the columns name, net_leased_area
+            [m2], heating_demand [kWh], cooling_demand [kWh],
+            max_heating_load [W] and max_cooling_load [W]. The peak loads
+            are the maxima of the sum of all zones of a building.
+        """
+        import numpy as np
+        import pandas as pd
+        import teaser.logic.simulation.vdi6007 as vdi6007
+
+        if weather_file_path is None:
+            weather_file_path = self.weather_file_path
+
+        zones = []
+        groups = []
+        for index, bldg in enumerate(self.buildings):
+            zones.extend(bldg.thermal_zones)
+            groups.extend([index] * len(bldg.thermal_zones))
+
+        n_buildings = len(self.buildings)
+        columns = {
+            "heating_demand": np.zeros(n_buildings),
+            "cooling_demand": np.zeros(n_buildings),
+            "max_heating_load": np.zeros(n_buildings),
+            "max_cooling_load": np.zeros(n_buildings),
+        }
+        if zones:
+            result = vdi6007.ZoneModels(zones).simulate(
+                weather_file_path, irradiance=irradiance, hourly=False, groups=groups
+            )
+            for column, values in (
+                ("heating_demand", result.heating_demand),
+                ("cooling_demand", result.cooling_demand),
+            ):
+                columns[column] = np.bincount(
+                    groups, weights=values, minlength=n_buildings
+                )
+            for column, values in (
+                ("max_heating_load", result.group_max_heating),
+                ("max_cooling_load", result.group_max_cooling),
+            ):
+                columns[column][: len(values)] = values
+
+        return pd.DataFrame(
+            {
+                "name": [bldg.name for bldg in self.buildings],
+                "net_leased_area": [bldg.net_leased_area for bldg in self.buildings],
+                **columns,
+            }
+        )
 
     def retrofit_all_buildings(
         self,
@@ -184,6 +402,7 @@ class Project(object):
         type_of_retrofit=None,
         window_type=None,
         material=None,
+        workers=None,
     ):
         """Retrofits all buildings in the project.
 
@@ -225,15 +444,20 @@ class Project(object):
             Default: EnEv 2014, only 'iwu'/'bmbvs' archetype approach.
         material : str
             Default: EPS035, only 'iwu'/'bmbvs' archetype approach.
+        workers : int
+            Number of worker processes retrofitting the buildings in parallel,
+            see teaser.logic.parallel. Default is None, retrofitting all
+            buildings in this process.
 
         """
         ass_error_type = "only 'retrofit' and 'adv_retrofit' are valid "
         assert type_of_retrofit in [None, "adv_retrofit", "retrofit"], ass_error_type
         tabula_buildings = []
         iwu_buildings = []
+        tabula_class = get_archetype("tabula_de", "single_family_house")
 
         for bldg in self.buildings:
-            if isinstance(bldg, SingleFamilyHouse):
+            if isinstance(bldg, tabula_class):
                 if type_of_retrofit is None:
                     raise ValueError(
                         "you need to set type_of_retrofit for " "TABULA retrofit"
@@ -244,27 +468,53 @@ class Project(object):
                     raise ValueError("you need to set year_of_retrofit for " "retrofit")
                 iwu_buildings.append(bldg)
 
-        if self.data.used_statistic == "iwu":
-            for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
-                    year_of_retrofit=year_of_retrofit,
-                    window_type=window_type,
-                    material=material,
+        iwu_kwargs = {
+            "year_of_retrofit": year_of_retrofit,
+            "window_type": window_type,
+            "material": material,
+        }
+        tabula_kwargs = {"type_of_retrofit": type_of_retrofit}
+
+        if workers is not None and workers > 1:
+            if self.data.used_statistic == "iwu":
+                iwu_data = self.data
+                tabula_data = DataClass(used_statistic="tabula_de")
+                self_data = tabula_data
+            else:
+                tabula_data = self.data
+                iwu_data = DataClass(used_statistic="iwu")
+                self_data = iwu_data
+            for kwargs, buildings, data in [
+                (iwu_kwargs, iwu_buildings, iwu_data),
+                (tabula_kwargs, tabula_buildings, tabula_data),
+            ]:
+                if not buildings:
+                    continue
+                retrofit = parallel.map_buildings(
+                    project=self,
+                    jobs=[(buildings, parallel.data_class_args(data))],
+                    task="retrofit_building",
+                    kwargs=kwargs,
+                    workers=workers,
                 )
+                for bldg, error in retrofit:
+                    if error is not None:
+                        raise error
+            self.data = self_data
+
+        elif self.data.used_statistic == "iwu":
+            for bld_iwu in iwu_buildings:
+                bld_iwu.retrofit_building(**iwu_kwargs)
             self.data = DataClass(used_statistic="tabula_de")
             for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
+                bld_tabula.retrofit_building(**tabula_kwargs)
 
         else:
             for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
+                bld_tabula.retrofit_building(**tabula_kwargs)
             self.data = DataClass(used_statistic="iwu")
             for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
-                    year_of_retrofit=year_of_retrofit,
-                    window_type=window_type,
-                    material=material,
-                )
+                bld_iwu.retrofit_building(**iwu_kwargs)
 
     def add_non_residential(
         self,
@@ -392,7 +642,7 @@ class Project(object):
 
         if usage == "office":
 
-            type_bldg = Office(
+            type_bldg = get_archetype("bmvbs", "office")(
                 self,
                 name,
                 year_of_construction,
@@ -408,7 +658,7 @@ class Project(object):
 
         elif usage == "institute":
 
-            type_bldg = Institute(
+            type_bldg = get_archetype("bmvbs", "institute")(
                 self,
                 name,
                 year_of_construction,
@@ -424,7 +674,7 @@ class Project(object):
 
         elif usage == "institute4":
 
-            type_bldg = Institute4(
+            type_bldg = get_archetype("bmvbs", "institute4")(
                 self,
                 name,
                 year_of_construction,
@@ -440,7 +690,7 @@ class Project(object):
 
         elif usage == "institute8":
 
-            type_bldg = Institute8(
+            type_bldg = get_archetype("bmvbs", "institute8")(
                 self,
                 name,
                 year_of_construction,
@@ -454,7 +704,8 @@ class Project(object):
                 construction_type,
             )
 
-        type_bldg.generate_archetype()
+        with type_bldg.bulk_update():
+            type_bldg.generate_archetype()
         type_bldg.calc_building_parameter(
             number_of_elements=self._number_of_elements_calc,
             merge_windows=self._merge_windows_calc,
@@ -643,7 +894,7 @@ class Project(object):
 
             if usage == "single_family_house":
 
-                type_bldg = SingleFamilyHouse(
+                type_bldg = get_archetype("tabula_de", "single_family_house")(
                     self,
                     name,
                     year_of_construction,
@@ -654,12 +905,13 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
             elif usage == "terraced_house":
 
-                type_bldg = TerracedHouse(
+                type_bldg = get_archetype("tabula_de", "terraced_house")(
                     self,
                     name,
                     year_of_construction,
@@ -670,12 +922,13 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
             elif usage == "multi_family_house":
 
-                type_bldg = MultiFamilyHouse(
+                type_bldg = get_archetype("tabula_de", "multi_family_house")(
                     self,
                     name,
                     year_of_construction,
@@ -686,12 +939,13 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
             elif usage == "apartment_block":
 
-                type_bldg = ApartmentBlock(
+                type_bldg = get_archetype("tabula_de", "apartment_block")(
                     self,
                     name,
                     year_of_construction,
@@ -703,7 +957,8 @@ class Project(object):
                     construction_type,
                 )
 
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
         elif method == "tabula_dk":
@@ -724,7 +979,7 @@ class Project(object):
 
             if usage == "single_family_house":
 
-                type_bldg = SingleFamilyHouse_DK(
+                type_bldg = get_archetype("tabula_dk", "single_family_house")(
                     self,
                     name,
                     year_of_construction,
@@ -735,12 +990,13 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
             elif usage == "terraced_house":
 
-                type_bldg = TerracedHouse_DK(
+                type_bldg = get_archetype("tabula_dk", "terraced_house")(
                     self,
                     name,
                     year_of_construction,
@@ -751,12 +1007,13 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
             elif usage == "apartment_block":
 
-                type_bldg = ApartmentBlock_DK(
+                type_bldg = get_archetype("tabula_dk", "apartment_block")(
                     self,
                     name,
                     year_of_construction,
@@ -767,7 +1024,8 @@ class Project(object):
                     internal_gains_mode,
                     construction_type,
                 )
-                type_bldg.generate_archetype()
+                with type_bldg.bulk_update():
+                    type_bldg.generate_archetype()
                 return type_bldg
 
         elif method == "iwu":
@@ -785,7 +1043,7 @@ class Project(object):
 
             if usage == "single_family_dwelling":
 
-                type_bldg = SingleFamilyDwelling(
+                type_bldg = get_archetype("iwu", "single_family_dwelling")(
                     self,
                     name,
                     year_of_construction,
@@ -830,7 +1088,7 @@ class Project(object):
             ], ass_error_usage_urn
             if usage == "est1a":
 
-                type_bldg = EST1a(
+                type_bldg = get_archetype("urbanrenet", "est1a")(
                     self,
                     name,
                     year_of_construction,
@@ -845,7 +1103,7 @@ class Project(object):
 
             elif usage == "est1b":
 
-                type_bldg = EST1b(
+                type_bldg = get_archetype("urbanrenet", "est1b")(
                     self,
                     name,
                     year_of_construction,
@@ -861,7 +1119,7 @@ class Project(object):
 
             elif usage == "est2":
 
-                type_bldg = EST2(
+                type_bldg = get_archetype("urbanrenet", "est2")(
                     self,
                     name,
                     year_of_construction,
@@ -877,7 +1135,7 @@ class Project(object):
 
             elif usage == "est3":
 
-                type_bldg = EST3(
+                type_bldg = get_archetype("urbanrenet", "est3")(
                     self,
                     name,
                     year_of_construction,
@@ -893,7 +1151,7 @@ class Project(object):
 
             elif usage == "est4a":
 
-                type_bldg = EST4a(
+                type_bldg = get_archetype("urbanrenet", "est4a")(
                     self,
                     name,
                     year_of_construction,
@@ -909,7 +1167,7 @@ class Project(object):
 
             elif usage == "est4b":
 
-                type_bldg = EST4b(
+                type_bldg = get_archetype("urbanrenet", "est4b")(
                     self,
                     name,
                     year_of_construction,
@@ -925,7 +1183,7 @@ class Project(object):
 
             elif usage == "est5":
 
-                type_bldg = EST5(
+                type_bldg = get_archetype("urbanrenet", "est5")(
                     self,
                     name,
                     year_of_construction,
@@ -941,7 +1199,7 @@ class Project(object):
 
             elif usage == "est6":
 
-                type_bldg = EST6(
+                type_bldg = get_archetype("urbanrenet", "est6")(
                     self,
                     name,
                     year_of_construction,
@@ -957,7 +1215,7 @@ class Project(object):
 
             elif usage == "est7":
 
-                type_bldg = EST7(
+                type_bldg = get_archetype("urbanrenet", "est7")(
                     self,
                     name,
                     year_of_construction,
@@ -973,7 +1231,7 @@ class Project(object):
 
             elif usage == "est8a":
 
-                type_bldg = EST8a(
+                type_bldg = get_archetype("urbanrenet", "est8a")(
                     self,
                     name,
                     year_of_construction,
@@ -989,7 +1247,7 @@ class Project(object):
 
             elif usage == "est8b":
 
-                type_bldg = EST8b(
+                type_bldg = get_archetype("urbanrenet", "est8b")(
                     self,
                     name,
                     year_of_construction,
@@ -1003,7 +1261,8 @@ class Project(object):
                     number_of_apartments,
                 )
 
-        type_bldg.generate_archetype()
+        with type_bldg.bulk_update():
+            type_bldg.generate_archetype()
         type_bldg.calc_building_parameter(
             number_of_elements=self._number_of_elements_calc,
             merge_windows=self._merge_windows_calc,
@@ -1011,6 +1270,133 @@ class Project(object):
         )
         return type_bldg
 
+    def generate_buildings(
+        self, descriptors, export=False, library="AixLib", path=None, keep=False
+    ):
+        """Generates archetype buildings one by one from a list of descriptors
+
+        This generator adds one archetype building after the other to the
+        project (using add_residential() or add_non_residential(), depending
+        on the method), calculates its parameters with the settings of the
+        project and yields it. By default the building is removed from the
+        buildings list of the project once the next building is requested,
+        thus large numbers of buildings (e.g. all buildings of a city) can be
+        generated without holding all of them in memory. Optionally each
+        building is exported right after its calculation, the package of the
+        project listing all exported buildings is written when the generator
+        is exhausted or closed.
+
+        Parameters
+        ----------
+        descriptors : iterable or pandas.DataFrame
+            Descriptors of the buildings, each one a dict (or row of a
+            DataFrame) with the keywords of add_residential() or
+            add_non_residential(), e.g. method, usage, name,
+            year_of_construction, number_of_floors, height_of_floors and
+            net_leased_area. Missing (NaN) values of a DataFrame row are
+            omitted, thus the default of the keyword is used. Method 'bmvbs'
+            generates non-residential buildings, all others residential
+            buildings.
+        export : bool
+            If True, each building is exported with the exporter of
+            used_library_calc (see export_aixlib() and export_ibpsa()).
+            Default is False.
+        library : str
+            Used library within the framework of IBPSA library, only used
+            for export with used_library_calc 'IBPSA', see export_ibpsa().
+        path : str
+            if the Files should not be stored in default output path of TEASER,
+            an alternative path can be specified as a full path
+        keep : bool
+            If True, buildings are kept in the buildings list of the project.
+            Default is False.
+
+        Yields
+        ------
+        type_bldg : Instance of Archetype Building
+            Generated and calculated (and exported) building
+
+        """
+        import pandas as pd
+        import teaser.data.output.aixlib_output as aixlib_output
+        import teaser.data.output.ibpsa_output as ibpsa_output
+
+        if isinstance(descriptors, pd.DataFrame):
+            columns = list(descriptors.columns)
+            descriptors = (
+                {
+                    key: value.item() if hasattr(value, "item") else value
+                    for key, value in zip(columns, row)
+                    if not (pd.api.types.is_scalar(value) and pd.isna(value))
+                }
+                for row in descriptors.itertuples(index=False, name=None)
+            )
+
+        if export is True:
+            if path is None:
+                path = os.path.join(utilities.get_default_path(), self.name)
+            else:
+                path = os.path.join(path, self.name)
+            utilities.create_path(path)
+
+        exported = []
+        uses = None
+        try:
+            for descriptor in descriptors:
+                kwargs = dict(descriptor)
+                if kwargs["method"] == "bmvbs":
+                    type_bldg = self.add_non_residential(**kwargs)
+                else:
+                    type_bldg = self.add_residential(**kwargs)
+                    if kwargs["method"] in ["tabula_de", "tabula_dk"]:
+                        type_bldg.calc_building_parameter(
+                            number_of_elements=self._number_of_elements_calc,
+                            merge_windows=self._merge_windows_calc,
+                            used_library=self._used_library_calc,
+                        )
+
+                if export is True:
+                    if type_bldg.building_id is None:
+                        type_bldg.building_id = len(exported)
+                    if self.used_library_calc == "AixLib":
+                        aixlib_output.export_multizone(
+                            buildings=[type_bldg],
+                            prj=self,
+                            path=path,
+                            project_package=False,
+                        )
+                        used_library = "AixLib"
+                        version = type_bldg.library_attr.version
+                    else:
+                        ibpsa_output.export_ibpsa(
+                            buildings=[type_bldg],
+                            prj=self,
+                            path=path,
+                            library=library,
+                            project_package=False,
+                        )
+                        used_library = library
+                        version = type_bldg.library_attr.version[library]
+                    if uses is None:
+                        uses = [
+                            'Modelica(version="' + self.modelica_info.version + '")',
+                            used_library + '(version="' + version + '")',
+                        ]
+                    exported.append(_ExportedBuilding(type_bldg.name))
+
+                yield type_bldg
+
+                if keep is False:
+                    if self.buildings and self.buildings[-1] is type_bldg:
+                        self.buildings.pop()
+                    else:
+                        self.buildings.remove(type_bldg)
+        finally:
+            if exported:
+                aixlib_output.export_project_package(
+                    prj=self, path=path, package_list=exported, uses=uses
+                )
+
     def save_project(self, file_name=None, path=None):
         """Saves the project to a JSON file
 
@@ -1025,6 +1411,8 @@ class Project(object):
             if the Files should not be stored in OutputData, an alternative
             can be specified
         """
+        import teaser.data.output.teaserjson_output as tjson_out
+
         if file_name is None:
             name = self.name
         else:
@@ -1048,6 +1436,7 @@ class Project(object):
             full path to a json file
 
         """
+        import teaser.data.input.teaserjson_input as tjson_in
 
         tjson_in.load_teaser_json(path, self)
 
@@ -1058,6 +1447,10 @@ class Project(object):
         corG=None,
         internal_id=None,
         path=None,
+        workers=None,
+        raise_errors=True,
+        progress=None,
+        file_format=None,
     ):
         """Exports values to a record file for Modelica simulation
 
@@ -1079,7 +1472,24 @@ class Project(object):
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        workers : int
+            Number of worker processes exporting the buildings in parallel,
+            see aixlib_output.export_multizone(). Default is None, exporting
+            all buildings in this process.
+        raise_errors : bool
+            If True, errors of the export are raised. If False, buildings
+            that can't be exported are left out of the project package.
+            Default is True.
+        progress : callable
+            Called after each exported building with the number of finished
+            buildings and the number of all buildings. Default is None.
+        file_format : str
+            Format of the boundary condition tables, 'txt' for text files or
+            'mat' for binary matfiles (-v4). It is set as file_format of the
+            library_attr of the exported buildings. Default is None, keeping
+            the format of each building ('txt' unless changed).
         """
+        import teaser.data.output.aixlib_output as aixlib_output
 
         if building_model is not None or zone_model is not None or corG is not None:
 
@@ -1099,17 +1509,31 @@ class Project(object):
 
         if internal_id is None:
             aixlib_output.export_multizone(
-                buildings=self.buildings, prj=self, path=path
+                buildings=self.buildings,
+                prj=self,
+                path=path,
+                workers=workers,
+                raise_errors=raise_errors,
+                progress=progress,
+                file_format=file_format,
             )
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    aixlib_output.export_multizone(
-                        buildings=[bldg], prj=self, path=path
-                    )
+            for bldg in self.buildings.find_by_internal_id(internal_id):
+                aixlib_output.export_multizone(
+                    buildings=[bldg], prj=self, path=path, file_format=file_format
+                )
         return path
 
-    def export_ibpsa(self, library="AixLib", internal_id=None, path=None):
+    def export_ibpsa(
+        self,
+        library="AixLib",
+        internal_id=None,
+        path=None,
+        workers=None,
+        raise_errors=True,
+        progress=None,
+        file_format=None,
+    ):
         """Exports values to a record file for Modelica simulation
 
         For Annex 60 Library
@@ -1129,7 +1553,24 @@ class Project(object):
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        workers : int
+            Number of worker processes exporting the buildings in parallel,
+            see ibpsa_output.export_ibpsa(). Default is None, exporting all
+            buildings in this process.
+        raise_errors : bool
+            If True, errors of the export are raised. If False, buildings
+            that can't be exported are left out of the project package.
+            Default is True.
+        progress : callable
+            Called after each exported building with the number of finished
+            buildings and the number of all buildings. Default is None.
+        file_format : str
+            Format of the internal gains tables, 'txt' for text files or 'mat'
+            for binary matfiles (-v4). It is set as file_format of the
+            library_attr of the exported buildings. Default is None, keeping
+            the format of each building ('txt' unless changed).
         """
+        import teaser.data.output.ibpsa_output as ibpsa_output
 
         ass_error_1 = (
             "library for IBPSA export has to be 'AixLib', "
@@ -1152,12 +1593,20 @@ class Project(object):
 
         if internal_id is None:
             ibpsa_output.export_ibpsa(
-                buildings=self.buildings, prj=self, path=path, library=library
+                buildings=self.buildings,
+                prj=self,
+                path=path,
+                library=library,
+                workers=workers,
+                raise_errors=raise_errors,
+                progress=progress,
+                file_format=file_format,
             )
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    ibpsa_output.export_ibpsa(buildings=[bldg], prj=self, path=path)
+            for bldg in self.buildings.find_by_internal_id(internal_id):
+                ibpsa_output.export_ibpsa(
+                    buildings=[bldg], prj=self, path=path, file_format=file_format
+                )
         return path
 
     def set_default(self, load_data=None):
@@ -1199,6 +1648,14 @@ class Project(object):
         self._merge_windows_calc = False
         self._used_library_calc = "AixLib"
 
+    @property
+    def buildings(self):
+        return self._buildings
+
+    @buildings.setter
+    def buildings(self, value):
+        self._buildings = BuildingList(value)
+
     @property
     def weather_file_path(self):
         return self._weather_file_path
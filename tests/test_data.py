@@ -647,6 +647,293 @@ class Test_teaser(object):
         )
         prj.retrofit_all_buildings(year_of_retrofit=2015, type_of_retrofit="retrofit")
 
+    def test_calc_all_buildings_workers(self):
+        """test of calc_all_buildings and retrofit_all_buildings with workers"""
+
+        projects = []
+        kept = []
+        for workers in [None, 2]:
+            prj_workers = Project(load_data=True)
+            for year in [1950, 1980, 2010]:
+                prj_workers.add_residential(
+                    method="iwu",
+                    usage="single_family_dwelling",
+                    name="Residential" + str(year),
+                    year_of_construction=year,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+                prj_workers.add_residential(
+                    method="tabula_de",
+                    usage="single_family_house",
+                    name="Tabula" + str(year),
+                    year_of_construction=year,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+            prj_workers.buildings[2].thermal_zones[0].t_outside = None
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                prj_workers.calc_all_buildings(workers=workers)
+            assert "Residential1980" in str(caught[-1].message)
+            assert len(prj_workers.buildings) == 5
+            zone = prj_workers.buildings[0].thermal_zones[0]
+            layer = zone.outer_walls[0].layer[0]
+            kept.append(
+                (zone.use_conditions, layer, layer.material, zone.parent.central_ahu)
+            )
+            for bldg in prj_workers.buildings:
+                bldg.get_outer_wall_area(0.0)
+            prj_workers.retrofit_all_buildings(
+                year_of_retrofit=2015, type_of_retrofit="retrofit", workers=workers
+            )
+            projects.append(prj_workers)
+
+        serial, parallel = projects
+        assert parallel.data.used_statistic == serial.data.used_statistic
+        for bldg, bldg_parallel in zip(serial.buildings, parallel.buildings):
+            assert bldg_parallel.parent is parallel
+            assert bldg_parallel.sum_heat_load == bldg.sum_heat_load
+            zone = bldg_parallel.thermal_zones[0]
+            assert zone.parent is bldg_parallel
+            assert zone.model_attr.r1_ow == bldg.thermal_zones[0].model_attr.r1_ow
+            for wall in zone.outer_walls + zone.windows:
+                assert wall.parent is zone
+                assert all(layer.parent is wall for layer in wall.layer)
+                assert all(layer.material.parent is layer for layer in wall.layer)
+            assert zone.use_conditions.parent is zone
+        # objects kept by the caller stay the objects of the project
+        use_conditions, layer, material, central_ahu = kept[1]
+        zone = parallel.buildings[0].thermal_zones[0]
+        assert zone.use_conditions is use_conditions
+        assert zone.outer_walls[0].layer[0] is layer
+        assert layer.material is material
+        assert material.parent is layer
+        assert parallel.buildings[0].central_ahu is central_ahu
+        # element lists and orientation index belong to the merged zone
+        assert zone.outer_walls.zone is zone
+        assert zone.windows.name == "windows"
+        for bldg in serial.buildings[0], parallel.buildings[0]:
+            wall = bldg.thermal_zones[0].outer_walls[0]
+            orientation = wall.orientation
+            wall.area = 12.5
+        for orientation in orientation, 45.0:
+            assert parallel.buildings[0].get_outer_wall_area(
+                orientation
+            ) == serial.buildings[0].get_outer_wall_area(orientation)
+            for bldg in serial.buildings[0], parallel.buildings[0]:
+                bldg.thermal_zones[0].outer_walls[0].orientation = 45.0
+
+    def test_export_workers(self):
+        """test of the Modelica export with workers"""
+        import filecmp
+        import shutil
+
+        prj_export = Project(load_data=True)
+        prj_export.name = "ExportWorkers"
+        for year in [1950, 1980, 2010]:
+            prj_export.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="Residential" + str(year),
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=219,
+            )
+        export_path = os.path.join(utilities.get_default_path(), "test_export_workers")
+        shutil.rmtree(export_path, ignore_errors=True)
+
+        for library in ["AixLib", "IBPSA"]:
+            prj_export.used_library_calc = library
+            prj_export.calc_all_buildings()
+            export = (
+                prj_export.export_aixlib
+                if library == "AixLib"
+                else prj_export.export_ibpsa
+            )
+            model_attr = prj_export.buildings[0].thermal_zones[0].model_attr
+            paths = []
+            for workers in [None, 2]:
+                reports = []
+                paths.append(
+                    export(
+                        path=os.path.join(export_path, library + str(workers)),
+                        workers=workers,
+                        progress=lambda done, total: reports.append((done, total)),
+                    )
+                )
+                assert reports == [(1, 3), (2, 3), (3, 3)]
+            # the workers do not send the exported buildings back
+            assert prj_export.buildings[0].thermal_zones[0].model_attr is model_attr
+            files = [
+                sorted(
+                    os.path.relpath(os.path.join(root, name), export)
+                    for root, dirs, names in os.walk(export)
+                    for name in names
+                )
+                for export in paths
+            ]
+            assert files[0] == files[1] and len(files[0]) > 20
+            for name in files[0]:
+                assert filecmp.cmp(
+                    os.path.join(paths[0], name),
+                    os.path.join(paths[1], name),
+                    shallow=False,
+                )
+
+        prj_export.buildings[1].library_attr = None
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            path = prj_export.export_ibpsa(
+                path=os.path.join(export_path, "Errors"), workers=2, raise_errors=False
+            )
+        assert "Residential1980" in str(caught[-1].message)
+        with open(os.path.join(path, "package.order")) as order:
+            assert order.read().split() == ["Residential1950", "Residential2010"]
+        try:
+            prj_export.export_ibpsa(path=os.path.join(export_path, "Raise"), workers=2)
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("export error not raised")
+        shutil.rmtree(export_path, ignore_errors=True)
+
+    def test_export_matfile(self):
+        """test of boundary condition tables as matfiles (-v4)"""
+        import struct
+        import numpy as np
+
+        def read_matrix(path):
+            with open(path, "rb") as mat_file:
+                data = mat_file.read()
+            kind, rows, columns, imag, name_length = struct.unpack("<5i", data[:20])
+            assert kind == 0 and imag == 0
+            name = data[20 : 20 + name_length - 1].decode()
+            values = np.frombuffer(data[20 + name_length :], dtype="<f8")
+            return name, values.reshape((columns, rows)).T
+
+        prj.set_default(load_data=True)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="MatfileBuilding",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3,
+            net_leased_area=2000,
+            with_ahu=True,
+        )
+        library_attr = prj.buildings[0].library_attr
+        path = os.path.join(utilities.get_default_path(), "test_export_matfile")
+        library_attr.modelica_set_temp(path=path)
+        library_attr.modelica_gains_boundary(path=path)
+        library_attr.modelica_AHU_boundary(path=path)
+        library_attr.file_format = "mat"
+        assert library_attr.file_set_t_heat == "TsetHeat_MatfileBuilding.mat"
+        library_attr.modelica_set_temp(path=path)
+        library_attr.modelica_gains_boundary(path=path)
+        library_attr.modelica_AHU_boundary(path=path)
+        for table, file_name in [
+            ("Tset", "TsetHeat_MatfileBuilding"),
+            ("Internals", "InternalGains_MatfileBuilding"),
+            ("AHU", "AHU_MatfileBuilding"),
+        ]:
+            name, values = read_matrix(os.path.join(path, file_name + ".mat"))
+            text = np.loadtxt(os.path.join(path, file_name + ".txt"), skiprows=2)
+            assert name == table
+            assert values.shape == text.shape == (8760, text.shape[1])
+            assert np.allclose(values, text)
+
+        export_path = prj.export_aixlib(path=path)
+        with open(
+            os.path.join(export_path, "MatfileBuilding", "MatfileBuilding.mo")
+        ) as model:
+            assert "InternalGains_MatfileBuilding.mat" in model.read()
+
+        # changing the library creates a new library_attr, the export sets
+        # the format again
+        prj.used_library_calc = "IBPSA"
+        prj.calc_all_buildings()
+        assert prj.buildings[0].library_attr.file_format == "txt"
+        export_path = prj.export_ibpsa(path=path, file_format="mat")
+        zone = prj.buildings[0].thermal_zones[0]
+        name, values = read_matrix(
+            os.path.join(
+                export_path,
+                "MatfileBuilding",
+                "MatfileBuilding_Models",
+                "InternalGains_MatfileBuilding" + zone.name + ".mat",
+            )
+        )
+        assert name == "Internals" and values.shape == (8761, 4)
+        assert values[0, 0] == 0 and np.array_equal(values[0, 1:], values[1, 1:])
+
+        prj.used_library_calc = "AixLib"
+        prj.calc_all_buildings()
+        export_path = prj.export_aixlib(path=path, file_format="mat")
+        with open(
+            os.path.join(export_path, "MatfileBuilding", "MatfileBuilding.mo")
+        ) as model:
+            assert "InternalGains_MatfileBuilding.mat" in model.read()
+
+    def test_generate_buildings(self):
+        """test of generate_buildings, no calculation verification"""
+        import pandas as pd
+
+        descriptors = pd.DataFrame(
+            {
+                "method": ["iwu", "tabula_de", "bmvbs"],
+                "usage": ["single_family_dwelling", "single_family_house", "office"],
+                "name": ["Residential", "Tabula", "Office"],
+                "year_of_construction": [1960, 1970, 1980],
+                "number_of_floors": [2, 2, 3],
+                "height_of_floors": [3.2, 3.2, 3.2],
+                "net_leased_area": [219.0, 219.0, 1000.0],
+                "construction_type": [None, None, "light"],
+            }
+        )
+        prj_gen = Project(load_data=True)
+        prj_gen.name = "GenerateBuildings"
+        names = []
+        for bldg in prj_gen.generate_buildings(descriptors, export=True):
+            assert prj_gen.buildings == [bldg]
+            assert bldg.thermal_zones[0].model_attr.area_ow > 0
+            names.append(bldg.name)
+        assert names == ["Residential", "Tabula", "Office"]
+        assert prj_gen.buildings == []
+
+        path = os.path.join(utilities.get_default_path(), prj_gen.name)
+        with open(os.path.join(path, "package.order")) as order:
+            assert order.read().split() == names
+        for name in names:
+            assert os.path.isfile(os.path.join(path, name, name + ".mo"))
+
+        prj_gen.used_library_calc = "IBPSA"
+        generator = prj_gen.generate_buildings(
+            [
+                dict(
+                    method="iwu",
+                    usage="single_family_dwelling",
+                    name="Residential" + str(i),
+                    year_of_construction=1960,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+                for i in range(3)
+            ],
+            export=True,
+            keep=True,
+        )
+        next(generator)
+        generator.close()
+        assert len(prj_gen.buildings) == 1
+        with open(os.path.join(path, "package.order")) as order:
+            assert order.read().split() == ["Residential0"]
+
     def test_export_aixlib(self):
         """test of export_aixlib, no calculation verification"""
 
@@ -1316,6 +1603,78 @@ class Test_teaser(object):
         assert round(r1_ow, 14) == 0.00100751548411
         assert round(c1_ow, 5) == 3648580.59312
 
+    def test_calc_parallel_connection(self):
+        """test of n-ary parallel connection against pairwise VDI 6007"""
+        from teaser.logic.buildingobjects.calculation.aggregation import (
+            calc_parallel_connection,
+        )
+
+        omega = 2 * math.pi / 86400 / 5
+        r1 = [0.004, 0.0012, 0.03, 0.0007]
+        c1 = [2.5e6, 8.1e5, 4.2e4, 1.3e7]
+
+        r1_fold = r1[0]
+        c1_fold = c1[0]
+        for r1_b, c1_b in zip(r1[1:], c1[1:]):
+            r1_a = r1_fold
+            c1_a = c1_fold
+            r1_fold = (
+                r1_a * c1_a ** 2
+                + r1_b * c1_b ** 2
+                + omega ** 2 * r1_a * r1_b * (r1_a + r1_b) * c1_a ** 2 * c1_b ** 2
+            ) / (
+                (c1_a + c1_b) ** 2
+                + omega ** 2 * (r1_a + r1_b) ** 2 * c1_a ** 2 * c1_b ** 2
+            )
+            c1_fold = (
+                (c1_a + c1_b) ** 2
+                + omega ** 2 * (r1_a + r1_b) ** 2 * c1_a ** 2 * c1_b ** 2
+            ) / (
+                c1_a
+                + c1_b
+                + omega ** 2 * (r1_a ** 2 * c1_a + r1_b ** 2 * c1_b) * c1_a * c1_b
+            )
+
+        r1_par, c1_par = calc_parallel_connection(r1, c1, omega)
+        assert math.isclose(r1_par, r1_fold, rel_tol=1e-12)
+        assert math.isclose(c1_par, c1_fold, rel_tol=1e-12)
+
+    def test_sum_elements(self):
+        """test of the single pass sums against sum() per element list"""
+        from teaser.logic.buildingobjects.calculation.aggregation import (
+            add_sums,
+            sum_elements,
+        )
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+
+        windows = sum_elements(therm_zone.windows, ambient=True, windows=True)
+        assert windows["area"] == sum(win.area for win in therm_zone.windows)
+        assert windows["inv_r_outer_rad"] == sum(
+            1 / win.r_outer_rad for win in therm_zone.windows
+        )
+        assert windows["g_value"] == sum(
+            win.g_value * win.area for win in therm_zone.windows
+        )
+
+        sums = add_sums(
+            sum_elements(therm_zone.outer_walls, ambient=True),
+            sum_elements(therm_zone.ground_floors),
+        )
+        assert "solar_absorp" not in sums
+        assert sums["ua_value"] == sum(
+            wall.ua_value for wall in therm_zone.outer_walls
+        ) + sum(ground.ua_value for ground in therm_zone.ground_floors)
+        assert sums["ir_emissivity_inner"] == sum(
+            wall.layer[0].material.ir_emissivity * wall.area
+            for wall in therm_zone.outer_walls
+        ) + sum(
+            ground.layer[0].material.ir_emissivity * ground.area
+            for ground in therm_zone.ground_floors
+        )
+
     def test_sum_building_elements_two(self):
         """test of combine_building_elements"""
         prj.set_default()
@@ -2261,6 +2620,58 @@ class Test_teaser(object):
         therm_zone.inner_walls[0].delete_type_element(data_class=prj.data)
         therm_zone.windows[0].delete_type_element(data_class=prj.data)
 
+    def test_find_type_elements(self):
+        """test of the type element index in DataClass"""
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass(used_statistic="tabula_de")
+        for year in [1859, 1860, 1950, 2010, 2016, 2050]:
+            for construction in ["tabula_standard_1_SFH", "tabula_retrofit_1_SFH"]:
+                linear = [
+                    key
+                    for key, element_in in dat.element_bind.items()
+                    if key != "version"
+                    and key.startswith("OuterWall")
+                    and element_in["construction_type"] == construction
+                    and element_in["building_age_group"][0]
+                    <= year
+                    <= element_in["building_age_group"][1]
+                ]
+                assert (
+                    dat.find_type_elements("OuterWall", year, construction) == linear
+                )
+        assert dat.find_type_elements("OuterWall", 1950, "unknown") == []
+
+        # assigning the binding again rebuilds the index after in place edits
+        key = dat.find_type_elements("OuterWall", 1950, "tabula_standard_1_SFH")[0]
+        dat.element_bind[key]["building_age_group"] = [1700, 1701]
+        dat.element_bind = dat.element_bind
+        assert key in dat.find_type_elements(
+            "OuterWall", 1700, "tabula_standard_1_SFH"
+        )
+        assert key not in dat.find_type_elements(
+            "OuterWall", 1950, "tabula_standard_1_SFH"
+        )
+
+        path = os.path.join(utilities.get_default_path(), "unitTestIndexTB.json")
+        if os.path.exists(path):
+            os.remove(path)
+        dat.path_tb = path
+        dat.load_tb_binding()
+        assert dat.find_type_elements("OuterWall", 1988, "heavy") == []
+
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        wall = prj.buildings[-1].thermal_zones[-1].outer_walls[0]
+        wall.building_age_group = [1980, 1990]
+        wall.construction_type = "heavy"
+        wall.save_type_element(data_class=dat)
+        assert dat.find_type_elements("OuterWall", 1988, "heavy") == [
+            "OuterWall_[1980, 1990]_heavy"
+        ]
+        wall.delete_type_element(data_class=dat)
+        assert dat.find_type_elements("OuterWall", 1988, "heavy") == []
+
     # methods in Wall
 
     def test_calc_equivalent_res_wall(self):
@@ -2280,6 +2691,73 @@ class Test_teaser(object):
         assert round(therm_zone.outer_walls[0].r3, 12) == 0.137027879186
         assert round(therm_zone.outer_walls[0].c1_korr, 6) == 111237.213205
 
+    def test_calc_equivalent_res_batch(self):
+        """test of calc_equivalent_res_batch against single walls"""
+        from teaser.logic.buildingobjects.buildingphysics.wall import (
+            calc_equivalent_res_batch,
+        )
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        walls = (
+            therm_zone.outer_walls
+            + therm_zone.rooftops
+            + therm_zone.ground_floors
+            + therm_zone.inner_walls
+        )
+
+        single = []
+        for wall in walls:
+            wall.calc_equivalent_res()
+            single.append((wall.r1, wall.r2, wall.r3, wall.c1, wall.c2))
+
+        calc_equivalent_res_batch(walls)
+
+        for wall, values in zip(walls, single):
+            batch = (wall.r1, wall.r2, wall.r3, wall.c1, wall.c2)
+            for value_single, value_batch in zip(values, batch):
+                assert abs(value_single - value_batch) <= 1e-12 * abs(
+                    value_single)
+
+    def test_equivalent_res_cache(self):
+        """test of the equivalent resistance cache"""
+        from teaser.logic.buildingobjects.buildingphysics import wall
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        out_wall = therm_zone.outer_walls[0]
+
+        wall.clear_equivalent_res_cache()
+        assert wall.equivalent_res_cache_info().currsize == 0
+
+        out_wall.calc_equivalent_res()
+        r1 = out_wall.r1
+        c1 = out_wall.c1
+        assert wall.equivalent_res_cache_info().misses == 1
+        assert wall.equivalent_res_cache_info().hits == 0
+
+        out_wall.area = out_wall.area * 2
+        out_wall.calc_equivalent_res()
+        assert wall.equivalent_res_cache_info().hits == 1
+        assert round(out_wall.r1 * 2, 12) == round(r1, 12)
+        assert round(out_wall.c1 / 2, 6) == round(c1, 6)
+
+        out_wall.calc_equivalent_res(t_bt=5)
+        assert wall.equivalent_res_cache_info().misses == 2
+
+        out_wall.layer[0].thickness = out_wall.layer[0].thickness + 0.01
+        out_wall.calc_equivalent_res()
+        assert wall.equivalent_res_cache_info().misses == 3
+
+        out_wall.layer[0].thickness = out_wall.layer[0].thickness - 0.01
+        out_wall.area = out_wall.area / 2
+        out_wall.calc_equivalent_res()
+
+        wall.clear_equivalent_res_cache()
+        assert wall.equivalent_res_cache_info() == (0, 0, 4096, 0)
+
     def test_insulate_wall(self):
         """test of insulate_wall"""
         therm_zone = prj.buildings[-1].thermal_zones[-1]
@@ -2347,6 +2825,125 @@ class Test_teaser(object):
 
         mat.save_material_template(data_class=dat)
 
+    def test_binding_cache(self):
+        """test of lazy loading and the process-wide binding cache"""
+        import json
+        from teaser.data.dataclass import DataClass
+
+        dat_tabula = DataClass(used_statistic="tabula_de")
+        assert dat_tabula._tb_pending is True
+        dat_iwu = DataClass(used_statistic="iwu")
+        dat_tabula_2 = DataClass(used_statistic="tabula_de")
+        assert dat_tabula.element_bind == dat_tabula_2.element_bind
+        assert dat_tabula.element_bind is not dat_tabula_2.element_bind
+        assert dat_tabula.element_bind != dat_iwu.element_bind
+        assert dat_tabula.material_bind == dat_iwu.material_bind
+
+        prj_a = Project(load_data=True)
+        prj_b = Project(load_data=True)
+        assert prj_a.data.element_bind is not prj_b.data.element_bind
+        prj_a.data.element_bind["XX"] = {"construction_type": "heavy"}
+        mat_id = prj_a.data.find_material_id("EPS_040_15")
+        prj_a.data.material_bind[mat_id]["density"] = -1
+        assert "XX" not in prj_b.data.element_bind
+        assert "XX" not in DataClass().element_bind
+        assert prj_b.data.material_bind[mat_id]["density"] != -1
+
+        path = os.path.join(utilities.get_default_path(), "unitTestCacheTB.json")
+        with open(path, "w") as file:
+            file.write(json.dumps({"version": "0.7"}))
+        dat_iwu.path_tb = path
+        dat_iwu.load_tb_binding()
+        assert list(dat_iwu.element_bind.keys()) == ["version"]
+        with open(path, "w") as file:
+            file.write(json.dumps({"version": "0.7.7"}))
+        dat_tabula.path_tb = path
+        dat_tabula.load_tb_binding()
+        assert dat_tabula.element_bind["version"] == "0.7.7"
+
+    def test_compiled_binding(self):
+        """test of compiled binary bindings"""
+        import json
+        import pickle
+        import time
+        from teaser.data import dataclass
+
+        path = os.path.join(utilities.get_default_path(), "unitTestCompiled.json")
+        with open(path, "w") as file:
+            file.write(json.dumps({"version": "0.7", "compiled": [1, 2]}))
+        compiled_path = dataclass.compile_json_binding(path)
+        assert compiled_path == path + dataclass.COMPILED_SUFFIX
+
+        # same modification time and size: the compiled file is used
+        dataclass.clear_binding_cache()
+        mtime_ns = os.stat(path).st_mtime_ns
+        with open(path, "w") as file:
+            file.write(json.dumps({"version": "0.7", "compiled": [3, 4]}))
+        os.utime(path, ns=(time.time_ns(), mtime_ns))
+        assert dataclass.load_json_binding(path)["compiled"] == [1, 2]
+
+        # any other modification time, even older, or size: the JSON is parsed
+        dataclass.clear_binding_cache()
+        os.utime(path, ns=(time.time_ns(), mtime_ns - 1))
+        assert dataclass.load_json_binding(path)["compiled"] == [3, 4]
+        dataclass.clear_binding_cache()
+        with open(path, "w") as file:
+            file.write(json.dumps({"version": "0.7", "compiled": [30, 4]}))
+        os.utime(path, ns=(time.time_ns(), mtime_ns))
+        assert dataclass.load_json_binding(path)["compiled"] == [30, 4]
+
+        # unusable compiled files are ignored
+        for content in (b"", b"no pickle", pickle.dumps({"compiled": [1, 2]})):
+            with open(compiled_path, "wb") as file:
+                file.write(content)
+            dataclass.clear_binding_cache()
+            assert dataclass.load_json_binding(path)["compiled"] == [30, 4]
+        os.remove(compiled_path)
+
+    def test_material_index(self):
+        """test of material lookup by name and shared material records"""
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass()
+        mat_id = dat.find_material_id("EPS_040_15")
+        assert dat.material_bind[mat_id]["name"] == "EPS_040_15"
+        assert dat.find_material_id("NoMaterial") is None
+
+        assert dat.share_material_records is True
+        dat.share_material_records = False
+        mat = Material(parent=None)
+        mat.load_material_template(mat_name="EPS_040_15", data_class=dat)
+        dat.share_material_records = True
+        mat_shared = Material(parent=None)
+        mat_shared.load_material_template(mat_name="EPS_040_15", data_class=dat)
+        assert dat.get_material_record(mat_id) is dat.get_material_record(mat_id)
+        for attr in [
+            "material_id",
+            "name",
+            "density",
+            "thermal_conduc",
+            "heat_capac",
+            "solar_absorp",
+            "thickness_default",
+            "thickness_list",
+        ]:
+            assert getattr(mat, attr) == getattr(mat_shared, attr)
+        mat_other = Material(parent=None)
+        mat_other.load_material_template(mat_name="EPS_040_15", data_class=dat)
+        mat_shared.thickness_list.append(1.0)
+        assert mat_other.thickness_list == mat.thickness_list
+        assert isinstance(dat.get_material_record(mat_id).thickness_list, tuple)
+
+        # in place edits of material_bind are picked up
+        dat.material_bind[mat_id]["name"] = "EPS_renamed"
+        assert dat.find_material_id("EPS_040_15") is None
+        assert dat.find_material_id("EPS_renamed") == mat_id
+        dat.material_bind["new_id"] = dict(dat.material_bind[mat_id], name="EPS_new")
+        assert dat.find_material_id("EPS_new") == "new_id"
+        dat.material_bind[mat_id]["density"] = 1.0
+        assert dat.get_material_record(mat_id).density == 1.0
+
     def test_properties_project(self):
         """Tests properties of project class"""
         prj.number_of_elements_calc
@@ -3131,6 +3728,604 @@ class Test_teaser(object):
 
         assert prj_test.buildings[-1].central_ahu.profile_v_flow == v_flow_week
 
+    def test_schedules(self):
+        """Test schedules expanded from the profiles on a shared index"""
+        import pickle
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.buildingsystems.buildingahu import (
+            BuildingAHU,
+        )
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+
+        use_cond = UseConditions()
+        use_cond.heating_profile = [290.15 + i % 7 for i in range(168)]
+        use_cond.lighting_profile = 0.5
+        schedules = use_cond.schedules
+
+        assert schedules.index is utilities.get_year_index()
+        assert schedules.index[0] == "01-01 00:00:00"
+        assert schedules.index[-1] == "12-31 23:00:00"
+        assert list(schedules.columns) == [
+            "heating_profile",
+            "cooling_profile",
+            "persons_profile",
+            "lighting_profile",
+            "machines_profile",
+        ]
+        assert schedules["heating_profile"].iloc[168 * 52 + 3] == 293.15
+        assert (schedules["lighting_profile"] == 0.5).all()
+        assert schedules["persons_profile"].iloc[24 * 100 + 8] == 0.4
+        assert use_cond.profile("lighting_profile").year_values[0] == 0.5
+
+        # changes of the DataFrame are written back into the profiles
+        assert use_cond.schedules is schedules
+        schedules.loc[schedules.index[5], "heating_profile"] = 1.0
+        assert use_cond.heating_profile[5] == 1.0
+        assert use_cond.heating_profile[5 + 168] == 290.15 + 5
+        schedules["lighting_profile"] = [0.0, 1.0] * 4380
+        assert use_cond.lighting_profile == [0.0, 1.0] * 4380
+        assert use_cond.profile("lighting_profile").pattern == (0.0, 1.0)
+        use_cond.persons_profile = 0.25
+        assert (schedules["persons_profile"] == 0.25).all()
+
+        copied = schedules.copy()
+        copied["machines_profile"] = 0.75
+        use_cond.schedules = copied[["machines_profile"]]
+        assert use_cond.profile("machines_profile").pattern == (0.75,)
+        assert (use_cond.schedules["machines_profile"] == 0.75).all()
+        for wrong in (copied.iloc[:24], copied.assign(unknown=0.0)):
+            try:
+                use_cond.schedules = wrong
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("wrong schedules not rejected")
+        try:
+            use_cond.profile("schedules")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown profile not rejected")
+
+        copy_cond = pickle.loads(pickle.dumps(use_cond))
+        assert "_schedules" not in copy_cond.__dict__
+        assert copy_cond.heating_profile == use_cond.heating_profile
+
+        ahu = BuildingAHU(Building())
+        ahu.v_flow_profile = [0, 1]
+        assert ahu.schedules.index is utilities.get_year_index()
+        assert ahu.schedules["v_flow_profile"].tolist() == [0, 1] * 4380
+        ahu.schedules["v_flow_profile"] = 1.0
+        assert ahu.profile("v_flow_profile").pattern == (1.0,)
+
+    def test_profile(self):
+        """Test pattern detection and interning of profiles"""
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+        from teaser.logic.profile import get_profile
+
+        day = [0.0] * 7 + [1.0] * 12 + [0.0] * 5
+        profile = get_profile(day * 365)
+        assert profile.pattern == tuple(day)
+        assert profile.length == 8760
+        assert profile.values == day * 365
+        assert profile is get_profile(day * 365)
+        assert profile is not get_profile(day)
+        assert get_profile([0, 1] * 12).values == [0, 1] * 12
+        assert get_profile([0, 1.0] * 12).pattern == (0, 1.0)
+        assert get_profile([0.0, 1.0] * 12) is not get_profile([0, 1] * 12)
+        assert get_profile([1.0, 2.0, 3.0]).pattern == (1.0, 2.0, 3.0)
+        assert not profile.year_values.flags.writeable
+
+        use_cond_a = UseConditions()
+        use_cond_b = UseConditions()
+        use_cond_a.persons_profile = list(day)
+        use_cond_b.persons_profile = list(day)
+        assert use_cond_a._persons_profile is use_cond_b._persons_profile
+        assert use_cond_a.persons_profile == day
+        for change in (
+            lambda values: values.__setitem__(0, 1.0),
+            lambda values: values.append(1.0),
+            lambda values: values.sort(),
+        ):
+            try:
+                change(use_cond_a.persons_profile)
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("profile changed in place")
+        assert use_cond_a.persons_profile + [1.0] == day + [1.0]
+        use_cond_a.persons_profile += [1.0]
+        assert use_cond_a.persons_profile == day + [1.0]
+        use_cond_a.persons_profile = use_cond_b.persons_profile
+        assert use_cond_a._persons_profile is use_cond_b._persons_profile
+        use_cond_a.heating_profile = 294.15
+        assert use_cond_a.heating_profile == [294.15]
+
+    def test_bulk_update(self):
+        """Test deferred updates of outer_area, window_area and U*A values"""
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+        from teaser.logic.buildingobjects.buildingphysics.window import Window
+        from teaser.logic.buildingobjects.buildingphysics.layer import Layer
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        bldg = Building()
+        bldg.net_leased_area = 100.0
+        tz = ThermalZone(bldg)
+        tz.area = 100.0
+        wall = OuterWall(tz)
+        wall.area = 10.0
+        wall.inner_convection = 2.7
+        wall.inner_radiation = 5.0
+        wall.outer_convection = 20.0
+        wall.outer_radiation = 5.0
+        layer = Layer(wall)
+        material = Material(layer)
+        material.thermal_conduc = 1.0
+        layer.thickness = 0.2
+        win = Window(tz)
+        ua_value = wall.ua_value
+
+        with bldg.bulk_update():
+            wall.orientation = 90.0
+            with bldg.bulk_update():
+                win.area = 2.0
+                win.orientation = 90.0
+            layer.thickness = 0.4
+            wall.area = 20.0
+            assert bldg.outer_area == {}
+            assert bldg.window_area == {}
+            assert wall.ua_value == ua_value
+        assert bldg.outer_area == {90.0: 20.0}
+        assert bldg.window_area == {90.0: 2.0}
+        ua_value = wall.ua_value
+        wall.calc_ua_value()
+        assert wall.ua_value == ua_value
+
+        layer.thickness = 0.2
+        assert wall.ua_value > ua_value
+        bldg.set_outer_wall_area(30.0, 90.0)
+        assert wall.area == 30.0 * tz.area / bldg.net_leased_area
+        assert bldg.outer_area == {90.0: wall.area}
+
+        # the error of the block is raised, not the one of the updates
+        try:
+            with bldg.bulk_update():
+                wall.area = 25.0
+                material.thermal_conduc = 0.0
+                raise KeyError("error of the block")
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("error of the block not raised")
+        assert bldg.outer_area == {90.0: 25.0}
+        assert bldg._bulk_update_depth == 0
+        assert not bldg._deferred_elements
+        material.thermal_conduc = 1.0
+        ua_value = wall.ua_value
+        wall.calc_ua_value()
+        assert wall.ua_value == ua_value
+
+    def test_orientation_index(self):
+        """Test the orientation index of thermal zones"""
+        import pickle
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+        from teaser.logic.buildingobjects.buildingphysics.groundfloor import (
+            GroundFloor,
+        )
+        from teaser.logic.buildingobjects.buildingphysics.window import Window
+
+        bldg = Building()
+        tz = ThermalZone(bldg)
+        walls = []
+        for orientation in (0.0, 90.0, 0.0, 180.0):
+            wall = OuterWall(tz)
+            wall.orientation = orientation
+            wall.area = 10.0
+            walls.append(wall)
+        assert tz.get_elements("outer_walls", 0.0) == [walls[0], walls[2]]
+
+        ground = GroundFloor(tz)
+        ground.area = 5.0
+        assert tz.get_elements("ground_floors", -2.0) == [ground]
+        win = Window(tz)
+        win.orientation = 90.0
+        win.area = 2.0
+
+        bldg.rotate_building(90.0)
+        assert tz.get_elements("outer_walls", 0.0) == []
+        assert tz.get_elements("outer_walls", 90.0) == [walls[0], walls[2]]
+        assert tz.get_elements("windows", 180.0) == [win]
+        assert bldg.get_outer_wall_area(90.0) == 20.0
+        assert bldg.get_window_area(180.0) == 2.0
+
+        tz.outer_walls.remove(walls[0])
+        assert tz.get_elements("outer_walls", 90.0) == [walls[2]]
+        tz.outer_walls.insert(0, walls[0])
+        assert tz.get_elements("outer_walls", 90.0) == [walls[0], walls[2]]
+
+        zone = pickle.loads(pickle.dumps(tz))
+        assert zone.outer_walls.zone is zone
+        zone.outer_walls[0].orientation = 270.0
+        assert len(zone.get_elements("outer_walls", 270.0)) == 2
+        assert tz.get_elements("outer_walls", 270.0) == [walls[3]]
+
+    def test_group_facades(self):
+        """Test grouping of outer elements by orientation and tilt"""
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+        from teaser.logic.buildingobjects.buildingphysics.rooftop import Rooftop
+        from teaser.logic.buildingobjects.buildingphysics.window import Window
+
+        tz = ThermalZone(Building())
+        for orientation, tilt in ((0.0, 90.0), (90.0, 90.0), (0.0, 90.0), (0.0, 30.0)):
+            wall = OuterWall(tz)
+            wall.orientation = orientation
+            wall.tilt = tilt
+            wall.area = 10.0
+        roof = Rooftop(tz)
+        roof.tilt = 0.0
+        for area, g_total in ((1.0, 1.0), (3.0, 0.2)):
+            win = Window(tz)
+            win.orientation = 0.0
+            win.tilt = 90.0
+            win.area = area
+            win.shading_g_total = g_total
+            win.shading_max_irr = 100.0
+
+        facades = tz.group_facades("outer_walls", "rooftops", "windows")
+        assert len(facades) == 4
+        for facade in facades:
+            assert facade.get("outer_walls") == tz.find_walls(
+                facade.orientation, facade.tilt
+            )
+            assert facade.get("rooftops") == tz.find_rts(facade.orientation, facade.tilt)
+            assert facade.get("windows") == tz.find_wins(facade.orientation, facade.tilt)
+            if (facade.orientation, facade.tilt) == (0.0, 90.0):
+                assert len(facade.get("outer_walls", "windows")) == 4
+                g_total, max_irr = facade.window_shading()
+                assert round(g_total, 10) == 0.4
+                assert round(max_irr, 10) == 100.0
+
+    def test_read_mos(self):
+        """Test reading of Modelica weather files"""
+        import numpy as np
+        import shutil
+        from teaser.logic.simulation import weather as weather_data
+
+        sim_prj = Project(load_data=True)
+        weather = weather_data.read_mos(sim_prj.weather_file_path, cache=False)
+        assert weather.table.shape == (8760, 30)
+        assert weather.latitude == 49.52
+        assert weather.longitude == 8.55
+        assert weather.time_zone == 1.0
+        assert weather.time_step == 3600.0
+        assert weather.column("temp_dry_bulb")[0] == 6.5
+
+        cache_dir = os.path.join(utilities.get_default_path(), "test_weather_cache")
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        for _ in range(2):
+            cached = weather_data.read_mos(
+                sim_prj.weather_file_path, cache_dir=cache_dir
+            )
+            assert isinstance(cached.table, np.memmap)
+            assert not cached.table.flags.writeable
+            assert np.array_equal(cached.table, weather.table)
+            assert cached.latitude == weather.latitude
+            assert cached.column("temp_dry_bulb").flags.c_contiguous
+        assert sorted(os.listdir(cache_dir)) == [
+            weather_data.file_hash(sim_prj.weather_file_path) + "_v1" + suffix
+            for suffix in (".json", ".npy")
+        ]
+
+        # WeatherData kept in memory is bounded and can be released
+        weather_data.clear_weather_cache()
+        cached = weather_data.read_mos(sim_prj.weather_file_path, cache_dir=cache_dir)
+        assert (
+            weather_data.read_mos(sim_prj.weather_file_path, cache_dir=cache_dir)
+            is cached
+        )
+        assert weather_data.weather_cache_info()[:2] == (1, 1)
+        cache_size = weather_data.WEATHER_CACHE_SIZE
+        weather_data.WEATHER_CACHE_SIZE = 1
+        try:
+            weather_data.read_mos(
+                sim_prj.weather_file_path, cache_dir=cache_dir + "_other"
+            )
+            assert weather_data.weather_cache_info().currsize == 1
+            assert (
+                weather_data.read_mos(sim_prj.weather_file_path, cache_dir=cache_dir)
+                is not cached
+            )
+        finally:
+            weather_data.WEATHER_CACHE_SIZE = cache_size
+            shutil.rmtree(cache_dir + "_other", ignore_errors=True)
+        weather_data.clear_weather_cache()
+        assert weather_data.weather_cache_info() == (0, 0, cache_size, 0)
+
+    def test_simulate_vdi6007(self):
+        """Test of the simulation of thermal zones with VDI 6007 models"""
+        import numpy as np
+        from teaser.logic.simulation import vdi6007
+        from teaser.logic.simulation.weather import WeatherData
+        from teaser.logic.simulation.weather import read_mos
+
+        sim_prj = Project(load_data=True)
+        zones = []
+        for number_of_elements in (1, 2, 3, 4):
+            bldg = sim_prj.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="ResidentialBuilding",
+                year_of_construction=1970,
+                number_of_floors=2,
+                height_of_floors=3,
+                net_leased_area=150,
+            )
+            bldg.calc_building_parameter(
+                number_of_elements=number_of_elements, used_library="AixLib"
+            )
+            zones.append(bldg.thermal_zones[0])
+
+        result = vdi6007.simulate(zones, sim_prj.weather_file_path)
+        assert result.t_air.shape == (4, 8760)
+        assert (result.heating >= 0).all()
+        assert (result.cooling == 0).all()
+        assert (result.t_air >= 294.15 - 1e-6).all()
+        assert (result.t_air < 313.15).all()
+        for demand in result.heating_demand:
+            assert 150 * 100 < demand < 150 * 300
+
+        # models discretised once, each zone twice, demand only
+        models = vdi6007.ZoneModels(zones + zones)
+        weather = read_mos(sim_prj.weather_file_path)
+        batch = models.simulate(weather, hourly=False)
+        assert batch.t_air is None
+        assert np.allclose(batch.heating_demand[:4], result.heating_demand)
+        assert np.allclose(batch.heating_demand[4:], result.heating_demand)
+        assert np.allclose(batch.max_heating[:4], result.heating.max(axis=1))
+        assert np.allclose(result.heating_demand, result.heating.sum(axis=1) / 1000)
+
+        # steady state without gains, sky at outdoor temperature
+        for zone in zones:
+            zone.use_conditions.persons = 0
+            zone.use_conditions.machines = 0
+            zone.use_conditions.lighting_power = 0
+            zone.use_conditions.heating_profile = [293.15]
+            zone.t_ground = 273.15
+        table = np.zeros((1000, 30))
+        table[:, 0] = np.arange(1000) * 3600.0
+        table[:, 7] = vdi6007.STEFAN_BOLTZMANN * 273.15**4
+        result = vdi6007.simulate(zones, WeatherData(table), irradiance=None)
+        for zone, heating in zip(zones, result.heating[:, -1]):
+            attr = zone.model_attr
+            ua_value = (
+                sum(
+                    getattr(attr, "ua_value_" + element, None) or 0
+                    for element in ("ow", "win", "gf", "rt")
+                )
+                + zone.volume
+                * zone.density_air
+                * zone.heat_capac_air
+                * zone.use_conditions.infiltration_rate
+                / 3600
+            )
+            assert 0.7 * ua_value * 20 < heating <= ua_value * 20
+
+        # hourly profiles with a time step of 15 minutes
+        day = [288.15] * 7 + [294.15] * 12 + [288.15] * 5
+        for zone in zones:
+            zone.use_conditions.heating_profile = day
+        table = np.zeros((96 * 3, 30))
+        table[:, 0] = (np.arange(96 * 3) + 1) * 900.0
+        table[:, 7] = vdi6007.STEFAN_BOLTZMANN * 273.15**4
+        result = vdi6007.simulate(zones, WeatherData(table), irradiance=None)
+        set_temperature = np.array(day * 3)[np.arange(96 * 3) // 4]
+        assert (result.t_air >= set_temperature - 1e-6).all()
+        assert np.allclose(result.t_air[:, 96 + 28 : 96 + 76], 294.15)
+
+    def test_solar_irradiance(self):
+        """Test of the irradiance on tilted surfaces"""
+        import numpy as np
+        from teaser.logic.simulation import solar
+        from teaser.logic.simulation.weather import read_mos
+
+        weather = read_mos(Project(load_data=True).weather_file_path)
+        surfaces = [(-1, 0.0), (0.0, 90.0), (90.0, 90.0), (180.0, 90.0), (180.0, 30.0)]
+        for sky in ("isotropic", "perez"):
+            irradiance = solar.calc_irradiance(weather, surfaces, sky=sky)
+            assert irradiance.shape == (5, 8760)
+            assert (irradiance >= 0).all()
+            annual = irradiance.sum(axis=1) / 1000
+            global_hor = weather.column("rad_global_hor").sum() / 1000
+            assert abs(annual[0] / global_hor - 1) < 0.01
+            assert annual[1] < annual[2] < annual[3] < annual[4]
+
+        weather.irradiance_cache.clear()
+        cached = solar.get_irradiance(weather, surfaces[1:3])
+        assert np.array_equal(cached, irradiance[1:3])
+        assert len(weather.irradiance_cache) == 2
+        assert read_mos(Project(load_data=True).weather_file_path) is weather
+        solar.get_irradiance(weather, surfaces)
+        assert len(weather.irradiance_cache) == 5
+
+        cache_size = solar.IRRADIANCE_CACHE_SIZE
+        solar.IRRADIANCE_CACHE_SIZE = 2
+        try:
+            bounded = solar.get_irradiance(weather, surfaces)
+            assert list(weather.irradiance_cache) == [
+                ("perez", 0.2, 180.0, 90.0),
+                ("perez", 0.2, 180.0, 30.0),
+            ]
+            assert np.array_equal(bounded, solar.get_irradiance(weather, surfaces))
+            assert len(weather.irradiance_cache) == 2
+        finally:
+            solar.IRRADIANCE_CACHE_SIZE = cache_size
+
+    def test_calc_annual_demand(self):
+        """Test of the annual demand of all project buildings"""
+        import numpy as np
+        from teaser.logic.simulation import vdi6007
+
+        sim_prj = Project(load_data=True)
+        sim_prj.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3,
+            net_leased_area=150,
+        )
+        sim_prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="OfficeBuilding",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3,
+            net_leased_area=2000,
+        )
+        sim_prj.calc_all_buildings()
+        office = sim_prj.buildings[1]
+        for zone in office.thermal_zones:
+            zone.use_conditions.with_cooling = True
+
+        demand = sim_prj.calc_annual_demand()
+        assert list(demand.name) == ["ResidentialBuilding", "OfficeBuilding"]
+        assert (demand.heating_demand > 0).all()
+        assert demand.cooling_demand[0] == 0
+        assert demand.cooling_demand[1] > 0
+
+        result = vdi6007.simulate(office.thermal_zones, sim_prj.weather_file_path)
+        assert np.isclose(demand.heating_demand[1], result.heating_demand.sum())
+        assert np.isclose(demand.cooling_demand[1], result.cooling_demand.sum())
+        assert np.isclose(demand.max_heating_load[1], result.heating.sum(axis=0).max())
+        assert np.isclose(demand.max_cooling_load[1], result.cooling.sum(axis=0).max())
+
+    def test_building_registry(self):
+        """Test of the indexed list of project buildings"""
+        import copy
+        import pickle
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.project import BuildingList
+
+        reg_prj = Project(load_data=False)
+        bldgs = [Building(parent=reg_prj, name="Bldg" + str(i)) for i in range(5)]
+        assert isinstance(reg_prj.buildings, BuildingList)
+        assert list(reg_prj.buildings) == bldgs
+        assert all(bldg in reg_prj.buildings for bldg in bldgs)
+        assert Building(name="Other") not in reg_prj.buildings
+
+        bldgs[1].parent = reg_prj
+        assert len(reg_prj.buildings) == 5
+        assert reg_prj.buildings.find_by_name("Bldg2") == [bldgs[2]]
+        assert reg_prj.buildings.find_by_internal_id(bldgs[3].internal_id) == [
+            bldgs[3]
+        ]
+        bldgs[2].name = "Renamed"
+        bldgs[3].internal_id = 3.0
+        assert reg_prj.buildings.find_by_name("Bldg2") == []
+        assert reg_prj.buildings.find_by_name("Renamed") == [bldgs[2]]
+        assert reg_prj.buildings.find_by_internal_id(3.0) == [bldgs[3]]
+
+        reg_prj.buildings.remove_buildings([bldgs[0], bldgs[3]])
+        assert list(reg_prj.buildings) == [bldgs[1], bldgs[2], bldgs[4]]
+        assert bldgs[0] not in reg_prj.buildings
+        assert reg_prj.buildings.find_by_internal_id(3.0) == []
+        reg_prj.buildings.remove(bldgs[2])
+        del reg_prj.buildings[0]
+        assert bldgs[1] not in reg_prj.buildings
+        assert reg_prj.buildings.pop() is bldgs[4]
+        assert reg_prj.buildings.find_by_name("Bldg4") == []
+
+        reg_prj.buildings = bldgs[:2]
+        assert isinstance(reg_prj.buildings, BuildingList)
+        assert bldgs[1] in reg_prj.buildings
+        reg_prj.buildings += [bldgs[2]]
+        assert bldgs[2] in reg_prj.buildings
+        assert reg_prj.buildings.find_by_name("Renamed") == [bldgs[2]]
+
+        for loaded in (pickle.loads(pickle.dumps(reg_prj)), copy.deepcopy(reg_prj)):
+            assert isinstance(loaded.buildings, BuildingList)
+            assert [bldg.name for bldg in loaded.buildings] == [
+                "Bldg0",
+                "Bldg1",
+                "Renamed",
+            ]
+            assert loaded.buildings[0] in loaded.buildings
+            assert bldgs[0] not in loaded.buildings
+            assert loaded.buildings[0].parent is loaded
+
+    def test_lazy_imports(self):
+        """Test of the lazy imports of teaser.project
+
+        Archetypes, exporters, pandas, numpy and mako are imported on first
+        use, importing teaser.project in a new interpreter must not load
+        them.
+        """
+        import subprocess
+        import sys
+
+        modules = (
+            "pandas",
+            "numpy",
+            "mako",
+            "teaser.data.output.aixlib_output",
+            "teaser.data.input.teaserjson_input",
+            "teaser.logic.archetypebuildings.bmvbs.office",
+            "teaser.logic.archetypebuildings.urbanrenet.est1a",
+            "teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse",
+        )
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, teaser.project\n"
+                "print(' '.join(m for m in %r if m in sys.modules))" % (modules,),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert output.stdout.split() == []
+
+        from teaser.logic.archetypebuildings import registry
+        from teaser.logic.archetypebuildings.urbanrenet.est4b import EST4b
+        from teaser.logic.buildingobjects.building import Building
+
+        assert registry.get_archetype("urbanrenet", "est4b") is EST4b
+        for method, usage in registry.ARCHETYPES:
+            assert issubclass(registry.get_archetype(method, usage), Building)
+
+    def test_template_cache(self):
+        """Test of the shared cache of compiled Modelica templates"""
+        import shutil
+        import teaser.data.output.aixlib_output as aixlib_output
+
+        template = aixlib_output.get_template("AixLib/AixLib_Multizone")
+        assert aixlib_output.get_template("AixLib/AixLib_Multizone") is template
+
+        module_directory = os.path.join(
+            utilities.get_default_path(), "test_template_cache"
+        )
+        shutil.rmtree(module_directory, ignore_errors=True)
+        try:
+            aixlib_output.set_template_cache(module_directory)
+            assert aixlib_output.get_template("AixLib/AixLib_Multizone") is not template
+            package = aixlib_output.get_template("package")
+            assert os.path.isfile(os.path.join(module_directory, "package.py"))
+            assert "package Test" in package.render_unicode(
+                name="Test", within=None, uses=None
+            )
+        finally:
+            aixlib_output.set_template_cache(None)
+            shutil.rmtree(module_directory, ignore_errors=True)
+
     def test_export_bldg_threshold(self):
 
         prj.set_default(load_data=True)